@@ -0,0 +1,59 @@
+"""add unique (student_id, course_id) constraint to enrollment
+
+Revision ID: 20260115_enrollment_unique
+Revises: 478da7ba5ab5
+Create Date: 2026-01-15 00:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy import inspect
+
+# revision identifiers, used by Alembic.
+revision: str = "20260115_enrollment_unique"
+down_revision: Union[str, None] = "478da7ba5ab5"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+CONSTRAINT_NAME = "uq_enrollment_student_course"
+
+
+def _constraint_exists(bind) -> bool:
+    inspector = inspect(bind)
+    constraints = {constraint["name"] for constraint in inspector.get_unique_constraints("enrollment")}
+    return CONSTRAINT_NAME in constraints
+
+
+def upgrade() -> None:
+    bind = op.get_bind()
+    if _constraint_exists(bind):
+        return
+
+    duplicates = bind.execute(
+        sa.text(
+            "SELECT student_id, course_id FROM enrollment "
+            "GROUP BY student_id, course_id HAVING COUNT(*) > 1 LIMIT 5"
+        )
+    ).fetchall()
+    if duplicates:
+        pairs = ", ".join(f"({row[0]}, {row[1]})" for row in duplicates)
+        raise RuntimeError(
+            "No se puede crear uq_enrollment_student_course: existen matrículas duplicadas "
+            f"(student_id, course_id): {pairs}. Depúralas antes de migrar."
+        )
+
+    # batch_alter_table recrea la tabla en SQLite, que no admite ADD CONSTRAINT
+    with op.batch_alter_table("enrollment") as batch_op:
+        batch_op.create_unique_constraint(CONSTRAINT_NAME, ["student_id", "course_id"])
+
+
+def downgrade() -> None:
+    bind = op.get_bind()
+    if not _constraint_exists(bind):
+        return
+
+    with op.batch_alter_table("enrollment") as batch_op:
+        batch_op.drop_constraint(CONSTRAINT_NAME, type_="unique")
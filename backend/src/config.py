@@ -29,6 +29,18 @@ def _resolve_access_token_expiry() -> Optional[int]:
     return minutes if minutes > 0 else None
 
 
+def _resolve_password_hash_rounds() -> Optional[int]:
+    raw = os.getenv("PASSWORD_HASH_ROUNDS")
+    if raw is None or not raw.strip():
+        return None
+    try:
+        rounds = int(raw)
+    except ValueError:
+        return None
+    # bcrypt solo admite costos entre 4 y 31
+    return rounds if 4 <= rounds <= 31 else None
+
+
 def _env_bool(name: str, default: bool) -> bool:
     raw = os.getenv(name)
     if raw is None:
@@ -75,6 +87,8 @@ class Settings(BaseModel):
     secret_key: str = os.getenv("SECRET_KEY", "dev-secret-key-change")
     access_token_expire_minutes: Optional[int] = _resolve_access_token_expiry()
     algorithm: str = os.getenv("ALGORITHM", "HS256")
+    password_hash_rounds: Optional[int] = _resolve_password_hash_rounds()
+    testing: bool = _env_bool("TESTING", False)
     database_url: str = os.getenv("DATABASE_URL", "sqlite:///./data.db")
     debug: bool = os.getenv("DEBUG", "true").lower() == "true"
     environment: str = _normalize_env(os.getenv("APP_ENV") or os.getenv("ENVIRONMENT"), "dev")
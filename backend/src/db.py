@@ -1,13 +1,23 @@
 from typing import Generator
 
-from sqlalchemy import inspect, text
+from sqlalchemy import event, inspect, text
 from sqlalchemy.exc import SQLAlchemyError
-from sqlalchemy.engine import Engine
+from sqlalchemy.engine import Engine, make_url
 from sqlmodel import SQLModel, create_engine, Session
 
 from .config import settings
 
 
+def _configure_sqlite_connection(dbapi_connection, connection_record) -> None:
+    # WAL + synchronous=NORMAL evitan un fsync completo del journal en cada COMMIT.
+    cursor = dbapi_connection.cursor()
+    try:
+        cursor.execute("PRAGMA journal_mode=WAL")
+        cursor.execute("PRAGMA synchronous=NORMAL")
+    finally:
+        cursor.close()
+
+
 # Configurar engine con soporte para SQLite en tests (hilos)
 if settings.database_url.startswith("sqlite"):
     engine = create_engine(
@@ -15,8 +25,16 @@ if settings.database_url.startswith("sqlite"):
         echo=settings.debug,
         connect_args={"check_same_thread": False},
     )
+    # Solo fuera de producción: synchronous=NORMAL en WAL puede perder los últimos
+    # COMMIT ante un corte de energía, aceptable para dev/tests pero no para datos reales.
+    if not settings.is_production:
+        event.listen(engine, "connect", _configure_sqlite_connection)
 else:
-    engine = create_engine(settings.database_url, echo=settings.debug)
+    engine_kwargs = {}
+    if make_url(settings.database_url).get_driver_name() == "psycopg2":
+        # Agrupa los executemany (p. ej. inserciones masivas del seeder) en lotes de VALUES/execute_batch.
+        engine_kwargs["executemany_mode"] = "values_plus_batch"
+    engine = create_engine(settings.database_url, echo=settings.debug, **engine_kwargs)
 
 
 def _ensure_column(engine: Engine, table_name: str, column_name: str, column_sql: str) -> None:
@@ -282,6 +282,10 @@ class Course(SQLModel, table=True):
 
 
 class Enrollment(SQLModel, table=True):
+    __table_args__ = (
+        UniqueConstraint("student_id", "course_id", name="uq_enrollment_student_course"),
+    )
+
     id: Optional[int] = Field(default=None, primary_key=True)
     student_id: int = Field(foreign_key="student.id")
     course_id: int = Field(foreign_key="course.id")
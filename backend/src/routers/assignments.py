@@ -18,8 +18,8 @@ from ..utils.course_access import (
     ensure_course_access,
     ensure_teacher_course_permission,
     ensure_teacher_for_assignment,
-    require_student,
-    require_teacher,
+    require_student_id,
+    require_teacher_id,
 )
 
 router = APIRouter(prefix="/assignments", tags=["assignments"])
@@ -80,13 +80,13 @@ def list_assignments(
         stmt = stmt.where(Assignment.course_id == course_id)
 
     if user.role == "teacher":
-        teacher = require_teacher(session, user)
-        stmt = stmt.where(Course.teacher_id == teacher.id)
+        teacher_id = require_teacher_id(session, user)
+        stmt = stmt.where(Course.teacher_id == teacher_id)
     elif user.role == "student":
-        student = require_student(session, user)
+        student_id = require_student_id(session, user)
         stmt = (
             stmt.join(Enrollment, Enrollment.course_id == Course.id)
-            .where(Enrollment.student_id == student.id)
+            .where(Enrollment.student_id == student_id)
             .where(Assignment.is_published == True)
         )
 
@@ -107,8 +107,7 @@ def create_assignment(
     assigned_teacher_id: Optional[int] = None
     if user.role == "teacher":
         ensure_teacher_course_permission(session, user, course.id)
-        teacher = require_teacher(session, user)
-        assigned_teacher_id = teacher.id
+        assigned_teacher_id = require_teacher_id(session, user)
     else:
         assigned_teacher_id = course.teacher_id
 
@@ -212,8 +211,8 @@ def list_submissions(
     if mine:
         if user.role != "student":
             raise HTTPException(status_code=400, detail="Solo los estudiantes pueden ver su propia entrega")
-        student = require_student(session, user)
-        stmt = stmt.where(AssignmentSubmission.student_id == student.id)
+        student_id = require_student_id(session, user)
+        stmt = stmt.where(AssignmentSubmission.student_id == student_id)
     else:
         if user.role == "student":
             raise HTTPException(status_code=403, detail="No autorizado a ver las entregas de otros compañeros")
@@ -237,9 +236,9 @@ def submit_assignment(
     if not assignment.is_published:
         raise HTTPException(status_code=403, detail="La tarea aún no está disponible")
 
-    student = require_student(session, user)
+    student_id = require_student_id(session, user)
     enrollment = session.exec(
-        select(Enrollment).where(Enrollment.course_id == assignment.course_id, Enrollment.student_id == student.id)
+        select(Enrollment).where(Enrollment.course_id == assignment.course_id, Enrollment.student_id == student_id)
     ).first()
     if not enrollment:
         raise HTTPException(status_code=403, detail="No estás inscrito en este curso")
@@ -258,7 +257,7 @@ def submit_assignment(
         submission = AssignmentSubmission(
             assignment_id=assignment_id,
             enrollment_id=enrollment.id,
-            student_id=student.id,
+            student_id=student_id,
             status=SubmissionStatusEnum.submitted,
             submitted_at=now,
             text_response=payload.text_response,
@@ -303,8 +302,8 @@ def grade_submission(
     submission.graded_at = datetime.utcnow()
     submission.status = SubmissionStatusEnum.graded
     if user.role == "teacher":
-        teacher = require_teacher(session, user)
-        submission.graded_by = teacher.id
+        teacher_id = require_teacher_id(session, user)
+        submission.graded_by = teacher_id
     submission.updated_at = datetime.utcnow()
 
     session.add(submission)
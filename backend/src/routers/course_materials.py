@@ -7,7 +7,7 @@ from sqlmodel import SQLModel, select
 from ..db import get_session
 from ..models import Course, CourseMaterial, MaterialTypeEnum, Enrollment
 from ..security import require_roles
-from ..utils.course_access import ensure_course_access, ensure_teacher_course_permission, require_student, require_teacher
+from ..utils.course_access import ensure_course_access, ensure_teacher_course_permission, require_student_id, require_teacher_id
 
 router = APIRouter(prefix="/course-materials", tags=["course-materials"])
 
@@ -48,13 +48,13 @@ def list_materials(
         stmt = stmt.where(CourseMaterial.course_id == course_id)
 
     if user.role == "teacher":
-        teacher = require_teacher(session, user)
-        stmt = stmt.where(Course.teacher_id == teacher.id)
+        teacher_id = require_teacher_id(session, user)
+        stmt = stmt.where(Course.teacher_id == teacher_id)
     elif user.role == "student":
-        student = require_student(session, user)
+        student_id = require_student_id(session, user)
         stmt = (
             stmt.join(Enrollment, Enrollment.course_id == Course.id)
-            .where(Enrollment.student_id == student.id)
+            .where(Enrollment.student_id == student_id)
             .where(CourseMaterial.is_published == True)
         )
 
@@ -75,8 +75,7 @@ def create_material(
     assigned_teacher_id: Optional[int] = None
     if user.role == "teacher":
         ensure_teacher_course_permission(session, user, course.id)
-        teacher = require_teacher(session, user)
-        assigned_teacher_id = teacher.id
+        assigned_teacher_id = require_teacher_id(session, user)
     else:
         assigned_teacher_id = course.teacher_id
 
@@ -5,7 +5,7 @@ from sqlmodel import select
 from ..db import get_session
 from ..models import Course, ProgramSemester, Enrollment
 from ..security import require_roles
-from ..utils.course_access import ensure_course_access, require_teacher, require_student
+from ..utils.course_access import ensure_course_access, require_teacher_id, require_student_id
 from ..utils.sqlmodel_helpers import apply_partial_update
 
 
@@ -22,13 +22,13 @@ def list_courses(
     if program_semester_id is not None:
         stmt = stmt.where(Course.program_semester_id == program_semester_id)
     if user.role == "teacher":
-        teacher = require_teacher(session, user)
-        stmt = stmt.where(Course.teacher_id == teacher.id)
+        teacher_id = require_teacher_id(session, user)
+        stmt = stmt.where(Course.teacher_id == teacher_id)
     elif user.role == "student":
-        student = require_student(session, user)
+        student_id = require_student_id(session, user)
         stmt = (
             stmt.join(Enrollment, Enrollment.course_id == Course.id)
-            .where(Enrollment.student_id == student.id)
+            .where(Enrollment.student_id == student_id)
             .distinct()
         )
     return session.exec(stmt).all()
@@ -1,5 +1,6 @@
 from fastapi import APIRouter, Depends, HTTPException
-from typing import List
+from typing import List, Optional
+from sqlalchemy.exc import IntegrityError
 from sqlmodel import select
 
 from ..db import get_session
@@ -10,6 +11,30 @@ from ..utils.sqlmodel_helpers import apply_partial_update
 
 router = APIRouter(prefix="/enrollments", tags=["enrollments"]) 
 
+_DUPLICATE_DETAIL = "El estudiante ya está matriculado en este curso"
+
+
+def _find_duplicate(session, student_id: int, course_id: int, exclude_id: Optional[int] = None) -> Optional[int]:
+	query = select(Enrollment.id).where(Enrollment.student_id == student_id, Enrollment.course_id == course_id)
+	if exclude_id is not None:
+		query = query.where(Enrollment.id != exclude_id)
+	return session.exec(query.limit(1)).first()
+
+
+def _commit_enrollment(session, enrollment: Enrollment) -> Enrollment:
+	student_id, course_id, enrollment_id = enrollment.student_id, enrollment.course_id, enrollment.id
+	session.add(enrollment)
+	try:
+		session.commit()
+	except IntegrityError:
+		# uq_enrollment_student_course también frena a dos peticiones concurrentes que pasaron la validación previa
+		session.rollback()
+		if _find_duplicate(session, student_id, course_id, exclude_id=enrollment_id) is not None:
+			raise HTTPException(status_code=400, detail=_DUPLICATE_DETAIL)
+		raise
+	session.refresh(enrollment)
+	return enrollment
+
 
 @router.get("/", response_model=List[Enrollment])
 def list_enrollments(session=Depends(get_session), user=Depends(require_roles("admin", "coordinator", "teacher"))):
@@ -18,10 +43,9 @@ def list_enrollments(session=Depends(get_session), user=Depends(require_roles("a
 
 @router.post("/", response_model=Enrollment)
 def create_enrollment(enrollment: Enrollment, session=Depends(get_session), user=Depends(require_roles("admin", "coordinator"))):
-	session.add(enrollment)
-	session.commit()
-	session.refresh(enrollment)
-	return enrollment
+	if _find_duplicate(session, enrollment.student_id, enrollment.course_id) is not None:
+		raise HTTPException(status_code=400, detail=_DUPLICATE_DETAIL)
+	return _commit_enrollment(session, enrollment)
 
 
 @router.get("/{enrollment_id}", response_model=Enrollment)
@@ -38,11 +62,12 @@ def update_enrollment(enrollment_id: int, payload: Enrollment, session=Depends(g
 	if not obj:
 		raise HTTPException(status_code=404, detail="Matrícula no encontrada")
 	update_data = payload.model_dump(exclude_unset=True)
+	student_id = update_data.get("student_id", obj.student_id)
+	course_id = update_data.get("course_id", obj.course_id)
+	if _find_duplicate(session, student_id, course_id, exclude_id=obj.id) is not None:
+		raise HTTPException(status_code=400, detail=_DUPLICATE_DETAIL)
 	apply_partial_update(obj, update_data)
-	session.add(obj)
-	session.commit()
-	session.refresh(obj)
-	return obj
+	return _commit_enrollment(session, obj)
 
 
 @router.delete("/{enrollment_id}")
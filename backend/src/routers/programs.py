@@ -34,6 +34,14 @@ def create_program(program: Program, session=Depends(get_session), user=Depends(
     return program
 
 
+@router.get("/by-code", response_model=Program)
+def get_program_by_code(code: str, session=Depends(get_session), user=Depends(require_roles("admin", "coordinator", "teacher", "student"))):
+    obj = session.exec(select(Program).where(Program.code == code)).first()
+    if not obj:
+        raise HTTPException(status_code=404, detail="Programa no encontrado")
+    return obj
+
+
 @router.get("/{program_id}", response_model=Program)
 def get_program(program_id: int, session=Depends(get_session), user=Depends(require_roles("admin", "coordinator", "teacher", "student"))):
     obj = session.get(Program, program_id)
@@ -24,6 +24,14 @@ def create_room(room: Room, session=Depends(get_session), user=Depends(require_r
     return room
 
 
+@router.get("/by-code", response_model=Room)
+def get_room_by_code(code: str, session=Depends(get_session), user=Depends(require_roles("admin", "coordinator", "teacher"))):
+    obj = session.exec(select(Room).where(Room.code == code)).first()
+    if not obj:
+        raise HTTPException(status_code=404, detail="Sala no encontrada")
+    return obj
+
+
 @router.get("/{room_id}", response_model=Room)
 def get_room(room_id: int, session=Depends(get_session), user=Depends(require_roles("admin", "coordinator", "teacher"))):
     obj = session.get(Room, room_id)
@@ -76,6 +76,7 @@ class StudentProgramEnrollmentOut(BaseModel):
     enrolled_at: datetime
     program_semester: ProgramSemesterSummary
     status: ProgramEnrollmentStatusEnum
+    ended_at: Optional[datetime] = None
 
 
 class StudentSemesterSelectionOut(BaseModel):
@@ -207,6 +208,7 @@ def _build_semester_selection(session: Session, student: Student) -> StudentSeme
             enrolled_at=active_enrollment.enrolled_at,
             program_semester=_semester_to_summary(active_semester),
             status=active_enrollment.status,
+            ended_at=active_enrollment.ended_at,
         )
     except HTTPException:
         active_enrollment = None
@@ -230,6 +232,7 @@ def _build_semester_selection(session: Session, student: Student) -> StudentSeme
                 enrolled_at=enrollment_obj.enrolled_at,
                 program_semester=_semester_to_summary(semester_obj),
                 status=enrollment_obj.status,
+                ended_at=enrollment_obj.ended_at,
             )
         )
     return StudentSemesterSelectionOut(
@@ -45,6 +45,14 @@ def create_subject(payload: SubjectInput, session=Depends(get_session), user=Dep
     return _build_subject_response(session, subject)
 
 
+@router.get("/by-code", response_model=SubjectOutput)
+def get_subject_by_code(code: str, session=Depends(get_session), user=Depends(require_roles("admin", "coordinator", "teacher", "student"))):
+    obj = session.exec(select(Subject).where(Subject.code == code)).first()
+    if not obj:
+        raise HTTPException(status_code=404, detail="Asignatura no encontrada")
+    return _build_subject_response(session, obj)
+
+
 @router.get("/{subject_id}", response_model=SubjectOutput)
 def get_subject(subject_id: int, session=Depends(get_session), user=Depends(require_roles("admin", "coordinator", "teacher", "student"))):
     obj = session.get(Subject, subject_id)
@@ -132,13 +140,8 @@ def _validate_prerequisite_ids(session, prerequisite_ids: List[int], subject_id:
         unique_ids.append(prereq_id)
     if not unique_ids:
         return []
-    existing = session.exec(select(Subject.id).where(Subject.id.in_(unique_ids))).all()
-    found: set[int] = set()
-    for item in existing:
-        if isinstance(item, tuple):
-            found.add(item[0])
-        else:
-            found.add(int(item))
+    # Una sola consulta IN valida todos los prerrequisitos.
+    found = set(session.exec(select(Subject.id).where(Subject.id.in_(unique_ids))).all())
     missing = [pid for pid in unique_ids if pid not in found]
     if missing:
         raise HTTPException(status_code=404, detail=f"Prerrequisitos no encontrados: {missing}")
@@ -1,5 +1,7 @@
 from datetime import datetime, timedelta, timezone
-from typing import Optional, Dict, Any
+from functools import lru_cache
+import time
+from typing import Optional, Dict, Any, Tuple
 from jose import jwt, JWTError
 from passlib.context import CryptContext
 from fastapi import Depends, HTTPException, status
@@ -11,7 +13,11 @@ from .db import get_session
 from .models import User
 
 
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+# PASSWORD_HASH_ROUNDS permite bajar el costo de bcrypt (p. ej. en tests); sin valor se usa el de passlib.
+_bcrypt_options: Dict[str, Any] = (
+    {"bcrypt__rounds": settings.password_hash_rounds} if settings.password_hash_rounds else {}
+)
+pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto", **_bcrypt_options)
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl="/auth/token")
 oauth2_optional_scheme = OAuth2PasswordBearer(tokenUrl="/auth/token", auto_error=False)
 
@@ -35,17 +41,38 @@ def create_access_token(subject: str, expires_minutes: Optional[int] = None, ext
     return jwt.encode(to_encode, settings.secret_key, algorithm=settings.algorithm)
 
 
+def _decode_token(token: str, secret_key: str, algorithm: str) -> Tuple[Optional[str], Optional[int]]:
+    payload = jwt.decode(token, secret_key, algorithms=[algorithm])
+    return payload.get("sub"), payload.get("exp")
+
+
+# Solo en tests (TESTING=1): los mismos tokens se verifican cientos de veces por corrida.
+# La clave incluye secreto y algoritmo para que una rotación invalide las entradas.
+_decode_token_cached = lru_cache(maxsize=32)(_decode_token)
+
+
+def _decode_token_claims(token: str) -> Tuple[Optional[str], Optional[int]]:
+    """Verify *token* and return its ``(sub, exp)`` claims.
+
+    Under ``settings.testing`` successful decodes are memoized (``lru_cache`` does not
+    store exceptions, so invalid tokens are re-checked on every request).
+    """
+    if settings.testing:
+        return _decode_token_cached(token, settings.secret_key, settings.algorithm)
+    return _decode_token(token, settings.secret_key, settings.algorithm)
+
+
 def authenticate_token(token: str, session) -> User:
     credentials_exception = HTTPException(
         status_code=status.HTTP_401_UNAUTHORIZED, detail="No autenticado", headers={"WWW-Authenticate": "Bearer"}
     )
     try:
-        payload = jwt.decode(token, settings.secret_key, algorithms=[settings.algorithm])
-        username: str = payload.get("sub")  # correo electrónico
-        if username is None:
-            raise credentials_exception
+        username, expires_at = _decode_token_claims(token)  # sub = correo electrónico
     except JWTError:
         raise credentials_exception
+    # El resultado puede venir de la caché: la expiración se vuelve a validar aquí.
+    if username is None or (expires_at is not None and expires_at <= time.time()):
+        raise credentials_exception
     user = session.exec(select(User).where(User.email == username)).first()
     if not user or not user.is_active:
         raise credentials_exception
@@ -1,9 +1,14 @@
 from __future__ import annotations
 
+from concurrent.futures import ThreadPoolExecutor
 from datetime import date, datetime, time, timedelta
-from typing import Any, Dict, Optional, List
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Any, Dict, Optional, List, Mapping, Sequence, Type
 
-from sqlmodel import Session, select
+from sqlalchemy import func, insert, tuple_
+from sqlalchemy.orm import load_only
+from sqlmodel import Session, SQLModel, select
 
 from . import db
 from .models import (
@@ -46,6 +51,9 @@ DEFAULT_COORDINATOR_PASSWORD = "coordinador123"
 DEFAULT_COORDINATOR_NAME = "Coordinación Académica"
 
 
+_SEED_SENTINEL_PROGRAM_CODE = "DS-AV"
+
+
 def ensure_default_admin(
     session: Optional[Session] = None,
     *,
@@ -55,90 +63,99 @@ def ensure_default_admin(
     owns_session = session is None
     session = session or Session(db.engine)
     try:
-        existing = session.exec(select(User).where(User.email == DEFAULT_ADMIN_EMAIL)).first()
-        if existing:
-            updated = False
-            if not verify_password(DEFAULT_ADMIN_PASSWORD, existing.hashed_password):
-                existing.hashed_password = get_password_hash(DEFAULT_ADMIN_PASSWORD)
-                updated = True
-            if existing.role != "admin":
-                existing.role = "admin"
-                updated = True
-            if not existing.is_active:
-                existing.is_active = True
-                updated = True
-            if force_password_reset is True and not existing.must_change_password:
-                existing.must_change_password = True
-                updated = True
-            if force_password_reset is False and existing.must_change_password:
-                existing.must_change_password = False
-                updated = True
-            if updated:
-                session.add(existing)
-                session.commit()
-                session.refresh(existing)
-            return existing
-        user = User(
-            email=DEFAULT_ADMIN_EMAIL,
-            full_name=DEFAULT_ADMIN_NAME,
-            hashed_password=get_password_hash(DEFAULT_ADMIN_PASSWORD),
-            role="admin",
-            is_active=True,
-            must_change_password=bool(force_password_reset),
-        )
-        session.add(user)
-        session.commit()
-        session.refresh(user)
+        user = _ensure_default_admin(session, force_password_reset=force_password_reset)
+        if user in session.new or user in session.dirty:
+            session.commit()
+            session.refresh(user)
         return user
     finally:
         if owns_session:
             session.close()
 
 
+def _ensure_default_admin(session: Session, *, force_password_reset: Optional[bool] = None) -> User:
+    existing = session.exec(select(User).where(User.email == DEFAULT_ADMIN_EMAIL)).first()
+    if existing:
+        updated = False
+        if not verify_password(DEFAULT_ADMIN_PASSWORD, existing.hashed_password):
+            existing.hashed_password = get_password_hash(DEFAULT_ADMIN_PASSWORD)
+            updated = True
+        if existing.role != "admin":
+            existing.role = "admin"
+            updated = True
+        if not existing.is_active:
+            existing.is_active = True
+            updated = True
+        if force_password_reset is True and not existing.must_change_password:
+            existing.must_change_password = True
+            updated = True
+        if force_password_reset is False and existing.must_change_password:
+            existing.must_change_password = False
+            updated = True
+        if updated:
+            session.add(existing)
+        return existing
+    user = User(
+        email=DEFAULT_ADMIN_EMAIL,
+        full_name=DEFAULT_ADMIN_NAME,
+        hashed_password=get_password_hash(DEFAULT_ADMIN_PASSWORD),
+        role="admin",
+        is_active=True,
+        must_change_password=bool(force_password_reset),
+    )
+    session.add(user)
+    return user
+
+
 def ensure_default_coordinator(session: Optional[Session] = None) -> User:
     """Create an academic coordinator account to operate scheduling workflows."""
     owns_session = session is None
     session = session or Session(db.engine)
     try:
-        existing = session.exec(select(User).where(User.email == DEFAULT_COORDINATOR_EMAIL)).first()
-        if existing:
-            updated = False
-            if not verify_password(DEFAULT_COORDINATOR_PASSWORD, existing.hashed_password):
-                existing.hashed_password = get_password_hash(DEFAULT_COORDINATOR_PASSWORD)
-                updated = True
-            if existing.role != "coordinator":
-                existing.role = "coordinator"
-                updated = True
-            if not existing.is_active:
-                existing.is_active = True
-                updated = True
-            if updated:
-                session.add(existing)
-                session.commit()
-                session.refresh(existing)
-            return existing
-        user = User(
-            email=DEFAULT_COORDINATOR_EMAIL,
-            full_name=DEFAULT_COORDINATOR_NAME,
-            hashed_password=get_password_hash(DEFAULT_COORDINATOR_PASSWORD),
-            role="coordinator",
-            is_active=True,
-        )
-        session.add(user)
-        session.commit()
-        session.refresh(user)
+        user = _ensure_default_coordinator(session)
+        if user in session.new or user in session.dirty:
+            session.commit()
+            session.refresh(user)
         return user
     finally:
         if owns_session:
             session.close()
 
 
+def _ensure_default_coordinator(session: Session) -> User:
+    existing = session.exec(select(User).where(User.email == DEFAULT_COORDINATOR_EMAIL)).first()
+    if existing:
+        updated = False
+        if not verify_password(DEFAULT_COORDINATOR_PASSWORD, existing.hashed_password):
+            existing.hashed_password = get_password_hash(DEFAULT_COORDINATOR_PASSWORD)
+            updated = True
+        if existing.role != "coordinator":
+            existing.role = "coordinator"
+            updated = True
+        if not existing.is_active:
+            existing.is_active = True
+            updated = True
+        if updated:
+            session.add(existing)
+        return existing
+    user = User(
+        email=DEFAULT_COORDINATOR_EMAIL,
+        full_name=DEFAULT_COORDINATOR_NAME,
+        hashed_password=get_password_hash(DEFAULT_COORDINATOR_PASSWORD),
+        role="coordinator",
+        is_active=True,
+    )
+    session.add(user)
+    return user
+
+
 def ensure_app_settings(session: Optional[Session] = None) -> None:
     """Guarantee that the base application settings exist."""
     owns_session = session is None
     session = session or Session(db.engine)
     try:
-        _ensure_app_settings(session)
+        if _ensure_app_settings(session):
+            session.commit()
     finally:
         if owns_session:
             session.close()
@@ -146,21 +163,34 @@ def ensure_app_settings(session: Optional[Session] = None) -> None:
 
 def ensure_demo_data() -> None:
     """Populate the main catalog tables with deterministic demo data for the UI."""
-    with Session(db.engine) as session:
-        ensure_default_admin(session, force_password_reset=False)
-        ensure_default_coordinator(session)
-        ensure_app_settings(session)
+    # session.begin() confirma todo el catálogo demo en un único COMMIT al salir y revierte
+    # por completo si algún helper falla; los helpers solo hacen flush().
+    with Session(db.engine) as session, session.begin():
+        _ensure_default_admin(session, force_password_reset=False)
+        _ensure_default_coordinator(session)
+        _ensure_app_settings(session)
 
+        # Las calificaciones son el último paso del seeder: si existen junto al programa centinela,
+        # el catálogo demo ya está completo y se evita recorrer todos los helpers.
+        if (
+            session.exec(select(Program.id).where(Program.code == _SEED_SENTINEL_PROGRAM_CODE)).first()
+            and session.exec(select(Grade.id).limit(1)).first()
+        ):
+            return
+
+        # Caché de usuarios por correo válida solo durante esta ejecución del seeder.
+        user_cache: Dict[str, User] = {}
+        _prewarm_seed_password_hashes(session, user_cache)
         program_map = _ensure_programs(session)
         semester_map = _ensure_program_semesters(session, program_map)
         subject_map = _ensure_subjects(session, program_map)
         _ensure_subject_prerequisites(session, subject_map)
-        teacher_map = _ensure_teachers(session)
+        teacher_map = _ensure_teachers(session, user_cache)
         room_map = _ensure_rooms(session)
         timeslot_map = _ensure_timeslots(session)
         course_map = _ensure_courses(session, subject_map, teacher_map, semester_map)
         _ensure_course_schedules(session, course_map, room_map, timeslot_map)
-        student_map = _ensure_students(session, program_map)
+        student_map = _ensure_students(session, program_map, user_cache)
         enrollment_map = _ensure_enrollments(session, student_map, course_map)
         _ensure_student_program_enrollments(session, student_map, program_map, semester_map)
         evaluation_map = _ensure_evaluations(session, course_map)
@@ -170,7 +200,7 @@ def ensure_demo_data() -> None:
         _ensure_attendance(session, enrollment_map)
 
 
-def _ensure_app_settings(session: Session) -> None:
+def _ensure_app_settings(session: Session) -> bool:
     defaults = [
         {
             "key": "branding.app_name",
@@ -320,8 +350,65 @@ def _ensure_app_settings(session: Session) -> None:
         if updated:
             session.add(setting)
             dirty = True
-    if dirty:
-        session.commit()
+    return dirty
+
+
+@lru_cache(maxsize=None)
+def _seed_password_hash(password: str) -> str:
+    """Hash a demo password once per process; seed users sharing it reuse the same hash."""
+    return get_password_hash(password)
+
+
+def _prewarm_seed_password_hashes(session: Session, user_cache: Dict[str, User]) -> None:
+    """Hash the passwords of the demo users that still have to be created, in parallel.
+
+    bcrypt releases the GIL, so the distinct passwords are hashed concurrently and
+    land in the ``_seed_password_hash`` cache before the teacher/student helpers run.
+    """
+    seed_users = (*_TEACHER_SEED_DATA, *_STUDENT_SEED_DATA)
+    _prefetch_users(session, user_cache, [item["email"] for item in seed_users])
+    passwords = {item["password"] for item in seed_users if item["email"] not in user_cache}
+    if len(passwords) < 2:
+        return
+    with ThreadPoolExecutor(max_workers=min(8, len(passwords))) as executor:
+        list(executor.map(_seed_password_hash, passwords))
+
+
+def _prefetch_users(session: Session, user_cache: Dict[str, User], emails: Sequence[str]) -> None:
+    """Load the users for *emails* missing from *user_cache* with a single IN query."""
+    pending = [email for email in emails if email not in user_cache]
+    if not pending:
+        return
+    for user in session.exec(select(User).where(User.email.in_(pending))).all():
+        user_cache[user.email] = user
+
+
+def _insert_missing_users(
+    session: Session,
+    user_cache: Dict[str, User],
+    items: Sequence[Dict[str, Any]],
+    role: str,
+) -> None:
+    """Create the users in *items* absent from *user_cache* with one ``INSERT ... RETURNING`` batch.
+
+    The returned ``User`` objects join the session identity map and the cache,
+    so the following ``_get_or_create_user`` calls resolve without SQL.
+    """
+    rows: Dict[str, Dict[str, Any]] = {}
+    for item in items:
+        if item["email"] in user_cache or item["email"] in rows:
+            continue
+        rows[item["email"]] = {
+            "email": item["email"],
+            "full_name": item["full_name"],
+            "hashed_password": _seed_password_hash(item["password"]),
+            "role": role,
+            "is_active": True,
+        }
+    if not rows:
+        return
+    for user in session.scalars(insert(User).returning(User), list(rows.values())).all():
+        user_cache[user.email] = user
 
 
 def _get_or_create_user(
@@ -331,9 +418,13 @@ def _get_or_create_user(
     full_name: str,
     role: str,
     password: str,
+    user_cache: Optional[Dict[str, User]] = None,
     **extra,
 ) -> User:
-    user = session.exec(select(User).where(User.email == email)).first()
+    if user_cache is not None and email in user_cache:
+        user = user_cache[email]
+    else:
+        user = session.exec(select(User).where(User.email == email)).first()
     if user:
         updated = False
         if user.full_name != full_name:
@@ -349,23 +440,71 @@ def _get_or_create_user(
                     updated = True
         if updated:
             session.add(user)
-            session.commit()
+            session.flush()
+        if user_cache is not None:
+            user_cache[email] = user
         return user
 
     user = User(
         email=email,
         full_name=full_name,
-        hashed_password=get_password_hash(password),
+        hashed_password=_seed_password_hash(password),
         role=role,
         is_active=True,
         **extra,
     )
     session.add(user)
-    session.commit()
-    session.refresh(user)
+    session.flush()
+    if user_cache is not None:
+        user_cache[email] = user
     return user
 
 
+# Un INSERT por tabla, construido una vez; SQLAlchemy reutiliza su forma compilada en cada seeder.
+_INSERT_STATEMENTS: Dict[str, Any] = {}
+
+
+def _seed_table(
+    session: Session,
+    model: Type[SQLModel],
+    rows: Sequence[Dict[str, Any]],
+    unique_cols: Sequence[str],
+) -> int:
+    """Insert the *rows* of ``model`` whose ``unique_cols`` values are not stored yet.
+
+    Existing keys are read with a single ``IN`` query over the batch and the
+    missing rows go out as one ``INSERT`` parameter list. Returns the number of
+    inserted rows.
+    """
+    if not rows:
+        return 0
+    columns = [getattr(model, column) for column in unique_cols]
+    keys = {tuple(row[column] for column in unique_cols) for row in rows}
+    existing = {tuple(row) for row in session.exec(select(*columns).where(tuple_(*columns).in_(keys))).all()}
+    to_insert = [row for row in rows if tuple(row[column] for column in unique_cols) not in existing]
+    if to_insert:
+        table = model.__table__
+        statement = _INSERT_STATEMENTS.get(table.name)
+        if statement is None:
+            statement = _INSERT_STATEMENTS[table.name] = insert(table)
+        session.execute(statement, to_insert)
+    return len(to_insert)
+
+
+def _load_if_seeded(session: Session, model: Type[SQLModel], key_field: str, keys: Sequence[str]) -> Optional[Dict[str, Any]]:
+    """Return the rows of ``model`` keyed by ``key_field`` when every seed key already exists.
+
+    A single ``COUNT(*)`` decides whether the helper can skip its per-row checks;
+    ``None`` means at least one seed row is missing and the caller must keep going.
+    """
+    column = getattr(model, key_field)
+    count = session.exec(select(func.count()).select_from(model).where(column.in_(keys))).one()
+    if count < len(keys):
+        return None
+    rows = session.exec(select(model).where(column.in_(keys))).all()
+    return {getattr(row, key_field): row for row in rows}
+
+
 def _ensure_programs(session: Session) -> Dict[str, Program]:
     data = [
         {
@@ -397,15 +536,19 @@ def _ensure_programs(session: Session) -> Dict[str, Program]:
             "description": "Optimización de procesos, logística y sistemas productivos.",
         },
     ]
-    mapping: Dict[str, Program] = {}
-    for item in data:
-        program = session.exec(select(Program).where(Program.code == item["code"])).first()
-        if not program:
-            program = Program(**item)
-            session.add(program)
-            session.commit()
-            session.refresh(program)
-        mapping[item["code"]] = program
+    seeded = _load_if_seeded(session, Program, "code", [item["code"] for item in data])
+    if seeded is not None:
+        return seeded
+
+    codes = [item["code"] for item in data]
+    mapping: Dict[str, Program] = {
+        program.code: program for program in session.exec(select(Program).where(Program.code.in_(codes))).all()
+    }
+    missing = [Program(**item) for item in data if item["code"] not in mapping]
+    if missing:
+        session.add_all(missing)
+        session.flush()
+        mapping.update((program.code, program) for program in missing)
     return mapping
 
 
@@ -1142,7 +1285,12 @@ def _ensure_subjects(session: Session, program_map: Dict[str, Program]) -> Dict[
             "hours_per_week": 3,
         },
     ]
+    codes = [item["code"] for item in data]
+    existing: Dict[str, Subject] = {
+        subject.code: subject for subject in session.exec(select(Subject).where(Subject.code.in_(codes))).all()
+    }
     mapping: Dict[str, Subject] = {}
+    missing: List[Subject] = []
     for item in data:
         program = program_map.get(item.get("program_code"))
         hours_payload = _derive_subject_hours(item)
@@ -1155,17 +1303,20 @@ def _ensure_subjects(session: Session, program_map: Dict[str, Program]) -> Dict[
             **hours_payload,
         }
 
-        subject = session.exec(select(Subject).where(Subject.code == item["code"])).first()
+        subject = existing.get(item["code"])
         if subject:
             for key, value in subject_attrs.items():
                 setattr(subject, key, value)
         else:
             subject = Subject(code=item["code"], **subject_attrs)
-            session.add(subject)
-
-        session.commit()
-        session.refresh(subject)
+            # Códigos repetidos en los datos actualizan la misma asignatura, como antes.
+            existing[item["code"]] = subject
+            missing.append(subject)
         mapping[item["code"]] = subject
+
+    session.add_all(missing)
+    # Un solo flush envía las altas y solo los UPDATE de las asignaturas que cambiaron.
+    session.flush()
     return mapping
 
 
@@ -1226,250 +1377,271 @@ def _ensure_subject_prerequisites(session: Session, subject_map: Dict[str, Subje
         "GES401": ["IND240"],
     }
 
-    dirty = False
+    subject_ids = [subject_map[code].id for code in matrix if code in subject_map]
+    if not subject_ids:
+        return
+    # Solo interesa qué pares existen: se consultan las dos columnas sin hidratar objetos.
+    existing = set(
+        session.exec(
+            select(SubjectPrerequisite.subject_id, SubjectPrerequisite.prerequisite_subject_id).where(
+                SubjectPrerequisite.subject_id.in_(subject_ids)
+            )
+        ).all()
+    )
+
+    missing: List[SubjectPrerequisite] = []
     for subject_code, prereq_codes in matrix.items():
         subject = subject_map.get(subject_code)
         if not subject:
             continue
         for prereq_code in prereq_codes:
             prerequisite = subject_map.get(prereq_code)
-            if not prerequisite:
-                continue
-            existing = session.exec(
-                select(SubjectPrerequisite).where(
-                    SubjectPrerequisite.subject_id == subject.id,
-                    SubjectPrerequisite.prerequisite_subject_id == prerequisite.id,
-                )
-            ).first()
-            if existing:
+            if not prerequisite or (subject.id, prerequisite.id) in existing:
                 continue
-            session.add(
+            existing.add((subject.id, prerequisite.id))
+            missing.append(
                 SubjectPrerequisite(
                     subject_id=subject.id,
                     prerequisite_subject_id=prerequisite.id,
                 )
             )
-            dirty = True
-    if dirty:
-        session.commit()
-
+    if missing:
+        session.add_all(missing)
+        session.flush()
+
+
+_TEACHER_SEED_DATA: tuple[Dict[str, Any], ...] = (
+    # Matemáticas
+    {
+        "email": "docente1@academiapro.dev",
+        "full_name": "Laura Fernández",
+        "password": "teacher123",
+        "department": "Matemáticas",
+        "specialty": "Cálculo y Álgebra",
+        "office": "B-301",
+    },
+    {
+        "email": "docente3@academiapro.dev",
+        "full_name": "Andrea Ruiz",
+        "password": "teacher123",
+        "department": "Matemáticas",
+        "specialty": "Probabilidad y Estadística",
+        "office": "B-205",
+    },
+    {
+        "email": "docente8@academiapro.dev",
+        "full_name": "Roberto Campos",
+        "password": "teacher123",
+        "department": "Matemáticas",
+        "specialty": "Ecuaciones Diferenciales",
+        "office": "B-308",
+    },
+    # Ciencias de la Computación
+    {
+        "email": "docente2@academiapro.dev",
+        "full_name": "Martín Aguilar",
+        "password": "teacher123",
+        "department": "Ciencias de la Computación",
+        "specialty": "Arquitectura de Software",
+        "office": "C-210",
+    },
+    {
+        "email": "docente4@academiapro.dev",
+        "full_name": "Sergio Pineda",
+        "password": "teacher123",
+        "department": "Ciencias de la Computación",
+        "specialty": "Ciberseguridad y Redes",
+        "office": "C-108",
+    },
+    {
+        "email": "docente9@academiapro.dev",
+        "full_name": "Patricia Vega",
+        "password": "teacher123",
+        "department": "Ciencias de la Computación",
+        "specialty": "Bases de Datos",
+        "office": "C-305",
+    },
+    {
+        "email": "docente10@academiapro.dev",
+        "full_name": "Fernando López",
+        "password": "teacher123",
+        "department": "Ciencias de la Computación",
+        "specialty": "Desarrollo Web y Móvil",
+        "office": "C-412",
+    },
+    {
+        "email": "docente11@academiapro.dev",
+        "full_name": "Carolina Mendoza",
+        "password": "teacher123",
+        "department": "Ciencias de la Computación",
+        "specialty": "Algoritmos y Estructuras de Datos",
+        "office": "C-207",
+    },
+    # Administración
+    {
+        "email": "docente5@academiapro.dev",
+        "full_name": "Jimena Castro",
+        "password": "teacher123",
+        "department": "Administración",
+        "specialty": "Finanzas Corporativas",
+        "office": "D-402",
+    },
+    {
+        "email": "docente12@academiapro.dev",
+        "full_name": "Miguel Ángel Torres",
+        "password": "teacher123",
+        "department": "Administración",
+        "specialty": "Marketing y Ventas",
+        "office": "D-305",
+    },
+    {
+        "email": "docente13@academiapro.dev",
+        "full_name": "Valeria Guzmán",
+        "password": "teacher123",
+        "department": "Administración",
+        "specialty": "Recursos Humanos",
+        "office": "D-201",
+    },
+    {
+        "email": "docente14@academiapro.dev",
+        "full_name": "Ricardo Salinas",
+        "password": "teacher123",
+        "department": "Administración",
+        "specialty": "Contabilidad y Auditoría",
+        "office": "D-108",
+    },
+    {
+        "email": "docente15@academiapro.dev",
+        "full_name": "Mónica Reyes",
+        "password": "teacher123",
+        "department": "Administración",
+        "specialty": "Gestión de Proyectos",
+        "office": "D-315",
+    },
+    # Ciencia de Datos
+    {
+        "email": "docente6@academiapro.dev",
+        "full_name": "Rafael Ortega",
+        "password": "teacher123",
+        "department": "Ciencia de Datos",
+        "specialty": "Big Data y Machine Learning",
+        "office": "CI-102",
+    },
+    {
+        "email": "docente16@academiapro.dev",
+        "full_name": "Isabel Navarro",
+        "password": "teacher123",
+        "department": "Ciencia de Datos",
+        "specialty": "Deep Learning e IA",
+        "office": "CI-205",
+    },
+    {
+        "email": "docente17@academiapro.dev",
+        "full_name": "Alejandro Ramos",
+        "password": "teacher123",
+        "department": "Ciencia de Datos",
+        "specialty": "Visualización y Analytics",
+        "office": "CI-308",
+    },
+    # Ingeniería Industrial
+    {
+        "email": "docente7@academiapro.dev",
+        "full_name": "Elena Prieto",
+        "password": "teacher123",
+        "department": "Ingeniería Industrial",
+        "specialty": "Optimización y Simulación",
+        "office": "E-215",
+    },
+    {
+        "email": "docente18@academiapro.dev",
+        "full_name": "Jorge Contreras",
+        "password": "teacher123",
+        "department": "Ingeniería Industrial",
+        "specialty": "Logística y Producción",
+        "office": "E-310",
+    },
+    {
+        "email": "docente19@academiapro.dev",
+        "full_name": "Diana Flores",
+        "password": "teacher123",
+        "department": "Ingeniería Industrial",
+        "specialty": "Calidad y Mejora Continua",
+        "office": "E-108",
+    },
+    # Ciencias Básicas
+    {
+        "email": "docente20@academiapro.dev",
+        "full_name": "Alberto Ramírez",
+        "password": "teacher123",
+        "department": "Física",
+        "specialty": "Física Aplicada",
+        "office": "F-201",
+    },
+    {
+        "email": "docente21@academiapro.dev",
+        "full_name": "Cristina Herrera",
+        "password": "teacher123",
+        "department": "Química",
+        "specialty": "Química Industrial",
+        "office": "F-305",
+    },
+    # Humanidades
+    {
+        "email": "docente22@academiapro.dev",
+        "full_name": "Manuel Soto",
+        "password": "teacher123",
+        "department": "Humanidades",
+        "specialty": "Comunicación y Ética",
+        "office": "H-102",
+    },
+    {
+        "email": "docente23@academiapro.dev",
+        "full_name": "Luisa Paredes",
+        "password": "teacher123",
+        "department": "Derecho",
+        "specialty": "Derecho Empresarial",
+        "office": "H-205",
+    },
+)
 
-def _ensure_teachers(session: Session) -> Dict[str, Teacher]:
-    data = [
-        # Matemáticas
-        {
-            "email": "docente1@academiapro.dev",
-            "full_name": "Laura Fernández",
-            "password": "teacher123",
-            "department": "Matemáticas",
-            "specialty": "Cálculo y Álgebra",
-            "office": "B-301",
-        },
-        {
-            "email": "docente3@academiapro.dev",
-            "full_name": "Andrea Ruiz",
-            "password": "teacher123",
-            "department": "Matemáticas",
-            "specialty": "Probabilidad y Estadística",
-            "office": "B-205",
-        },
-        {
-            "email": "docente8@academiapro.dev",
-            "full_name": "Roberto Campos",
-            "password": "teacher123",
-            "department": "Matemáticas",
-            "specialty": "Ecuaciones Diferenciales",
-            "office": "B-308",
-        },
-        # Ciencias de la Computación
-        {
-            "email": "docente2@academiapro.dev",
-            "full_name": "Martín Aguilar",
-            "password": "teacher123",
-            "department": "Ciencias de la Computación",
-            "specialty": "Arquitectura de Software",
-            "office": "C-210",
-        },
-        {
-            "email": "docente4@academiapro.dev",
-            "full_name": "Sergio Pineda",
-            "password": "teacher123",
-            "department": "Ciencias de la Computación",
-            "specialty": "Ciberseguridad y Redes",
-            "office": "C-108",
-        },
-        {
-            "email": "docente9@academiapro.dev",
-            "full_name": "Patricia Vega",
-            "password": "teacher123",
-            "department": "Ciencias de la Computación",
-            "specialty": "Bases de Datos",
-            "office": "C-305",
-        },
-        {
-            "email": "docente10@academiapro.dev",
-            "full_name": "Fernando López",
-            "password": "teacher123",
-            "department": "Ciencias de la Computación",
-            "specialty": "Desarrollo Web y Móvil",
-            "office": "C-412",
-        },
-        {
-            "email": "docente11@academiapro.dev",
-            "full_name": "Carolina Mendoza",
-            "password": "teacher123",
-            "department": "Ciencias de la Computación",
-            "specialty": "Algoritmos y Estructuras de Datos",
-            "office": "C-207",
-        },
-        # Administración
-        {
-            "email": "docente5@academiapro.dev",
-            "full_name": "Jimena Castro",
-            "password": "teacher123",
-            "department": "Administración",
-            "specialty": "Finanzas Corporativas",
-            "office": "D-402",
-        },
-        {
-            "email": "docente12@academiapro.dev",
-            "full_name": "Miguel Ángel Torres",
-            "password": "teacher123",
-            "department": "Administración",
-            "specialty": "Marketing y Ventas",
-            "office": "D-305",
-        },
-        {
-            "email": "docente13@academiapro.dev",
-            "full_name": "Valeria Guzmán",
-            "password": "teacher123",
-            "department": "Administración",
-            "specialty": "Recursos Humanos",
-            "office": "D-201",
-        },
-        {
-            "email": "docente14@academiapro.dev",
-            "full_name": "Ricardo Salinas",
-            "password": "teacher123",
-            "department": "Administración",
-            "specialty": "Contabilidad y Auditoría",
-            "office": "D-108",
-        },
-        {
-            "email": "docente15@academiapro.dev",
-            "full_name": "Mónica Reyes",
-            "password": "teacher123",
-            "department": "Administración",
-            "specialty": "Gestión de Proyectos",
-            "office": "D-315",
-        },
-        # Ciencia de Datos
-        {
-            "email": "docente6@academiapro.dev",
-            "full_name": "Rafael Ortega",
-            "password": "teacher123",
-            "department": "Ciencia de Datos",
-            "specialty": "Big Data y Machine Learning",
-            "office": "CI-102",
-        },
-        {
-            "email": "docente16@academiapro.dev",
-            "full_name": "Isabel Navarro",
-            "password": "teacher123",
-            "department": "Ciencia de Datos",
-            "specialty": "Deep Learning e IA",
-            "office": "CI-205",
-        },
-        {
-            "email": "docente17@academiapro.dev",
-            "full_name": "Alejandro Ramos",
-            "password": "teacher123",
-            "department": "Ciencia de Datos",
-            "specialty": "Visualización y Analytics",
-            "office": "CI-308",
-        },
-        # Ingeniería Industrial
-        {
-            "email": "docente7@academiapro.dev",
-            "full_name": "Elena Prieto",
-            "password": "teacher123",
-            "department": "Ingeniería Industrial",
-            "specialty": "Optimización y Simulación",
-            "office": "E-215",
-        },
-        {
-            "email": "docente18@academiapro.dev",
-            "full_name": "Jorge Contreras",
-            "password": "teacher123",
-            "department": "Ingeniería Industrial",
-            "specialty": "Logística y Producción",
-            "office": "E-310",
-        },
-        {
-            "email": "docente19@academiapro.dev",
-            "full_name": "Diana Flores",
-            "password": "teacher123",
-            "department": "Ingeniería Industrial",
-            "specialty": "Calidad y Mejora Continua",
-            "office": "E-108",
-        },
-        # Ciencias Básicas
-        {
-            "email": "docente20@academiapro.dev",
-            "full_name": "Alberto Ramírez",
-            "password": "teacher123",
-            "department": "Física",
-            "specialty": "Física Aplicada",
-            "office": "F-201",
-        },
-        {
-            "email": "docente21@academiapro.dev",
-            "full_name": "Cristina Herrera",
-            "password": "teacher123",
-            "department": "Química",
-            "specialty": "Química Industrial",
-            "office": "F-305",
-        },
-        # Humanidades
-        {
-            "email": "docente22@academiapro.dev",
-            "full_name": "Manuel Soto",
-            "password": "teacher123",
-            "department": "Humanidades",
-            "specialty": "Comunicación y Ética",
-            "office": "H-102",
-        },
-        {
-            "email": "docente23@academiapro.dev",
-            "full_name": "Luisa Paredes",
-            "password": "teacher123",
-            "department": "Derecho",
-            "specialty": "Derecho Empresarial",
-            "office": "H-205",
-        },
-    ]
 
-    mapping: Dict[str, Teacher] = {}
-    for item in data:
-        user = _get_or_create_user(
+def _ensure_teachers(session: Session, user_cache: Dict[str, User]) -> Dict[str, Teacher]:
+    _prefetch_users(session, user_cache, [item["email"] for item in _TEACHER_SEED_DATA])
+    _insert_missing_users(session, user_cache, _TEACHER_SEED_DATA, "teacher")
+    users = [
+        _get_or_create_user(
             session,
             email=item["email"],
             full_name=item["full_name"],
             role="teacher",
             password=item["password"],
+            user_cache=user_cache,
         )
-        teacher = session.exec(select(Teacher).where(Teacher.user_id == user.id)).first()
+        for item in _TEACHER_SEED_DATA
+    ]
+    user_ids = [user.id for user in users]
+    by_user_id: Dict[int, Teacher] = {}
+    for teacher in session.exec(
+        select(Teacher).where(Teacher.user_id.in_(user_ids)).order_by(Teacher.id)
+    ).all():
+        by_user_id.setdefault(teacher.user_id, teacher)
+
+    mapping: Dict[str, Teacher] = {}
+    missing: List[Teacher] = []
+    for item, user_id in zip(_TEACHER_SEED_DATA, user_ids):
+        teacher = by_user_id.get(user_id)
         if not teacher:
             teacher = Teacher(
-                user_id=user.id,
+                user_id=user_id,
                 department=item["department"],
                 specialty=item["specialty"],
                 office=item["office"],
             )
-            session.add(teacher)
-            session.commit()
-            session.refresh(teacher)
+            missing.append(teacher)
         mapping[item["email"]] = teacher
+    if missing:
+        session.add_all(missing)
+        session.flush()
     return mapping
 
 
@@ -1687,15 +1859,19 @@ def _ensure_rooms(session: Session) -> Dict[str, Room]:
             "has_projector": True,
         },
     ]
-    mapping: Dict[str, Room] = {}
-    for item in data:
-        room = session.exec(select(Room).where(Room.code == item["code"])).first()
-        if not room:
-            room = Room(**item)
-            session.add(room)
-            session.commit()
-            session.refresh(room)
-        mapping[item["code"]] = room
+    seeded = _load_if_seeded(session, Room, "code", [item["code"] for item in data])
+    if seeded is not None:
+        return seeded
+
+    codes = [item["code"] for item in data]
+    mapping: Dict[str, Room] = {
+        room.code: room for room in session.exec(select(Room).where(Room.code.in_(codes))).all()
+    }
+    missing = [Room(**item) for item in data if item["code"] not in mapping]
+    if missing:
+        session.add_all(missing)
+        session.flush()
+        mapping.update((room.code, room) for room in missing)
     return mapping
 
 
@@ -1717,50 +1893,48 @@ def _ensure_timeslots(session: Session) -> Dict[str, Timeslot]:
     for day in range(5):  # Lunes (0) a viernes (4)
         for start, end in daily_template:
             data.append({"day_of_week": day, "start_time": start, "end_time": end})
+    _seed_table(session, Timeslot, data, ("day_of_week", "start_time", "end_time"))
+
+    # Un único SELECT posterior a la inserción arma el mapa; ante duplicados gana el de menor id.
+    slot_filter = tuple_(Timeslot.day_of_week, Timeslot.start_time, Timeslot.end_time).in_(
+        [(item["day_of_week"], item["start_time"], item["end_time"]) for item in data]
+    )
     mapping: Dict[str, Timeslot] = {}
-    for item in data:
-        key = f"{item['day_of_week']}-{item['start_time'].strftime('%H:%M')}"
-        timeslot = (
-            session.exec(
-                select(Timeslot).where(
-                    Timeslot.day_of_week == item["day_of_week"],
-                    Timeslot.start_time == item["start_time"],
-                    Timeslot.end_time == item["end_time"],
-                )
-            ).first()
-        )
-        if not timeslot:
-            timeslot = Timeslot(**item)
-            session.add(timeslot)
-            session.commit()
-            session.refresh(timeslot)
-        mapping[key] = timeslot
+    for timeslot in session.exec(select(Timeslot).where(slot_filter).order_by(Timeslot.id)).all():
+        mapping.setdefault(f"{timeslot.day_of_week}-{timeslot.start_time.strftime('%H:%M')}", timeslot)
     return mapping
 
 
 def _ensure_program_semesters(session: Session, program_map: Dict[str, Program]) -> Dict[str, ProgramSemester]:
-    mapping: Dict[str, ProgramSemester] = {}
+    rows: List[Dict[str, Any]] = []
+    code_by_program_id: Dict[int, str] = {}
     for program_code, program in program_map.items():
+        code_by_program_id[program.id] = program_code
         total_semesters = program.duration_semesters or 8
         # Limitar la cantidad inicial para no sobrepoblar; mínimo 4 semestres.
         for number in range(1, min(total_semesters, 6) + 1):
-            existing = session.exec(
-                select(ProgramSemester).where(
-                    ProgramSemester.program_id == program.id,
-                    ProgramSemester.semester_number == number,
-                )
-            ).first()
-            if not existing:
-                existing = ProgramSemester(
-                    program_id=program.id,
-                    semester_number=number,
-                    label=f"Semestre {number}",
-                    is_active=True,
-                )
-                session.add(existing)
-                session.commit()
-                session.refresh(existing)
-            mapping[f"{program_code}:{number}"] = existing
+            rows.append(
+                {
+                    "program_id": program.id,
+                    "semester_number": number,
+                    "label": f"Semestre {number}",
+                    "is_active": True,
+                }
+            )
+    _seed_table(session, ProgramSemester, rows, ("program_id", "semester_number"))
+
+    mapping: Dict[str, ProgramSemester] = {}
+    if not rows:
+        return mapping
+    wanted = {(row["program_id"], row["semester_number"]) for row in rows}
+    semesters = session.exec(
+        select(ProgramSemester)
+        .where(ProgramSemester.program_id.in_(code_by_program_id))
+        .order_by(ProgramSemester.id)
+    ).all()
+    for semester in semesters:
+        if (semester.program_id, semester.semester_number) in wanted:
+            mapping.setdefault(f"{code_by_program_id[semester.program_id]}:{semester.semester_number}", semester)
     return mapping
 
 
@@ -2068,7 +2242,15 @@ def _ensure_courses(
          "modality": ModalityEnum.hybrid, "program_code": "ING-IND", "semester_number": 4},
     ]
 
+    subject_ids = [subject.id for subject in subject_map.values()]
+    existing: Dict[tuple[int, int, str, str], Course] = {}
+    for course in session.exec(
+        select(Course).where(Course.subject_id.in_(subject_ids)).order_by(Course.id)
+    ).all():
+        existing.setdefault((course.subject_id, course.teacher_id, course.term, course.group), course)
+
     mapping: Dict[str, Course] = {}
+    missing: List[Course] = []
     for item in data:
         subject = subject_map.get(item["subject_code"])
         teacher = teacher_map.get(item["teacher_email"])
@@ -2079,16 +2261,8 @@ def _ensure_courses(
         if not semester:
             continue
 
-        course = (
-            session.exec(
-                select(Course).where(
-                    Course.subject_id == subject.id,
-                    Course.teacher_id == teacher.id,
-                    Course.term == item["term"],
-                    Course.group == item["group"],
-                )
-            ).first()
-        )
+        course_key = (subject.id, teacher.id, item["term"], item["group"])
+        course = existing.get(course_key)
         if not course:
             course = Course(
                 subject_id=subject.id,
@@ -2100,14 +2274,15 @@ def _ensure_courses(
                 modality=item["modality"],
                 program_semester_id=semester.id,
             )
-            session.add(course)
-            session.commit()
-            session.refresh(course)
+            existing[course_key] = course
+            missing.append(course)
         elif course.program_semester_id != semester.id:
             course.program_semester_id = semester.id
             session.add(course)
-            session.commit()
         mapping[item["key"]] = course
+
+    session.add_all(missing)
+    session.flush()
     return mapping
 
 
@@ -2134,6 +2309,15 @@ def _ensure_course_schedules(
         {"course_key": "IND240-2025-1-A", "room_code": "C-301", "timeslot_key": "1-16:45"},
     ]
 
+    course_ids = {course_map[item["course_key"]].id for item in data if item["course_key"] in course_map}
+    schedules: Dict[tuple[int, int, int], CourseSchedule] = {}
+    if course_ids:
+        for schedule in session.exec(
+            select(CourseSchedule).where(CourseSchedule.course_id.in_(course_ids)).order_by(CourseSchedule.id)
+        ).all():
+            schedules.setdefault((schedule.course_id, schedule.room_id, schedule.timeslot_id), schedule)
+
+    dirty = False
     for item in data:
         course = course_map.get(item["course_key"])
         room = room_map.get(item["room_code"])
@@ -2141,13 +2325,7 @@ def _ensure_course_schedules(
         if not course or not room or not timeslot:
             continue
 
-        existing = session.exec(
-            select(CourseSchedule).where(
-                CourseSchedule.course_id == course.id,
-                CourseSchedule.room_id == room.id,
-                CourseSchedule.timeslot_id == timeslot.id,
-            )
-        ).first()
+        existing = schedules.get((course.id, room.id, timeslot.id))
         payload = {
             "course_id": course.id,
             "room_id": room.id,
@@ -2157,8 +2335,10 @@ def _ensure_course_schedules(
             "start_offset_minutes": item.get("start_offset_minutes"),
         }
         if not existing:
-            session.add(CourseSchedule(**payload))
-            session.commit()
+            schedule = CourseSchedule(**payload)
+            schedules[(course.id, room.id, timeslot.id)] = schedule
+            session.add(schedule)
+            dirty = True
         else:
             updated = False
             if existing.duration_minutes != payload["duration_minutes"]:
@@ -2172,224 +2352,254 @@ def _ensure_course_schedules(
                 updated = True
             if updated:
                 session.add(existing)
-                session.commit()
+                dirty = True
+    if dirty:
+        session.flush()
+
+
+_STUDENT_SEED_DATA: tuple[Dict[str, Any], ...] = (
+    # INGENIERÍA EN SISTEMAS (10 estudiantes)
+    {"email": "estudiante1@academiapro.dev", "full_name": "Carlos Méndez",
+     "password": "student123", "enrollment_year": 2023, "program_code": "ING-SIS",
+     "registration_number": "2023-001", "section": "A", "current_term": "2025-1"},
+    {"email": "estudiante4@academiapro.dev", "full_name": "Lucía Andrade",
+     "password": "student123", "enrollment_year": 2023, "program_code": "ING-SIS",
+     "registration_number": "2023-005", "section": "B", "current_term": "2025-1"},
+    {"email": "estudiante7@academiapro.dev", "full_name": "Mateo Calderón",
+     "password": "student123", "enrollment_year": 2022, "program_code": "ING-SIS",
+     "registration_number": "2022-030", "section": "A", "current_term": "2025-1"},
+    {"email": "estudiante9@academiapro.dev", "full_name": "Gabriel Soto",
+     "password": "student123", "enrollment_year": 2021, "program_code": "ING-SIS",
+     "registration_number": "2021-011", "section": "A", "current_term": "2025-1"},
+    {"email": "estudiante15@academiapro.dev", "full_name": "Isabella Torres",
+     "password": "student123", "enrollment_year": 2024, "program_code": "ING-SIS",
+     "registration_number": "2024-018", "section": "A", "current_term": "2025-1"},
+    {"email": "estudiante16@academiapro.dev", "full_name": "Sebastián Vargas",
+     "password": "student123", "enrollment_year": 2024, "program_code": "ING-SIS",
+     "registration_number": "2024-022", "section": "B", "current_term": "2025-1"},
+    {"email": "estudiante17@academiapro.dev", "full_name": "Camila Rojas",
+     "password": "student123", "enrollment_year": 2023, "program_code": "ING-SIS",
+     "registration_number": "2023-035", "section": "A", "current_term": "2025-1"},
+    {"email": "estudiante18@academiapro.dev", "full_name": "Andrés Moreno",
+     "password": "student123", "enrollment_year": 2022, "program_code": "ING-SIS",
+     "registration_number": "2022-041", "section": "B", "current_term": "2025-1"},
+    {"email": "estudiante19@academiapro.dev", "full_name": "Valentina Silva",
+     "password": "student123", "enrollment_year": 2024, "program_code": "ING-SIS",
+     "registration_number": "2024-029", "section": "A", "current_term": "2025-1"},
+    {"email": "estudiante20@academiapro.dev", "full_name": "Daniel Castro",
+     "password": "student123", "enrollment_year": 2023, "program_code": "ING-SIS",
+     "registration_number": "2023-047", "section": "B", "current_term": "2025-1"},
+
+    # ADMINISTRACIÓN DE EMPRESAS (10 estudiantes)
+    {"email": "estudiante2@academiapro.dev", "full_name": "María González",
+     "password": "student123", "enrollment_year": 2022, "program_code": "ADM-EMP",
+     "registration_number": "2022-014", "section": "A", "current_term": "2025-1"},
+    {"email": "estudiante5@academiapro.dev", "full_name": "Jorge Morales",
+     "password": "student123", "enrollment_year": 2021, "program_code": "ADM-EMP",
+     "registration_number": "2021-022", "section": "A", "current_term": "2025-1"},
+    {"email": "estudiante8@academiapro.dev", "full_name": "Anaís Herrera",
+     "password": "student123", "enrollment_year": 2023, "program_code": "ADM-EMP",
+     "registration_number": "2023-018", "section": "B", "current_term": "2025-1"},
+    {"email": "estudiante11@academiapro.dev", "full_name": "Héctor Vidal",
+     "password": "student123", "enrollment_year": 2024, "program_code": "ADM-EMP",
+     "registration_number": "2024-006", "section": "A", "current_term": "2025-1"},
+    {"email": "estudiante21@academiapro.dev", "full_name": "Sofía Martínez",
+     "password": "student123", "enrollment_year": 2024, "program_code": "ADM-EMP",
+     "registration_number": "2024-015", "section": "A", "current_term": "2025-1"},
+    {"email": "estudiante22@academiapro.dev", "full_name": "Nicolás Jiménez",
+     "password": "student123", "enrollment_year": 2023, "program_code": "ADM-EMP",
+     "registration_number": "2023-027", "section": "A", "current_term": "2025-1"},
+    {"email": "estudiante23@academiapro.dev", "full_name": "Laura Peña",
+     "password": "student123", "enrollment_year": 2022, "program_code": "ADM-EMP",
+     "registration_number": "2022-033", "section": "B", "current_term": "2025-1"},
+    {"email": "estudiante24@academiapro.dev", "full_name": "Felipe Romero",
+     "password": "student123", "enrollment_year": 2024, "program_code": "ADM-EMP",
+     "registration_number": "2024-042", "section": "A", "current_term": "2025-1"},
+    {"email": "estudiante25@academiapro.dev", "full_name": "Amanda Córdoba",
+     "password": "student123", "enrollment_year": 2023, "program_code": "ADM-EMP",
+     "registration_number": "2023-051", "section": "B", "current_term": "2025-1"},
+    {"email": "estudiante26@academiapro.dev", "full_name": "Ricardo Núñez",
+     "password": "student123", "enrollment_year": 2022, "program_code": "ADM-EMP",
+     "registration_number": "2022-058", "section": "A", "current_term": "2025-1"},
+
+    # CIENCIA DE DATOS AVANZADA (8 estudiantes)
+    {"email": "estudiante3@academiapro.dev", "full_name": "Diego Salazar",
+     "password": "student123", "enrollment_year": 2024, "program_code": "DS-AV",
+     "registration_number": "2024-009", "section": "A", "current_term": "2025-1"},
+    {"email": "estudiante6@academiapro.dev", "full_name": "Paula Rivas",
+     "password": "student123", "enrollment_year": 2024, "program_code": "DS-AV",
+     "registration_number": "2024-012", "section": "A", "current_term": "2025-1"},
+    {"email": "estudiante10@academiapro.dev", "full_name": "Rebeca Lozano",
+     "password": "student123", "enrollment_year": 2024, "program_code": "DS-AV",
+     "registration_number": "2024-027", "section": "A", "current_term": "2025-1"},
+    {"email": "estudiante12@academiapro.dev", "full_name": "Sofía Beltrán",
+     "password": "student123", "enrollment_year": 2023, "program_code": "DS-AV",
+     "registration_number": "2023-020", "section": "A", "current_term": "2025-1"},
+    {"email": "estudiante27@academiapro.dev", "full_name": "Bruno Mendoza",
+     "password": "student123", "enrollment_year": 2024, "program_code": "DS-AV",
+     "registration_number": "2024-035", "section": "A", "current_term": "2025-1"},
+    {"email": "estudiante28@academiapro.dev", "full_name": "Carla Espinoza",
+     "password": "student123", "enrollment_year": 2023, "program_code": "DS-AV",
+     "registration_number": "2023-044", "section": "A", "current_term": "2025-1"},
+    {"email": "estudiante29@academiapro.dev", "full_name": "Emilio Gutiérrez",
+     "password": "student123", "enrollment_year": 2024, "program_code": "DS-AV",
+     "registration_number": "2024-051", "section": "A", "current_term": "2025-1"},
+    {"email": "estudiante30@academiapro.dev", "full_name": "Natalia Ponce",
+     "password": "student123", "enrollment_year": 2024, "program_code": "DS-AV",
+     "registration_number": "2024-063", "section": "A", "current_term": "2025-1"},
+
+    # INGENIERÍA INDUSTRIAL (10 estudiantes)
+    {"email": "estudiante13@academiapro.dev", "full_name": "Valentina Cruz",
+     "password": "student123", "enrollment_year": 2022, "program_code": "ING-IND",
+     "registration_number": "2022-034", "section": "A", "current_term": "2025-1"},
+    {"email": "estudiante14@academiapro.dev", "full_name": "Luis Herrera",
+     "password": "student123", "enrollment_year": 2023, "program_code": "ING-IND",
+     "registration_number": "2023-041", "section": "A", "current_term": "2025-1"},
+    {"email": "estudiante31@academiapro.dev", "full_name": "Martina Delgado",
+     "password": "student123", "enrollment_year": 2024, "program_code": "ING-IND",
+     "registration_number": "2024-021", "section": "A", "current_term": "2025-1"},
+    {"email": "estudiante32@academiapro.dev", "full_name": "Rodrigo Paredes",
+     "password": "student123", "enrollment_year": 2023, "program_code": "ING-IND",
+     "registration_number": "2023-038", "section": "A", "current_term": "2025-1"},
+    {"email": "estudiante33@academiapro.dev", "full_name": "Julieta Salas",
+     "password": "student123", "enrollment_year": 2024, "program_code": "ING-IND",
+     "registration_number": "2024-045", "section": "A", "current_term": "2025-1"},
+    {"email": "estudiante34@academiapro.dev", "full_name": "Tomás Villanueva",
+     "password": "student123", "enrollment_year": 2022, "program_code": "ING-IND",
+     "registration_number": "2022-052", "section": "A", "current_term": "2025-1"},
+    {"email": "estudiante35@academiapro.dev", "full_name": "Renata Ortiz",
+     "password": "student123", "enrollment_year": 2024, "program_code": "ING-IND",
+     "registration_number": "2024-059", "section": "A", "current_term": "2025-1"},
+    {"email": "estudiante36@academiapro.dev", "full_name": "Samuel Medina",
+     "password": "student123", "enrollment_year": 2023, "program_code": "ING-IND",
+     "registration_number": "2023-066", "section": "A", "current_term": "2025-1"},
+    {"email": "estudiante37@academiapro.dev", "full_name": "Catalina Bravo",
+     "password": "student123", "enrollment_year": 2024, "program_code": "ING-IND",
+     "registration_number": "2024-073", "section": "A", "current_term": "2025-1"},
+    {"email": "estudiante38@academiapro.dev", "full_name": "Maximiliano León",
+     "password": "student123", "enrollment_year": 2023, "program_code": "ING-IND",
+     "registration_number": "2023-080", "section": "A", "current_term": "2025-1"},
+)
 
 
-def _ensure_students(session: Session, program_map: Dict[str, Program]) -> Dict[str, Student]:
-    data = [
-        # INGENIERÍA EN SISTEMAS (10 estudiantes)
-        {"email": "estudiante1@academiapro.dev", "full_name": "Carlos Méndez", 
-         "password": "student123", "enrollment_year": 2023, "program_code": "ING-SIS",
-         "registration_number": "2023-001", "section": "A", "current_term": "2025-1"},
-        {"email": "estudiante4@academiapro.dev", "full_name": "Lucía Andrade", 
-         "password": "student123", "enrollment_year": 2023, "program_code": "ING-SIS",
-         "registration_number": "2023-005", "section": "B", "current_term": "2025-1"},
-        {"email": "estudiante7@academiapro.dev", "full_name": "Mateo Calderón", 
-         "password": "student123", "enrollment_year": 2022, "program_code": "ING-SIS",
-         "registration_number": "2022-030", "section": "A", "current_term": "2025-1"},
-        {"email": "estudiante9@academiapro.dev", "full_name": "Gabriel Soto", 
-         "password": "student123", "enrollment_year": 2021, "program_code": "ING-SIS",
-         "registration_number": "2021-011", "section": "A", "current_term": "2025-1"},
-        {"email": "estudiante15@academiapro.dev", "full_name": "Isabella Torres", 
-         "password": "student123", "enrollment_year": 2024, "program_code": "ING-SIS",
-         "registration_number": "2024-018", "section": "A", "current_term": "2025-1"},
-        {"email": "estudiante16@academiapro.dev", "full_name": "Sebastián Vargas", 
-         "password": "student123", "enrollment_year": 2024, "program_code": "ING-SIS",
-         "registration_number": "2024-022", "section": "B", "current_term": "2025-1"},
-        {"email": "estudiante17@academiapro.dev", "full_name": "Camila Rojas", 
-         "password": "student123", "enrollment_year": 2023, "program_code": "ING-SIS",
-         "registration_number": "2023-035", "section": "A", "current_term": "2025-1"},
-        {"email": "estudiante18@academiapro.dev", "full_name": "Andrés Moreno", 
-         "password": "student123", "enrollment_year": 2022, "program_code": "ING-SIS",
-         "registration_number": "2022-041", "section": "B", "current_term": "2025-1"},
-        {"email": "estudiante19@academiapro.dev", "full_name": "Valentina Silva", 
-         "password": "student123", "enrollment_year": 2024, "program_code": "ING-SIS",
-         "registration_number": "2024-029", "section": "A", "current_term": "2025-1"},
-        {"email": "estudiante20@academiapro.dev", "full_name": "Daniel Castro", 
-         "password": "student123", "enrollment_year": 2023, "program_code": "ING-SIS",
-         "registration_number": "2023-047", "section": "B", "current_term": "2025-1"},
-        
-        # ADMINISTRACIÓN DE EMPRESAS (10 estudiantes)
-        {"email": "estudiante2@academiapro.dev", "full_name": "María González", 
-         "password": "student123", "enrollment_year": 2022, "program_code": "ADM-EMP",
-         "registration_number": "2022-014", "section": "A", "current_term": "2025-1"},
-        {"email": "estudiante5@academiapro.dev", "full_name": "Jorge Morales", 
-         "password": "student123", "enrollment_year": 2021, "program_code": "ADM-EMP",
-         "registration_number": "2021-022", "section": "A", "current_term": "2025-1"},
-        {"email": "estudiante8@academiapro.dev", "full_name": "Anaís Herrera", 
-         "password": "student123", "enrollment_year": 2023, "program_code": "ADM-EMP",
-         "registration_number": "2023-018", "section": "B", "current_term": "2025-1"},
-        {"email": "estudiante11@academiapro.dev", "full_name": "Héctor Vidal", 
-         "password": "student123", "enrollment_year": 2024, "program_code": "ADM-EMP",
-         "registration_number": "2024-006", "section": "A", "current_term": "2025-1"},
-        {"email": "estudiante21@academiapro.dev", "full_name": "Sofía Martínez", 
-         "password": "student123", "enrollment_year": 2024, "program_code": "ADM-EMP",
-         "registration_number": "2024-015", "section": "A", "current_term": "2025-1"},
-        {"email": "estudiante22@academiapro.dev", "full_name": "Nicolás Jiménez", 
-         "password": "student123", "enrollment_year": 2023, "program_code": "ADM-EMP",
-         "registration_number": "2023-027", "section": "A", "current_term": "2025-1"},
-        {"email": "estudiante23@academiapro.dev", "full_name": "Laura Peña", 
-         "password": "student123", "enrollment_year": 2022, "program_code": "ADM-EMP",
-         "registration_number": "2022-033", "section": "B", "current_term": "2025-1"},
-        {"email": "estudiante24@academiapro.dev", "full_name": "Felipe Romero", 
-         "password": "student123", "enrollment_year": 2024, "program_code": "ADM-EMP",
-         "registration_number": "2024-042", "section": "A", "current_term": "2025-1"},
-        {"email": "estudiante25@academiapro.dev", "full_name": "Amanda Córdoba", 
-         "password": "student123", "enrollment_year": 2023, "program_code": "ADM-EMP",
-         "registration_number": "2023-051", "section": "B", "current_term": "2025-1"},
-        {"email": "estudiante26@academiapro.dev", "full_name": "Ricardo Núñez", 
-         "password": "student123", "enrollment_year": 2022, "program_code": "ADM-EMP",
-         "registration_number": "2022-058", "section": "A", "current_term": "2025-1"},
-        
-        # CIENCIA DE DATOS AVANZADA (8 estudiantes)
-        {"email": "estudiante3@academiapro.dev", "full_name": "Diego Salazar", 
-         "password": "student123", "enrollment_year": 2024, "program_code": "DS-AV",
-         "registration_number": "2024-009", "section": "A", "current_term": "2025-1"},
-        {"email": "estudiante6@academiapro.dev", "full_name": "Paula Rivas", 
-         "password": "student123", "enrollment_year": 2024, "program_code": "DS-AV",
-         "registration_number": "2024-012", "section": "A", "current_term": "2025-1"},
-        {"email": "estudiante10@academiapro.dev", "full_name": "Rebeca Lozano", 
-         "password": "student123", "enrollment_year": 2024, "program_code": "DS-AV",
-         "registration_number": "2024-027", "section": "A", "current_term": "2025-1"},
-        {"email": "estudiante12@academiapro.dev", "full_name": "Sofía Beltrán", 
-         "password": "student123", "enrollment_year": 2023, "program_code": "DS-AV",
-         "registration_number": "2023-020", "section": "A", "current_term": "2025-1"},
-        {"email": "estudiante27@academiapro.dev", "full_name": "Bruno Mendoza", 
-         "password": "student123", "enrollment_year": 2024, "program_code": "DS-AV",
-         "registration_number": "2024-035", "section": "A", "current_term": "2025-1"},
-        {"email": "estudiante28@academiapro.dev", "full_name": "Carla Espinoza", 
-         "password": "student123", "enrollment_year": 2023, "program_code": "DS-AV",
-         "registration_number": "2023-044", "section": "A", "current_term": "2025-1"},
-        {"email": "estudiante29@academiapro.dev", "full_name": "Emilio Gutiérrez", 
-         "password": "student123", "enrollment_year": 2024, "program_code": "DS-AV",
-         "registration_number": "2024-051", "section": "A", "current_term": "2025-1"},
-        {"email": "estudiante30@academiapro.dev", "full_name": "Natalia Ponce", 
-         "password": "student123", "enrollment_year": 2024, "program_code": "DS-AV",
-         "registration_number": "2024-063", "section": "A", "current_term": "2025-1"},
-        
-        # INGENIERÍA INDUSTRIAL (10 estudiantes)
-        {"email": "estudiante13@academiapro.dev", "full_name": "Valentina Cruz", 
-         "password": "student123", "enrollment_year": 2022, "program_code": "ING-IND",
-         "registration_number": "2022-034", "section": "A", "current_term": "2025-1"},
-        {"email": "estudiante14@academiapro.dev", "full_name": "Luis Herrera", 
-         "password": "student123", "enrollment_year": 2023, "program_code": "ING-IND",
-         "registration_number": "2023-041", "section": "A", "current_term": "2025-1"},
-        {"email": "estudiante31@academiapro.dev", "full_name": "Martina Delgado", 
-         "password": "student123", "enrollment_year": 2024, "program_code": "ING-IND",
-         "registration_number": "2024-021", "section": "A", "current_term": "2025-1"},
-        {"email": "estudiante32@academiapro.dev", "full_name": "Rodrigo Paredes", 
-         "password": "student123", "enrollment_year": 2023, "program_code": "ING-IND",
-         "registration_number": "2023-038", "section": "A", "current_term": "2025-1"},
-        {"email": "estudiante33@academiapro.dev", "full_name": "Julieta Salas", 
-         "password": "student123", "enrollment_year": 2024, "program_code": "ING-IND",
-         "registration_number": "2024-045", "section": "A", "current_term": "2025-1"},
-        {"email": "estudiante34@academiapro.dev", "full_name": "Tomás Villanueva", 
-         "password": "student123", "enrollment_year": 2022, "program_code": "ING-IND",
-         "registration_number": "2022-052", "section": "A", "current_term": "2025-1"},
-        {"email": "estudiante35@academiapro.dev", "full_name": "Renata Ortiz", 
-         "password": "student123", "enrollment_year": 2024, "program_code": "ING-IND",
-         "registration_number": "2024-059", "section": "A", "current_term": "2025-1"},
-        {"email": "estudiante36@academiapro.dev", "full_name": "Samuel Medina", 
-         "password": "student123", "enrollment_year": 2023, "program_code": "ING-IND",
-         "registration_number": "2023-066", "section": "A", "current_term": "2025-1"},
-        {"email": "estudiante37@academiapro.dev", "full_name": "Catalina Bravo", 
-         "password": "student123", "enrollment_year": 2024, "program_code": "ING-IND",
-         "registration_number": "2024-073", "section": "A", "current_term": "2025-1"},
-        {"email": "estudiante38@academiapro.dev", "full_name": "Maximiliano León", 
-         "password": "student123", "enrollment_year": 2023, "program_code": "ING-IND",
-         "registration_number": "2023-080", "section": "A", "current_term": "2025-1"},
-    ]
-
-    mapping: Dict[str, Student] = {}
-    for item in data:
-        user = _get_or_create_user(
+def _ensure_students(
+    session: Session,
+    program_map: Dict[str, Program],
+    user_cache: Dict[str, User],
+) -> Dict[str, Student]:
+    _prefetch_users(session, user_cache, [item["email"] for item in _STUDENT_SEED_DATA])
+    _insert_missing_users(session, user_cache, _STUDENT_SEED_DATA, "student")
+    users = [
+        _get_or_create_user(
             session,
             email=item["email"],
             full_name=item["full_name"],
             role="student",
             password=item["password"],
+            user_cache=user_cache,
         )
-        student = session.exec(select(Student).where(Student.user_id == user.id)).first()
+        for item in _STUDENT_SEED_DATA
+    ]
+    user_ids = [user.id for user in users]
+    by_user_id: Dict[int, Student] = {}
+    # El seeder solo usa estas columnas; current_term se carga para no emitir UPDATE si no cambia.
+    existing_students = session.exec(
+        select(Student)
+        .options(load_only(Student.id, Student.user_id, Student.program_id, Student.current_term))
+        .where(Student.user_id.in_(user_ids))
+    ).all()
+    for student in existing_students:
+        by_user_id.setdefault(student.user_id, student)
+
+    mapping: Dict[str, Student] = {}
+    new_students: List[Student] = []
+    updated = False
+    for item, user_id in zip(_STUDENT_SEED_DATA, user_ids):
+        program = program_map.get(item["program_code"])
+        student = by_user_id.get(user_id)
         if not student:
-            program = program_map.get(item["program_code"])
             if not program:
                 continue
             student = Student(
-                user_id=user.id,
+                user_id=user_id,
                 enrollment_year=item["enrollment_year"],
-                program_id=program.id if program else None,
+                program_id=program.id,
                 registration_number=item["registration_number"],
                 section=item["section"],
                 current_term=item["current_term"],
                 modality=ModalityEnum.in_person,
                 status=StudentStatusEnum.active,
             )
+            new_students.append(student)
+        elif student.program_id is None and program:
+            student.program_id = program.id
             session.add(student)
-            session.commit()
-            session.refresh(student)
-        elif student.program_id is None:
-            program = program_map.get(item["program_code"])
-            if program:
-                student.program_id = program.id
-                session.add(student)
-                session.commit()
+            updated = True
         mapping[item["email"]] = student
+
+    if new_students:
+        session.add_all(new_students)
+    if new_students or updated:
+        # flush() asigna los ids de los nuevos estudiantes sin necesidad de refresh().
+        session.flush()
     return mapping
 
 
+_ENROLLMENT_PLAN: Mapping[str, tuple[str, ...]] = MappingProxyType({
+    "estudiante1@academiapro.dev": ("MAT101-2025-1-A", "BD301-2025-1-A"),
+    "estudiante2@academiapro.dev": ("ADM120-2025-1-A", "ADM210-2025-1-A"),
+    "estudiante3@academiapro.dev": ("DS501-2025-1-A", "DS530-2025-1-A"),
+    "estudiante4@academiapro.dev": ("MAT101-2025-1-B", "SIS320-2025-1-A", "PRO201-2025-1-A"),
+    "estudiante5@academiapro.dev": ("ADM210-2025-1-A", "ADM315-2025-1-A"),
+    "estudiante6@academiapro.dev": ("DS510-2025-1-A", "DS530-2025-1-A"),
+    "estudiante7@academiapro.dev": ("MAT101-2025-1-A", "PRO201-2025-1-B"),
+    "estudiante8@academiapro.dev": ("ADM120-2025-1-A", "ADM315-2025-1-A"),
+    "estudiante9@academiapro.dev": ("MAT101-2025-1-B", "BD301-2025-1-A", "SIS320-2025-1-A", "PRO201-2025-1-A"),
+    "estudiante10@academiapro.dev": ("DS501-2025-1-A", "DS510-2025-1-A"),
+    "estudiante11@academiapro.dev": ("ADM210-2025-1-A", "ADM315-2025-1-A"),
+    "estudiante12@academiapro.dev": ("DS510-2025-1-A", "DS530-2025-1-A"),
+    "estudiante13@academiapro.dev": ("IND130-2025-1-A", "IND240-2025-1-A"),
+    "estudiante14@academiapro.dev": ("IND130-2025-1-A",),
+    "estudiante16@academiapro.dev": ("PRO201-2025-1-B", "ALG201-2025-1-A"),
+})
+
+
 def _ensure_enrollments(
     session: Session,
     student_map: Dict[str, Student],
     course_map: Dict[str, Course],
-) -> Dict[str, Enrollment]:
-    enrollment_plan = {
-        "estudiante1@academiapro.dev": ["MAT101-2025-1-A", "BD301-2025-1-A"],
-        "estudiante2@academiapro.dev": ["ADM120-2025-1-A", "ADM210-2025-1-A"],
-        "estudiante3@academiapro.dev": ["DS501-2025-1-A", "DS530-2025-1-A"],
-        "estudiante4@academiapro.dev": ["MAT101-2025-1-B", "SIS320-2025-1-A", "PRO201-2025-1-A"],
-        "estudiante5@academiapro.dev": ["ADM210-2025-1-A", "ADM315-2025-1-A"],
-        "estudiante6@academiapro.dev": ["DS510-2025-1-A", "DS530-2025-1-A"],
-        "estudiante7@academiapro.dev": ["MAT101-2025-1-A", "PRO201-2025-1-B"],
-        "estudiante8@academiapro.dev": ["ADM120-2025-1-A", "ADM315-2025-1-A"],
-        "estudiante9@academiapro.dev": ["MAT101-2025-1-B", "BD301-2025-1-A", "SIS320-2025-1-A", "PRO201-2025-1-A"],
-        "estudiante10@academiapro.dev": ["DS501-2025-1-A", "DS510-2025-1-A"],
-        "estudiante11@academiapro.dev": ["ADM210-2025-1-A", "ADM315-2025-1-A"],
-    "estudiante12@academiapro.dev": ["DS510-2025-1-A", "DS530-2025-1-A"],
-        "estudiante13@academiapro.dev": ["IND130-2025-1-A", "IND240-2025-1-A"],
-        "estudiante14@academiapro.dev": ["IND130-2025-1-A"],
-    "estudiante16@academiapro.dev": ["PRO201-2025-1-B", "ALG201-2025-1-A"],
-    }
-
-    data = [
-        {"student_email": email, "course_key": course_key}
-        for email, courses in enrollment_plan.items()
+) -> Dict[tuple[str, str], Enrollment]:
+    # Descarta en memoria los pares sin estudiante o curso antes de tocar la base de datos.
+    valid_items = [
+        (email, course_key)
+        for email, courses in _ENROLLMENT_PLAN.items()
+        if email in student_map
         for course_key in courses
+        if course_key in course_map
     ]
+    keys_by_pair: Dict[tuple[int, int], tuple[str, str]] = {
+        (student_map[email].id, course_map[course_key].id): (email, course_key)
+        for email, course_key in valid_items
+    }
+    pairs = list(keys_by_pair)
+
+    mapping: Dict[tuple[str, str], Enrollment] = {}
+    if not pairs:
+        return mapping
+
+    _seed_table(
+        session,
+        Enrollment,
+        [
+            {"student_id": student_id, "course_id": course_id, "status": EnrollmentStatusEnum.enrolled}
+            for student_id, course_id in pairs
+        ],
+        ("student_id", "course_id"),
+    )
 
-    mapping: Dict[str, Enrollment] = {}
-    for item in data:
-        student = student_map.get(item["student_email"])
-        course = course_map.get(item["course_key"])
-        if not student or not course:
-            continue
-
-        enrollment = session.exec(
-            select(Enrollment).where(
-                Enrollment.student_id == student.id,
-                Enrollment.course_id == course.id,
-            )
-        ).first()
-        if not enrollment:
-            enrollment = Enrollment(
-                student_id=student.id,
-                course_id=course.id,
-                status=EnrollmentStatusEnum.enrolled,
-            )
-            session.add(enrollment)
-            session.commit()
-            session.refresh(enrollment)
-        key = f"{item['student_email']}|{item['course_key']}"
-        mapping[key] = enrollment
+    pair_filter = tuple_(Enrollment.student_id, Enrollment.course_id).in_(pairs)
+    for enrollment in session.exec(select(Enrollment).where(pair_filter)).all():
+        mapping[keys_by_pair[(enrollment.student_id, enrollment.course_id)]] = enrollment
     return mapping
 
 
@@ -2410,6 +2620,26 @@ def _ensure_student_program_enrollments(
 
     program_code_by_id = {program.id: code for code, program in program_map.items()}
 
+    # Semestres de los cursos inscritos y matrículas por programa de todos los estudiantes, en dos consultas.
+    student_ids = [student.id for student in student_map.values()]
+    enrolled_semesters: Dict[int, List[int]] = {}
+    records_by_student: Dict[int, List[StudentProgramEnrollment]] = {}
+    if student_ids:
+        semester_rows = session.exec(
+            select(Enrollment.student_id, Course.program_semester_id)
+            .join(Course, Enrollment.course_id == Course.id)
+            .where(Enrollment.student_id.in_(student_ids))
+        ).all()
+        for student_id, semester_id in semester_rows:
+            enrolled_semesters.setdefault(student_id, []).append(semester_id)
+        program_records = session.exec(
+            select(StudentProgramEnrollment)
+            .where(StudentProgramEnrollment.student_id.in_(student_ids))
+            .order_by(StudentProgramEnrollment.id)
+        ).all()
+        for record in program_records:
+            records_by_student.setdefault(record.student_id, []).append(record)
+
     for email, student in student_map.items():
         program_code = program_code_by_id.get(student.program_id)
         if not program_code:
@@ -2421,14 +2651,8 @@ def _ensure_student_program_enrollments(
             target_semester = semester_map.get(f"{program_code}:{manual_number}")
 
         if not target_semester:
-            enrollment_rows = session.exec(
-                select(Course.program_semester_id)
-                .join(Enrollment, Enrollment.course_id == Course.id)
-                .where(Enrollment.student_id == student.id)
-            ).all()
             semester_candidates: List[ProgramSemester] = []
-            for row in enrollment_rows:
-                semester_id = row[0] if isinstance(row, tuple) else row
+            for semester_id in enrolled_semesters.get(student.id, ()):
                 if semester_id:
                     semester_obj = session.get(ProgramSemester, semester_id)
                     if semester_obj and semester_obj.program_id == student.program_id:
@@ -2443,9 +2667,7 @@ def _ensure_student_program_enrollments(
         if not target_semester:
             continue
 
-        existing_records = session.exec(
-            select(StudentProgramEnrollment).where(StudentProgramEnrollment.student_id == student.id)
-        ).all()
+        existing_records = records_by_student.get(student.id, [])
         now = datetime.utcnow()
         target_record = next((record for record in existing_records if record.program_semester_id == target_semester.id), None)
 
@@ -2476,7 +2698,7 @@ def _ensure_student_program_enrollments(
             student.current_term = f"Semestre {target_semester.semester_number}"
         session.add(student)
 
-    session.commit()
+    session.flush()
 
 
 def _ensure_assignments(
@@ -2565,18 +2787,21 @@ def _ensure_assignments(
         },
     ]
 
+    course_ids = {course_map[item["course_key"]].id for item in data if item["course_key"] in course_map}
+    existing: Dict[tuple[int, str], Assignment] = {}
+    if course_ids:
+        for assignment in session.exec(
+            select(Assignment).where(Assignment.course_id.in_(course_ids)).order_by(Assignment.id)
+        ).all():
+            existing.setdefault((assignment.course_id, assignment.title), assignment)
+
     mapping: Dict[str, Assignment] = {}
     for item in data:
         course = course_map.get(item["course_key"])
         if not course:
             continue
 
-        assignment = session.exec(
-            select(Assignment).where(
-                Assignment.course_id == course.id,
-                Assignment.title == item["title"],
-            )
-        ).first()
+        assignment = existing.get((course.id, item["title"]))
 
         payload = {
             "instructions": item.get("instructions"),
@@ -2599,9 +2824,8 @@ def _ensure_assignments(
                 title=item["title"],
                 **payload,
             )
+            existing[(course.id, item["title"])] = assignment
             session.add(assignment)
-            session.commit()
-            session.refresh(assignment)
         else:
             updated = False
             if assignment.teacher_id != course.teacher_id:
@@ -2613,17 +2837,18 @@ def _ensure_assignments(
                     updated = True
             if updated:
                 session.add(assignment)
-                session.commit()
 
         mapping[f"{item['course_key']}|{item['title']}"] = assignment
 
+    # Un único flush asigna los ids que usan las entregas.
+    session.flush()
     return mapping
 
 
 def _ensure_assignment_submissions(
     session: Session,
     assignment_map: Dict[str, Assignment],
-    enrollment_map: Dict[str, Enrollment],
+    enrollment_map: Dict[tuple[str, str], Enrollment],
     student_map: Dict[str, Student],
 ) -> None:
     data = [
@@ -2698,19 +2923,25 @@ def _ensure_assignment_submissions(
         },
     ]
 
+    pairs = {
+        (assignment_map[item["assignment_key"]].id, enrollment_map[(item["student_email"], item["course_key"])].id)
+        for item in data
+        if item["assignment_key"] in assignment_map and (item["student_email"], item["course_key"]) in enrollment_map
+    }
+    existing: Dict[tuple[int, int], AssignmentSubmission] = {}
+    if pairs:
+        pair_filter = tuple_(AssignmentSubmission.assignment_id, AssignmentSubmission.enrollment_id).in_(pairs)
+        for submission in session.exec(select(AssignmentSubmission).where(pair_filter)).all():
+            existing[(submission.assignment_id, submission.enrollment_id)] = submission
+
     for item in data:
         assignment = assignment_map.get(item["assignment_key"])
         student = student_map.get(item["student_email"])
-        enrollment = enrollment_map.get(f"{item['student_email']}|{item['course_key']}")
+        enrollment = enrollment_map.get((item["student_email"], item["course_key"]))
         if not assignment or not student or not enrollment:
             continue
 
-        submission = session.exec(
-            select(AssignmentSubmission).where(
-                AssignmentSubmission.assignment_id == assignment.id,
-                AssignmentSubmission.enrollment_id == enrollment.id,
-            )
-        ).first()
+        submission = existing.get((assignment.id, enrollment.id))
 
         payload = {
             "student_id": student.id,
@@ -2732,171 +2963,155 @@ def _ensure_assignment_submissions(
                 enrollment_id=enrollment.id,
                 **payload,
             )
+            existing[(assignment.id, enrollment.id)] = submission
             session.add(submission)
-            session.commit()
         else:
-            updated = False
             for field, value in payload.items():
                 if getattr(submission, field) != value:
                     setattr(submission, field, value)
-                    updated = True
-            if updated:
-                session.add(submission)
-                session.commit()
+    session.flush()
+
+
+_EVALUATION_SEED_DATA: tuple[Dict[str, Any], ...] = (
+    {
+        "course_key": "MAT101-2025-1-A",
+        "name": "Parcial 1",
+        "weight": 0.3,
+        "scheduled_at": datetime(2025, 3, 15, 9, 0),
+    },
+    {
+        "course_key": "MAT101-2025-1-A",
+        "name": "Proyecto Final",
+        "weight": 0.4,
+        "scheduled_at": datetime(2025, 5, 20, 8, 0),
+    },
+    {
+        "course_key": "PRO201-2025-1-A",
+        "name": "Sprint Demo",
+        "weight": 0.5,
+        "scheduled_at": datetime(2025, 4, 10, 10, 0),
+    },
+    {
+        "course_key": "DS501-2025-1-A",
+        "name": "Caso Práctico",
+        "weight": 0.6,
+        "scheduled_at": datetime(2025, 4, 22, 18, 0),
+    },
+    {
+        "course_key": "IND130-2025-1-A",
+        "name": "Proyecto de Mejora",
+        "weight": 0.35,
+        "scheduled_at": datetime(2025, 4, 18, 18, 30),
+    },
+    {
+        "course_key": "IND240-2025-1-A",
+        "name": "Simulación Logística",
+        "weight": 0.4,
+        "scheduled_at": datetime(2025, 5, 8, 19, 0),
+    },
+)
+
 
 def _ensure_evaluations(
     session: Session,
     course_map: Dict[str, Course],
-) -> Dict[str, Evaluation]:
-    data = [
-        {
-            "course_key": "MAT101-2025-1-A",
-            "name": "Parcial 1",
-            "weight": 0.3,
-            "scheduled_at": datetime(2025, 3, 15, 9, 0),
-        },
-        {
-            "course_key": "MAT101-2025-1-A",
-            "name": "Proyecto Final",
-            "weight": 0.4,
-            "scheduled_at": datetime(2025, 5, 20, 8, 0),
-        },
-        {
-            "course_key": "PRO201-2025-1-A",
-            "name": "Sprint Demo",
-            "weight": 0.5,
-            "scheduled_at": datetime(2025, 4, 10, 10, 0),
-        },
-        {
-            "course_key": "DS501-2025-1-A",
-            "name": "Caso Práctico",
-            "weight": 0.6,
-            "scheduled_at": datetime(2025, 4, 22, 18, 0),
-        },
-        {
-            "course_key": "IND130-2025-1-A",
-            "name": "Proyecto de Mejora",
-            "weight": 0.35,
-            "scheduled_at": datetime(2025, 4, 18, 18, 30),
-        },
-        {
-            "course_key": "IND240-2025-1-A",
-            "name": "Simulación Logística",
-            "weight": 0.4,
-            "scheduled_at": datetime(2025, 5, 8, 19, 0),
-        },
-    ]
-
-    mapping: Dict[str, Evaluation] = {}
-    for item in data:
-        course = course_map.get(item["course_key"])
-        if not course:
-            continue
+) -> Dict[tuple[str, str], Evaluation]:
+    wanted = {
+        (course_map[item["course_key"]].id, item["name"]): item
+        for item in _EVALUATION_SEED_DATA
+        if item["course_key"] in course_map
+    }
+    mapping: Dict[tuple[str, str], Evaluation] = {}
+    if not wanted:
+        return mapping
+
+    _seed_table(
+        session,
+        Evaluation,
+        [
+            {
+                "course_id": course_id,
+                "name": name,
+                "weight": item["weight"],
+                "scheduled_at": item["scheduled_at"],
+            }
+            for (course_id, name), item in wanted.items()
+        ],
+        ("course_id", "name"),
+    )
 
-        evaluation = session.exec(
-            select(Evaluation).where(
-                Evaluation.course_id == course.id,
-                Evaluation.name == item["name"],
-            )
-        ).first()
-        if not evaluation:
-            evaluation = Evaluation(
-                course_id=course.id,
-                name=item["name"],
-                weight=item["weight"],
-                scheduled_at=item["scheduled_at"],
-            )
-            session.add(evaluation)
-            session.commit()
-            session.refresh(evaluation)
-        key = f"{item['course_key']}|{item['name']}"
-        mapping[key] = evaluation
+    course_filter = Evaluation.course_id.in_({course_id for course_id, _ in wanted})
+    for evaluation in session.exec(select(Evaluation).where(course_filter)).all():
+        item = wanted.get((evaluation.course_id, evaluation.name))
+        if item:
+            mapping[(item["course_key"], item["name"])] = evaluation
     return mapping
 
 
+_GRADE_SEED_DATA: tuple[Dict[str, Any], ...] = (
+    {
+        "key": ("estudiante1@academiapro.dev", "MAT101-2025-1-A", "Parcial 1"),
+        "score": 87.0,
+    },
+    {
+        "key": ("estudiante4@academiapro.dev", "PRO201-2025-1-A", "Sprint Demo"),
+        "score": 92.0,
+    },
+    {
+        "key": ("estudiante3@academiapro.dev", "DS501-2025-1-A", "Caso Práctico"),
+        "score": 95.0,
+    },
+)
+
+
 def _ensure_grades(
     session: Session,
-    enrollment_map: Dict[str, Enrollment],
-    evaluation_map: Dict[str, Evaluation],
+    enrollment_map: Dict[tuple[str, str], Enrollment],
+    evaluation_map: Dict[tuple[str, str], Evaluation],
 ) -> None:
-    data = [
-        {
-            "key": ("estudiante1@academiapro.dev", "MAT101-2025-1-A", "Parcial 1"),
-            "score": 87.0,
-        },
-        {
-            "key": ("estudiante4@academiapro.dev", "PRO201-2025-1-A", "Sprint Demo"),
-            "score": 92.0,
-        },
+    # key = (email, curso, evaluación): [:2] indexa la matrícula y [1:] la evaluación.
+    rows = [
         {
-            "key": ("estudiante3@academiapro.dev", "DS501-2025-1-A", "Caso Práctico"),
-            "score": 95.0,
-        },
+            "enrollment_id": enrollment_map[entry["key"][:2]].id,
+            "evaluation_id": evaluation_map[entry["key"][1:]].id,
+            "score": entry["score"],
+        }
+        for entry in _GRADE_SEED_DATA
+        if entry["key"][:2] in enrollment_map and entry["key"][1:] in evaluation_map
     ]
-
-    for entry in data:
-        student_email, course_key, eval_name = entry["key"]
-        enrollment = enrollment_map.get(f"{student_email}|{course_key}")
-        evaluation = evaluation_map.get(f"{course_key}|{eval_name}")
-        if not enrollment or not evaluation:
-            continue
-
-        existing = session.exec(
-            select(Grade).where(
-                Grade.enrollment_id == enrollment.id,
-                Grade.evaluation_id == evaluation.id,
-            )
-        ).first()
-        if not existing:
-            session.add(
-                Grade(
-                    enrollment_id=enrollment.id,
-                    evaluation_id=evaluation.id,
-                    score=entry["score"],
-                )
-            )
-            session.commit()
+    _seed_table(session, Grade, rows, ("enrollment_id", "evaluation_id"))
+
+
+_ATTENDANCE_SEED_DATA: tuple[Dict[str, Any], ...] = (
+    {
+        "key": ("estudiante1@academiapro.dev", "MAT101-2025-1-A"),
+        "session_date": date(2025, 3, 5),
+        "present": True,
+    },
+    {
+        "key": ("estudiante1@academiapro.dev", "PRO201-2025-1-A"),
+        "session_date": date(2025, 3, 6),
+        "present": True,
+    },
+    {
+        "key": ("estudiante2@academiapro.dev", "ADM120-2025-1-A"),
+        "session_date": date(2025, 3, 7),
+        "present": False,
+    },
+)
 
 
-def _ensure_attendance(session: Session, enrollment_map: Dict[str, Enrollment]) -> None:
-    data = [
-        {
-            "key": "estudiante1@academiapro.dev|MAT101-2025-1-A",
-            "session_date": date(2025, 3, 5),
-            "present": True,
-        },
-        {
-            "key": "estudiante1@academiapro.dev|PRO201-2025-1-A",
-            "session_date": date(2025, 3, 6),
-            "present": True,
-        },
+def _ensure_attendance(session: Session, enrollment_map: Dict[tuple[str, str], Enrollment]) -> None:
+    rows = [
         {
-            "key": "estudiante2@academiapro.dev|ADM120-2025-1-A",
-            "session_date": date(2025, 3, 7),
-            "present": False,
-        },
+            "enrollment_id": enrollment_map[item["key"]].id,
+            "session_date": item["session_date"],
+            "present": item["present"],
+        }
+        for item in _ATTENDANCE_SEED_DATA
+        if item["key"] in enrollment_map
     ]
-
-    for item in data:
-        enrollment = enrollment_map.get(item["key"])
-        if not enrollment:
-            continue
-
-        existing = session.exec(
-            select(Attendance).where(
-                Attendance.enrollment_id == enrollment.id,
-                Attendance.session_date == item["session_date"],
-            )
-        ).first()
-        if not existing:
-            session.add(
-                Attendance(
-                    enrollment_id=enrollment.id,
-                    session_date=item["session_date"],
-                    present=item["present"],
-                )
-            )
-            session.commit()
+    _seed_table(session, Attendance, rows, ("enrollment_id", "session_date"))
 
 
 if __name__ == "__main__":
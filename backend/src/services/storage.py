@@ -1,11 +1,15 @@
+import asyncio
 import os
+from functools import lru_cache
 import re
+import secrets
+import shutil
+import string
 from pathlib import Path
-from typing import Optional
-from uuid import uuid4
+from typing import BinaryIO, Optional
 
 from fastapi import Depends, HTTPException, UploadFile
-from fastapi.responses import FileResponse, StreamingResponse
+from fastapi.responses import FileResponse, RedirectResponse
 from sqlmodel import Session
 
 from ..config import settings
@@ -14,14 +18,72 @@ from ..db import get_session
 
 try:  # Optional dependency
     import boto3  # type: ignore
+    from boto3.s3.transfer import TransferConfig  # type: ignore
+    from botocore.exceptions import ClientError  # type: ignore
 except ImportError:  # pragma: no cover - boto3 no disponible
     boto3 = None
+    TransferConfig = None
+    ClientError = None
 
 
 _PROJECT_ROOT = Path(__file__).resolve().parents[2]
 _ALLOWED_SCOPE = re.compile(r"[^a-z0-9_-]+")
 _ALLOWED_FILENAME = re.compile(r"[^A-Za-z0-9_.-]+")
+# Caracteres que las expresiones anteriores dejan intactos; permiten saltarse re.sub en nombres ya limpios.
+_SCOPE_CHARS = frozenset(string.ascii_lowercase + string.digits + "_-")
+_FILENAME_CHARS = frozenset(string.ascii_letters + string.digits + "_.-")
 _CHUNK_SIZE = 1024 * 1024
+_S3_PART_SIZE = 8 * 1024 * 1024
+_S3_PRESIGNED_URL_TTL = 300
+# Códigos con los que S3 (o compatibles como MinIO) informa que la clave no existe.
+_S3_MISSING_KEY_CODES = frozenset({"404", "NoSuchKey", "NotFound"})
+# Multipart por partes de 8 MiB: la memoria queda acotada sin importar el tamaño del archivo.
+_S3_TRANSFER_CONFIG = (
+    TransferConfig(multipart_threshold=_S3_PART_SIZE, multipart_chunksize=_S3_PART_SIZE, use_threads=True)
+    if TransferConfig is not None
+    else None
+)
+
+
+@lru_cache(maxsize=4)
+def _build_s3_client(
+    access_key_id: Optional[str],
+    secret_access_key: Optional[str],
+    region: Optional[str],
+    endpoint: Optional[str],
+    use_ssl: bool,
+):
+    """Build one boto3 S3 client per configuration; low-level clients are thread-safe and reusable."""
+    params = {}
+    if access_key_id:
+        params["aws_access_key_id"] = access_key_id
+    if secret_access_key:
+        params["aws_secret_access_key"] = secret_access_key
+    if region:
+        params["region_name"] = region
+    if endpoint:
+        params["endpoint_url"] = endpoint
+    params["use_ssl"] = use_ssl
+    return boto3.client("s3", **params)
+
+
+@lru_cache(maxsize=8)
+def _resolve_local_base_path(base: str) -> Path:
+    """Resolve and create a local storage root once per process instead of on every request."""
+    path = Path(base)
+    if not path.is_absolute():
+        path = (_PROJECT_ROOT / path).resolve()
+    path.mkdir(parents=True, exist_ok=True)
+    return path
+
+
+def _copy_to_path(source: BinaryIO, destination: Path) -> int:
+    """Copy *source* from its start into *destination* and return the number of bytes written."""
+    destination.parent.mkdir(parents=True, exist_ok=True)
+    source.seek(0)
+    with destination.open("wb") as buffer:
+        shutil.copyfileobj(source, buffer, _CHUNK_SIZE)
+        return buffer.tell()
 
 
 class StorageService:
@@ -31,7 +93,7 @@ class StorageService:
 
     def _normalize_scope(self, scope: Optional[str]) -> str:
         base = (scope or "general").strip().lower()
-        cleaned = _ALLOWED_SCOPE.sub("-", base)
+        cleaned = base if _SCOPE_CHARS.issuperset(base) else _ALLOWED_SCOPE.sub("-", base)
         return cleaned or "general"
 
     def _sanitize_filename(self, filename: Optional[str]) -> str:
@@ -45,21 +107,19 @@ class StorageService:
         else:
             ext = ""
             stem = parts[0]
-        safe_stem = _ALLOWED_FILENAME.sub("-", stem).strip("-" ) or "archivo"
+        if not _FILENAME_CHARS.issuperset(stem):
+            stem = _ALLOWED_FILENAME.sub("-", stem)
+        safe_stem = stem.strip("-") or "archivo"
         safe_stem = safe_stem[:80]
-        safe_ext = _ALLOWED_FILENAME.sub("", ext).lower()
+        safe_ext = (ext if _FILENAME_CHARS.issuperset(ext) else _ALLOWED_FILENAME.sub("", ext)).lower()
         return f"{safe_stem}.{safe_ext}" if safe_ext else safe_stem
 
     def _build_storage_key(self, scope: str, filename: str) -> str:
-        return f"{scope}/{uuid4().hex}-{filename}"
+        return f"{scope}/{secrets.token_hex(16)}-{filename}"
 
     def _resolve_local_base(self, driver: str) -> Path:
         base = self.config.local_path if driver == "local" else self.config.docker_volume_path
-        path = Path(base)
-        if not path.is_absolute():
-            path = (_PROJECT_ROOT / path).resolve()
-        path.mkdir(parents=True, exist_ok=True)
-        return path
+        return _resolve_local_base_path(base)
 
     def _get_s3_client(self):
         if boto3 is None:
@@ -67,17 +127,14 @@ class StorageService:
         bucket = self.config.s3_bucket
         if not bucket:
             raise HTTPException(status_code=500, detail="FILE_STORAGE_S3_BUCKET no está configurado")
-        params = {}
-        if self.config.s3_access_key_id:
-            params["aws_access_key_id"] = self.config.s3_access_key_id
-        if self.config.s3_secret_access_key:
-            params["aws_secret_access_key"] = self.config.s3_secret_access_key
-        if self.config.s3_region:
-            params["region_name"] = self.config.s3_region
-        if self.config.s3_endpoint:
-            params["endpoint_url"] = self.config.s3_endpoint
-        params["use_ssl"] = bool(self.config.s3_use_ssl)
-        return boto3.client("s3", **params), bucket
+        client = _build_s3_client(
+            self.config.s3_access_key_id,
+            self.config.s3_secret_access_key,
+            self.config.s3_region,
+            self.config.s3_endpoint,
+            bool(self.config.s3_use_ssl),
+        )
+        return client, bucket
 
     async def save_upload(self, upload: UploadFile, scope: Optional[str], owner_user_id: Optional[int]) -> StoredFile:
         normalized_scope = self._normalize_scope(scope)
@@ -89,23 +146,22 @@ class StorageService:
         if driver in {"local", "docker_volume"}:
             base_path = self._resolve_local_base(driver)
             destination = base_path / storage_key
-            destination.parent.mkdir(parents=True, exist_ok=True)
-            with destination.open("wb") as buffer:
-                while True:
-                    chunk = await upload.read(_CHUNK_SIZE)
-                    if not chunk:
-                        break
-                    size_bytes += len(chunk)
-                    buffer.write(chunk)
+            # La copia completa (en C vía copyfileobj) corre en un hilo para no bloquear el event loop.
+            size_bytes = await asyncio.to_thread(_copy_to_path, upload.file, destination)
         elif driver == "s3":
             client, bucket = self._get_s3_client()
-            data = await upload.read()
-            size_bytes = len(data)
-            client.put_object(
-                Bucket=bucket,
-                Key=storage_key,
-                Body=data,
-                ContentType=upload.content_type or "application/octet-stream",
+            # UploadFile ya está en un SpooledTemporaryFile: se mide y se envía sin cargarlo en memoria.
+            upload.file.seek(0, os.SEEK_END)
+            size_bytes = upload.file.tell()
+            upload.file.seek(0)
+            # boto3 es síncrono: la transferencia corre en un hilo para no bloquear el event loop.
+            await asyncio.to_thread(
+                client.upload_fileobj,
+                upload.file,
+                bucket,
+                storage_key,
+                ExtraArgs={"ContentType": upload.content_type or "application/octet-stream"},
+                Config=_S3_TRANSFER_CONFIG,
             )
         else:
             raise HTTPException(status_code=500, detail=f"Driver de almacenamiento desconocido: {driver}")
@@ -142,28 +198,35 @@ class StorageService:
         media_type = stored.content_type or "application/octet-stream"
         if stored.driver in {"local", "docker_volume"}:
             path = self._local_file_path(stored)
-            if not path.exists():
+            # Un único stat sirve para validar la existencia y para las cabeceras de FileResponse.
+            try:
+                stat_result = os.stat(path)
+            except FileNotFoundError:
                 raise HTTPException(status_code=404, detail="Archivo no disponible en el almacenamiento local")
-            return FileResponse(path, media_type=media_type, filename=filename)
+            return FileResponse(path, media_type=media_type, filename=filename, stat_result=stat_result)
         if stored.driver == "s3":
             client, bucket = self._get_s3_client()
+            # HEAD previo: un objeto inexistente sigue respondiendo 404 desde la API en vez
+            # de redirigir a una URL firmada que fallaría en S3.
             try:
-                obj = client.get_object(Bucket=bucket, Key=stored.storage_path)
-            except client.exceptions.NoSuchKey:  # type: ignore[attr-defined]
-                raise HTTPException(status_code=404, detail="Archivo no encontrado en S3")
-
-            body = obj["Body"]
-
-            def iterator():
-                while True:
-                    chunk = body.read(_CHUNK_SIZE)
-                    if not chunk:
-                        break
-                    yield chunk
-
-            response = StreamingResponse(iterator(), media_type=media_type)
-            response.headers["Content-Disposition"] = f'attachment; filename="{filename}"'
-            return response
+                client.head_object(Bucket=bucket, Key=stored.storage_path)
+            except ClientError as exc:
+                if exc.response.get("Error", {}).get("Code") in _S3_MISSING_KEY_CODES:
+                    raise HTTPException(status_code=404, detail="Archivo no encontrado en S3")
+                raise
+            # El cliente descarga directamente desde S3 con una URL firmada de corta duración,
+            # sin que los bytes pasen por la API.
+            url = client.generate_presigned_url(
+                "get_object",
+                Params={
+                    "Bucket": bucket,
+                    "Key": stored.storage_path,
+                    "ResponseContentType": media_type,
+                    "ResponseContentDisposition": f'attachment; filename="{filename}"',
+                },
+                ExpiresIn=_S3_PRESIGNED_URL_TTL,
+            )
+            return RedirectResponse(url, status_code=307)
         raise HTTPException(status_code=500, detail=f"Driver {stored.driver} no soportado para descargas")
 
 
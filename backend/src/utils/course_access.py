@@ -1,56 +1,82 @@
+from typing import Optional
+
 from fastapi import HTTPException, status
 from sqlmodel import select
 
 from ..models import Course, Teacher, Student, Enrollment
 
 
-def require_teacher(session, user):
-    teacher = session.exec(select(Teacher).where(Teacher.user_id == user.id)).first()
-    if not teacher:
+def _profile_id(session, model, user) -> Optional[int]:
+    """Return the ``model`` profile id of *user*, memoized in ``session.info`` for the request."""
+    # get_session abre una sesión por request, así que session.info actúa como caché por request.
+    cache = session.info.setdefault("profile_ids", {})
+    key = (model.__name__, user.id)
+    if key not in cache:
+        profile_id = session.exec(select(model.id).where(model.user_id == user.id).limit(1)).first()
+        if profile_id is None:
+            return None
+        cache[key] = profile_id
+    return cache[key]
+
+
+def require_teacher_id(session, user) -> int:
+    teacher_id = _profile_id(session, Teacher, user)
+    if teacher_id is None:
         raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Se requiere un perfil docente asignado.")
-    return teacher
+    return teacher_id
 
 
-def require_student(session, user):
-    student = session.exec(select(Student).where(Student.user_id == user.id)).first()
-    if not student:
+def require_student_id(session, user) -> int:
+    student_id = _profile_id(session, Student, user)
+    if student_id is None:
         raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Se requiere un perfil de estudiante asignado.")
-    return student
+    return student_id
 
 
-def ensure_course_access(session, user, course_id: int) -> Course:
+def _resolve_course_and_actor(session, user, course_id: int) -> tuple[Course, Optional[int]]:
+    """Load the course, check that *user* may access it and return the teacher profile id used, if any."""
     course = session.get(Course, course_id)
     if not course:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Curso no encontrado")
 
     if user.role in ("admin", "coordinator"):
-        return course
+        return course, None
 
     if user.role == "teacher":
-        teacher = require_teacher(session, user)
-        if course.teacher_id != teacher.id:
+        teacher_id = require_teacher_id(session, user)
+        if course.teacher_id != teacher_id:
             raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="No estás asignado a este curso")
-        return course
+        return course, teacher_id
 
     if user.role == "student":
-        student = require_student(session, user)
-        enrollment = session.exec(
-            select(Enrollment).where(Enrollment.course_id == course.id, Enrollment.student_id == student.id)
+        # Perfil de estudiante e inscripción se validan en una sola consulta.
+        enrollment_id = session.exec(
+            select(Enrollment.id)
+            .join(Student, Student.id == Enrollment.student_id)
+            .where(Student.user_id == user.id, Enrollment.course_id == course.id)
+            .limit(1)
         ).first()
-        if not enrollment:
+        if enrollment_id is None:
             raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="No estás inscrito en este curso")
-        return course
+        return course, None
 
     raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Rol sin permisos para acceder al curso")
 
 
+def ensure_course_access(session, user, course_id: int) -> Course:
+    course, _ = _resolve_course_and_actor(session, user, course_id)
+    return course
+
+
 def ensure_teacher_course_permission(session, user, course_id: int) -> Course:
-    course = ensure_course_access(session, user, course_id)
+    course, teacher_id = _resolve_course_and_actor(session, user, course_id)
     if user.role in ("admin", "coordinator"):
         return course
-    teacher = require_teacher(session, user)
-    if course.teacher_id != teacher.id:
-        raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="El curso pertenece a otro docente")
+    # Para docentes la pertenencia del curso ya quedó validada con el mismo perfil.
+    if teacher_id is None:
+        teacher_id = require_teacher_id(session, user)
+        if course.teacher_id != teacher_id:
+            raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="El curso pertenece a otro docente")
     return course
 
 
@@ -60,9 +86,9 @@ def ensure_teacher_for_assignment(session, user, assignment):
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Curso no encontrado")
     if user.role in ("admin", "coordinator"):
         return course
-    teacher = require_teacher(session, user)
-    if assignment.teacher_id and assignment.teacher_id != teacher.id:
+    teacher_id = require_teacher_id(session, user)
+    if assignment.teacher_id and assignment.teacher_id != teacher_id:
         raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="La tarea está asignada a otro docente")
-    if course.teacher_id != teacher.id:
+    if course.teacher_id != teacher_id:
         raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="No estás asignado a este curso")
     return course
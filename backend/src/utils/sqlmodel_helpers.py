@@ -9,7 +9,9 @@ to runtime errors.
 
 from __future__ import annotations
 
-from typing import Any, Dict, Type, TypeVar
+from functools import lru_cache
+import types
+from typing import Any, Dict, Optional, Type, TypeVar, Union, get_args, get_origin
 
 from pydantic import TypeAdapter, ValidationError
 from sqlmodel import SQLModel
@@ -17,6 +19,47 @@ from sqlmodel import SQLModel
 
 TModel = TypeVar("TModel", bound=SQLModel)
 
+_MISSING = object()
+
+
+@lru_cache(maxsize=4096)
+def _adapter_for(model: type, field_name: str) -> Optional[TypeAdapter]:
+    """Return a cached ``TypeAdapter`` for ``model.field_name`` (or ``None``)."""
+
+    field = model.model_fields.get(field_name)
+    if field is None:
+        return None
+    # Construir el adaptador compila un CoreSchema: se hace una sola vez por campo.
+    return TypeAdapter(field.annotation)
+
+
+@lru_cache(maxsize=4096)
+def _plain_type_for(model: type, field_name: str) -> Optional[type]:
+    """Return the concrete class declared for ``model.field_name``.
+
+    ``Optional[T]`` is unwrapped to ``T``; generics and real unions yield ``None``.
+    """
+
+    field = model.model_fields.get(field_name)
+    if field is None:
+        return None
+    annotation = field.annotation
+    if get_origin(annotation) in (Union, types.UnionType):
+        args = [arg for arg in get_args(annotation) if arg is not type(None)]
+        if len(args) != 1:
+            return None
+        annotation = args[0]
+    if isinstance(annotation, type) and get_origin(annotation) is None:
+        return annotation
+    return None
+
+
+@lru_cache(maxsize=256)
+def _updatable_fields(model: type) -> frozenset[str]:
+    """Return the model field names that payloads may assign (everything but ``id``)."""
+
+    return frozenset(model.model_fields) - {"id"}
+
 
 def _coerce_field_value(model: Type[TModel], field_name: str, value: Any) -> Any:
     """Coerce *value* to the python type declared in ``model`` for ``field_name``.
@@ -29,11 +72,14 @@ def _coerce_field_value(model: Type[TModel], field_name: str, value: Any) -> Any
     if value is None:
         return None
 
-    field = model.model_fields.get(field_name)
-    if field is None:
+    # Comparación exacta de tipo: evita aceptar bool como int o datetime como date.
+    if type(value) is _plain_type_for(model, field_name):
+        return value
+
+    adapter = _adapter_for(model, field_name)
+    if adapter is None:
         return value
 
-    adapter = TypeAdapter(field.annotation)
     try:
         # ``validate_python`` returns the python-native value according to the
         # annotation (e.g. "2025-10-30" -> date(2025, 10, 30)).
@@ -45,23 +91,22 @@ def _coerce_field_value(model: Type[TModel], field_name: str, value: Any) -> Any
 def normalize_payload_for_model(model: Type[TModel], data: Dict[str, Any]) -> Dict[str, Any]:
     """Return a copy of *data* with values coerced to ``model`` field types."""
 
-    coerced: Dict[str, Any] = {}
-    for key, value in data.items():
-        if key == "id":
-            # Never allow payloads to override primary keys during updates.
-            continue
-        coerced[key] = _coerce_field_value(model, key, value)
-    return coerced
+    # Una sola intersección descarta el ``id`` (nunca se sobrescribe la PK) y
+    # cualquier clave que no sea un campo del modelo.
+    return {key: _coerce_field_value(model, key, data[key]) for key in data.keys() & _updatable_fields(model)}
 
 
 def apply_partial_update(instance: TModel, data: Dict[str, Any]) -> TModel:
     """Coerce *data* and assign the resulting values into *instance*.
 
-    Returns the same instance to allow chaining inside the routers.
+    Unchanged attributes are left untouched so SQLAlchemy does not flag them as
+    dirty. Returns the same instance to allow chaining inside the routers.
     """
 
     model = type(instance)
     coerced = normalize_payload_for_model(model, data)
     for key, value in coerced.items():
-        setattr(instance, key, value)
+        # Solo asignar lo que cambia: un PATCH que repite el estado no ensucia el objeto.
+        if getattr(instance, key, _MISSING) != value:
+            setattr(instance, key, value)
     return instance
@@ -5,9 +5,10 @@ from uuid import uuid4
 from fastapi.testclient import TestClient
 
 
-def _create_user_and_get_id(client: TestClient, headers: dict[str, str], role: str) -> int:
+def _create_user_and_get_id(public_client: TestClient, client: TestClient, role: str) -> int:
     email = f"{role}-{uuid4().hex[:8]}@academiapro.dev"
-    res = client.post(
+    # El signup es público: se envía sin la cabecera Authorization del coordinador.
+    res = public_client.post(
         "/auth/signup",
         json={
             "email": email,
@@ -17,13 +18,14 @@ def _create_user_and_get_id(client: TestClient, headers: dict[str, str], role: s
         },
     )
     assert res.status_code == 200, res.text
-    res = client.get("/users/by-email", params={"email": email}, headers=headers)
+    res = client.get("/users/by-email", params={"email": email})
     assert res.status_code == 200, res.text
     return res.json()["id"]
 
 
-def test_coordinator_can_manage_students_courses_and_rooms(client: TestClient, coordinator_token: str):
-    headers = {"Authorization": f"Bearer {coordinator_token}"}
+def test_coordinator_can_manage_students_courses_and_rooms(client: TestClient, coordinator_client: TestClient):
+    public_client = client
+    client = coordinator_client
 
     # Program + semester creation
     program_code = f"PRG-{uuid4().hex[:6]}"
@@ -35,7 +37,6 @@ def test_coordinator_can_manage_students_courses_and_rooms(client: TestClient, c
             "level": "Pregrado",
             "duration_semesters": 8,
         },
-        headers=headers,
     )
     assert res.status_code == 200, res.text
     program = res.json()
@@ -47,7 +48,6 @@ def test_coordinator_can_manage_students_courses_and_rooms(client: TestClient, c
             "semester_number": 1,
             "label": "Semestre 1",
         },
-        headers=headers,
     )
     assert res.status_code == 200, res.text
     semester = res.json()
@@ -63,20 +63,18 @@ def test_coordinator_can_manage_students_courses_and_rooms(client: TestClient, c
             "pedagogical_hours_per_week": 4,
             "prerequisite_subject_ids": [],
         },
-        headers=headers,
     )
     assert res.status_code == 200, res.text
     subject = res.json()
 
     # Teacher catalog entry requires a user profile
-    teacher_user_id = _create_user_and_get_id(client, headers, role="teacher")
+    teacher_user_id = _create_user_and_get_id(public_client, client, role="teacher")
     res = client.post(
         "/teachers/",
         json={
             "user_id": teacher_user_id,
             "department": "Ciencias",
         },
-        headers=headers,
     )
     assert res.status_code == 200, res.text
     teacher = res.json()
@@ -91,7 +89,6 @@ def test_coordinator_can_manage_students_courses_and_rooms(client: TestClient, c
             "term": "2025-1",
             "group": "A",
         },
-        headers=headers,
     )
     assert res.status_code == 200, res.text
     course = res.json()
@@ -108,13 +105,12 @@ def test_coordinator_can_manage_students_courses_and_rooms(client: TestClient, c
             "floor": "2",
             "room_type": "classroom",
         },
-        headers=headers,
     )
     assert res.status_code == 200, res.text
     room = res.json()
 
     # Student profile tied to the same program
-    student_user_id = _create_user_and_get_id(client, headers, role="student")
+    student_user_id = _create_user_and_get_id(public_client, client, role="student")
     res = client.post(
         "/students/",
         json={
@@ -123,7 +119,6 @@ def test_coordinator_can_manage_students_courses_and_rooms(client: TestClient, c
             "enrollment_year": 2024,
             "registration_number": f"REG-{uuid4().hex[:6]}",
         },
-        headers=headers,
     )
     assert res.status_code == 200, res.text
     student = res.json()
@@ -137,24 +132,23 @@ def test_coordinator_can_manage_students_courses_and_rooms(client: TestClient, c
             "status": "enrolled",
             "notes": "Asignado por coordinacion",
         },
-        headers=headers,
     )
     assert res.status_code == 200, res.text
     enrollment = res.json()
 
     # Read endpoints confirm visibility with the same role
-    res = client.get("/students/", headers=headers)
+    res = client.get("/students/")
     assert res.status_code == 200, res.text
     assert any(item["id"] == student["id"] for item in res.json())
 
-    res = client.get(f"/courses/{course['id']}", headers=headers)
+    res = client.get(f"/courses/{course['id']}")
     assert res.status_code == 200, res.text
     assert res.json()["id"] == course["id"]
 
-    res = client.get(f"/rooms/{room['id']}", headers=headers)
+    res = client.get(f"/rooms/{room['id']}")
     assert res.status_code == 200, res.text
     assert res.json()["code"] == room_code
 
-    res = client.get("/enrollments/", headers=headers)
+    res = client.get("/enrollments/")
     assert res.status_code == 200, res.text
     assert any(item["id"] == enrollment["id"] for item in res.json())
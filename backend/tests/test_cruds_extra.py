@@ -1,8 +1,7 @@
-from fastapi.testclient import TestClient
-
+from uuid import uuid4
 
-def _auth_headers(token: str) -> dict[str, str]:
-	return {"Authorization": f"Bearer {token}"}
+import pytest
+from fastapi.testclient import TestClient
 
 
 def _subject_payload(code: str, name: str) -> dict[str, object]:
@@ -14,20 +13,18 @@ def _subject_payload(code: str, name: str) -> dict[str, object]:
 	}
 
 
-def test_subject_prerequisites_flow(client: TestClient, admin_token: str):
-	headers = _auth_headers(admin_token)
-
-	base_resp = client.post("/subjects/", json=_subject_payload("PRE-BASE-1", "Base 1"), headers=headers)
+def test_subject_prerequisites_flow(admin_client: TestClient):
+	base_resp = admin_client.post("/subjects/", json=_subject_payload("PRE-BASE-1", "Base 1"))
 	assert base_resp.status_code == 200, base_resp.text
 	base_id = base_resp.json()["id"]
 
-	alt_resp = client.post("/subjects/", json=_subject_payload("PRE-BASE-2", "Base 2"), headers=headers)
+	alt_resp = admin_client.post("/subjects/", json=_subject_payload("PRE-BASE-2", "Base 2"))
 	assert alt_resp.status_code == 200, alt_resp.text
 	alt_id = alt_resp.json()["id"]
 
 	advanced_payload = _subject_payload("PRE-ADV-1", "Avanzada 1 | Física")
 	advanced_payload["prerequisite_subject_ids"] = [base_id]
-	advanced_resp = client.post("/subjects/", json=advanced_payload, headers=headers)
+	advanced_resp = admin_client.post("/subjects/", json=advanced_payload)
 	assert advanced_resp.status_code == 200, advanced_resp.text
 	advanced = advanced_resp.json()
 	assert advanced["prerequisite_subject_ids"] == [base_id]
@@ -41,279 +38,295 @@ def test_subject_prerequisites_flow(client: TestClient, admin_token: str):
 		"weekly_autonomous_work_hours": advanced["weekly_autonomous_work_hours"],
 		"prerequisite_subject_ids": [base_id, alt_id],
 	}
-	update_resp = client.put(f"/subjects/{advanced['id']}", json=update_payload, headers=headers)
+	update_resp = admin_client.put(f"/subjects/{advanced['id']}", json=update_payload)
 	assert update_resp.status_code == 200, update_resp.text
 	assert set(update_resp.json()["prerequisite_subject_ids"]) == {base_id, alt_id}
 
 	# Removing all prerequisites should persist the change
 	clear_payload = update_payload | {"prerequisite_subject_ids": []}
-	clear_resp = client.put(f"/subjects/{advanced['id']}", json=clear_payload, headers=headers)
+	clear_resp = admin_client.put(f"/subjects/{advanced['id']}", json=clear_payload)
 	assert clear_resp.status_code == 200, clear_resp.text
 	assert clear_resp.json()["prerequisite_subject_ids"] == []
 
-	# Listing should include the prerequisite field
-	listing = client.get("/subjects/", headers=headers)
-	assert listing.status_code == 200, listing.text
-	details = {item["id"]: item for item in listing.json()}
-	assert advanced["id"] in details
-	assert details[advanced["id"]]["prerequisite_subject_ids"] == []
-
 	# Validation: cannot point to non-existent subject
 	invalid_payload = clear_payload | {"prerequisite_subject_ids": [999999]}
-	invalid_resp = client.put(f"/subjects/{advanced['id']}", json=invalid_payload, headers=headers)
+	invalid_resp = admin_client.put(f"/subjects/{advanced['id']}", json=invalid_payload)
 	assert invalid_resp.status_code == 404
 
 	# Validation: cannot require itself
 	self_payload = clear_payload | {"prerequisite_subject_ids": [advanced["id"]]}
-	self_resp = client.put(f"/subjects/{advanced['id']}", json=self_payload, headers=headers)
+	self_resp = admin_client.put(f"/subjects/{advanced['id']}", json=self_payload)
 	assert self_resp.status_code == 400
 
 
-def test_crud_updates_accept_iso_strings(client: TestClient, admin_token: str):
-	headers = _auth_headers(admin_token)
-
-	# Program + semester to support dependent entities
-	program_resp = client.post(
-		"/programs/",
-		json={"code": "ISO-PRG", "name": "ISO Program", "level": "test", "duration_semesters": 8},
-		headers=headers,
-	)
-	assert program_resp.status_code == 200, program_resp.text
-	program_id = program_resp.json()["id"]
+def test_subject_listing_includes_prerequisites(admin_client: TestClient):
+	base_resp = admin_client.post("/subjects/", json=_subject_payload("PRE-LIST-BASE", "Base Listado"))
+	assert base_resp.status_code == 200, base_resp.text
+	base_id = base_resp.json()["id"]
 
-	semester_resp = client.post(
-		"/program-semesters/",
-		json={"program_id": program_id, "semester_number": 1, "label": "Semestre 1"},
-		headers=headers,
-	)
-	assert semester_resp.status_code == 200, semester_resp.text
-	semester_id = semester_resp.json()["id"]
-
-	# Teacher
-	teacher_resp = client.post(
-		"/teachers/",
-		json={"user_id": 999, "department": "Matemáticas", "employment_type": "full_time"},
-		headers=headers,
-	)
-	assert teacher_resp.status_code == 200, teacher_resp.text
-	teacher_id = teacher_resp.json()["id"]
+	dependent_payload = _subject_payload("PRE-LIST-ADV", "Avanzada Listado") | {"prerequisite_subject_ids": [base_id]}
+	dependent_resp = admin_client.post("/subjects/", json=dependent_payload)
+	assert dependent_resp.status_code == 200, dependent_resp.text
+	dependent_id = dependent_resp.json()["id"]
 
-	# Subject
-	subject_resp = client.post(
+	listing = admin_client.get("/subjects/")
+	assert listing.status_code == 200, listing.text
+	details = {item["id"]: item for item in listing.json()}
+	assert details[dependent_id]["prerequisite_subject_ids"] == [base_id]
+	assert details[base_id]["prerequisite_subject_ids"] == []
+
+
+@pytest.mark.parametrize(
+	"path, entity",
+	[("/programs/by-code", "program"), ("/subjects/by-code", "subject"), ("/rooms/by-code", "room")],
+)
+def test_lookup_by_code(admin_client: TestClient, schedule_entities: dict, path, entity):
+	code = schedule_entities[entity]["code"]
+	found = admin_client.get(path, params={"code": code})
+	assert found.status_code == 200, found.text
+	assert found.json()["code"] == code
+
+	missing = admin_client.get(path, params={"code": "NO-EXISTE"})
+	assert missing.status_code == 404
+
+
+def _create_iso_update_graph(admin_client: TestClient) -> dict[str, int]:
+	"""Create the records updated by the ISO test through the API and return their ids."""
+	def _post(path: str, payload: dict[str, object]) -> int:
+		resp = admin_client.post(path, json=payload)
+		assert resp.status_code == 200, resp.text
+		return resp.json()["id"]
+
+	program_id = _post("/programs/", {"code": "ISO-PRG", "name": "ISO Program", "level": "test", "duration_semesters": 8})
+	semester_id = _post("/program-semesters/", {"program_id": program_id, "semester_number": 1, "label": "Semestre 1"})
+	teacher_id = _post("/teachers/", {"user_id": 999, "department": "Matemáticas", "employment_type": "full_time"})
+	subject_id = _post(
 		"/subjects/",
-		json={
-			"code": "ISO-SUB",
-			"name": "ISO Subject",
-			"pedagogical_hours_per_week": 4,
-			"weekly_autonomous_work_hours": 2,
-		},
-		headers=headers,
+		{"code": "ISO-SUB", "name": "ISO Subject", "pedagogical_hours_per_week": 4, "weekly_autonomous_work_hours": 2},
 	)
-	assert subject_resp.status_code == 200, subject_resp.text
-	subject_id = subject_resp.json()["id"]
-
-	# Course
-	course_resp = client.post(
+	course_id = _post(
 		"/courses/",
-		json={
+		{
 			"subject_id": subject_id,
 			"teacher_id": teacher_id,
 			"program_semester_id": semester_id,
 			"term": "2025-1",
 			"group": "A",
 		},
-		headers=headers,
-	)
-	assert course_resp.status_code == 200, course_resp.text
-	course_id = course_resp.json()["id"]
-
-	# Student
-	student_resp = client.post(
-		"/students/",
-		json={"user_id": 500, "enrollment_year": 2024, "program_id": program_id},
-		headers=headers,
 	)
-	assert student_resp.status_code == 200, student_resp.text
-	student_id = student_resp.json()["id"]
+	student_id = _post("/students/", {"user_id": 500, "enrollment_year": 2024, "program_id": program_id})
+	enrollment_id = _post("/enrollments/", {"student_id": student_id, "course_id": course_id})
+	evaluation_id = _post("/evaluations/", {"course_id": course_id, "name": "Primer Parcial", "weight": 0.3})
+	grade_id = _post("/grades/", {"enrollment_id": enrollment_id, "evaluation_id": evaluation_id, "score": 85})
+	attendance_id = _post("/attendance/", {"enrollment_id": enrollment_id, "session_date": "2025-02-02", "present": True})
+	timeslot_id = _post("/timeslots/", {"day_of_week": 0, "start_time": "08:00", "end_time": "09:30", "campus": "Central"})
 
-	# Enrollment
-	enrollment_resp = client.post(
-		"/enrollments/",
-		json={"student_id": student_id, "course_id": course_id},
-		headers=headers,
-	)
-	assert enrollment_resp.status_code == 200, enrollment_resp.text
-	enrollment_id = enrollment_resp.json()["id"]
-
-	# Evaluation
-	evaluation_resp = client.post(
-		"/evaluations/",
-		json={"course_id": course_id, "name": "Primer Parcial", "weight": 0.3},
-		headers=headers,
-	)
-	assert evaluation_resp.status_code == 200, evaluation_resp.text
-	evaluation_id = evaluation_resp.json()["id"]
-
-	# Grade
-	grade_resp = client.post(
-		"/grades/",
-		json={"enrollment_id": enrollment_id, "evaluation_id": evaluation_id, "score": 85},
-		headers=headers,
-	)
-	assert grade_resp.status_code == 200, grade_resp.text
-	grade_id = grade_resp.json()["id"]
-
-	# Attendance
-	attendance_resp = client.post(
-		"/attendance/",
-		json={"enrollment_id": enrollment_id, "session_date": "2025-02-02", "present": True},
-		headers=headers,
-	)
-	assert attendance_resp.status_code == 200, attendance_resp.text
-	attendance_id = attendance_resp.json()["id"]
-
-	# Timeslot
-	timeslot_resp = client.post(
-		"/timeslots/",
-		json={"day_of_week": 0, "start_time": "08:00", "end_time": "09:30", "campus": "Central"},
-		headers=headers,
-	)
-	assert timeslot_resp.status_code == 200, timeslot_resp.text
-	timeslot_id = timeslot_resp.json()["id"]
+	return {
+		"program": program_id,
+		"semester": semester_id,
+		"teacher": teacher_id,
+		"subject": subject_id,
+		"course": course_id,
+		"student": student_id,
+		"enrollment": enrollment_id,
+		"evaluation": evaluation_id,
+		"grade": grade_id,
+		"attendance": attendance_id,
+		"timeslot": timeslot_id,
+	}
 
-	# Teacher update with ISO date
-	teacher_update = client.put(
-		f"/teachers/{teacher_id}",
-		json={
-			"id": teacher_id,
+
+@pytest.fixture(scope="module")
+def iso_update_graph(admin_client: TestClient) -> dict[str, int]:
+	# Un solo grafo por módulo, creado con los POST de la API; los casos parametrizados prueban los PUT
+	return _create_iso_update_graph(admin_client)
+
+
+# (entidad, ruta, payload, campos exactos, campos por prefijo) para cada PUT con valores ISO
+_ISO_UPDATE_CASES = [
+	(
+		"teacher",
+		"/teachers/{teacher}",
+		lambda ids: {
+			"id": ids["teacher"],
 			"user_id": 999,
 			"department": "Matemáticas",
 			"employment_type": "full_time",
 			"hire_date": "2025-10-30",
 		},
-		headers=headers,
-	)
-	assert teacher_update.status_code == 200, teacher_update.text
-	assert teacher_update.json()["hire_date"] == "2025-10-30"
-
-	# Student update with ISO dates
-	student_update = client.put(
-		f"/students/{student_id}",
-		json={
-			"id": student_id,
+		{"hire_date": "2025-10-30"},
+		{},
+	),
+	(
+		"student",
+		"/students/{student}",
+		lambda ids: {
+			"id": ids["student"],
 			"user_id": 500,
 			"enrollment_year": 2024,
-			"program_id": program_id,
+			"program_id": ids["program"],
 			"admission_date": "2025-01-10",
 			"expected_graduation_date": "2029-12-01",
 		},
-		headers=headers,
-	)
-	assert student_update.status_code == 200, student_update.text
-	payload = student_update.json()
-	assert payload["admission_date"] == "2025-01-10"
-	assert payload["expected_graduation_date"] == "2029-12-01"
-
-	# Course update with ISO dates
-	course_update = client.put(
-		f"/courses/{course_id}",
-		json={
-			"id": course_id,
-			"subject_id": subject_id,
-			"teacher_id": teacher_id,
-			"program_semester_id": semester_id,
+		{"admission_date": "2025-01-10", "expected_graduation_date": "2029-12-01"},
+		{},
+	),
+	(
+		"course",
+		"/courses/{course}",
+		lambda ids: {
+			"id": ids["course"],
+			"subject_id": ids["subject"],
+			"teacher_id": ids["teacher"],
+			"program_semester_id": ids["semester"],
 			"term": "2025-1",
 			"group": "A",
 			"start_date": "2025-03-01",
 			"end_date": "2025-07-15",
 		},
-		headers=headers,
-	)
-	assert course_update.status_code == 200, course_update.text
-	course_payload = course_update.json()
-	assert course_payload["start_date"] == "2025-03-01"
-	assert course_payload["end_date"] == "2025-07-15"
-
-	# Enrollment update with ISO datetimes
-	enrollment_update = client.put(
-		f"/enrollments/{enrollment_id}",
-		json={
-			"id": enrollment_id,
-			"student_id": student_id,
-			"course_id": course_id,
+		{"start_date": "2025-03-01", "end_date": "2025-07-15"},
+		{},
+	),
+	(
+		"enrollment",
+		"/enrollments/{enrollment}",
+		lambda ids: {
+			"id": ids["enrollment"],
+			"student_id": ids["student"],
+			"course_id": ids["course"],
 			"enrolled_at": "2025-02-01T10:15:00",
 			"dropped_at": "2025-02-02T09:00:00",
 		},
-		headers=headers,
-	)
-	assert enrollment_update.status_code == 200, enrollment_update.text
-	enrollment_payload = enrollment_update.json()
-	assert enrollment_payload["enrolled_at"].startswith("2025-02-01T10:15:00")
-	assert enrollment_payload["dropped_at"].startswith("2025-02-02T09:00:00")
-
-	# Evaluation update with ISO datetimes
-	evaluation_update = client.put(
-		f"/evaluations/{evaluation_id}",
-		json={
-			"id": evaluation_id,
-			"course_id": course_id,
+		{},
+		{"enrolled_at": "2025-02-01T10:15:00", "dropped_at": "2025-02-02T09:00:00"},
+	),
+	(
+		"evaluation",
+		"/evaluations/{evaluation}",
+		lambda ids: {
+			"id": ids["evaluation"],
+			"course_id": ids["course"],
 			"name": "Primer Parcial",
 			"weight": 0.3,
 			"scheduled_at": "2025-02-05T08:00:00",
 			"due_date": "2025-02-10T23:59:00",
 		},
-		headers=headers,
-	)
-	assert evaluation_update.status_code == 200, evaluation_update.text
-	evaluation_payload = evaluation_update.json()
-	assert evaluation_payload["scheduled_at"].startswith("2025-02-05T08:00:00")
-	assert evaluation_payload["due_date"].startswith("2025-02-10T23:59:00")
-
-	# Grade update with ISO datetime
-	grade_update = client.put(
-		f"/grades/{grade_id}",
-		json={
-			"id": grade_id,
-			"enrollment_id": enrollment_id,
-			"evaluation_id": evaluation_id,
+		{},
+		{"scheduled_at": "2025-02-05T08:00:00", "due_date": "2025-02-10T23:59:00"},
+	),
+	(
+		"grade",
+		"/grades/{grade}",
+		lambda ids: {
+			"id": ids["grade"],
+			"enrollment_id": ids["enrollment"],
+			"evaluation_id": ids["evaluation"],
 			"score": 90,
 			"graded_at": "2025-02-06T12:30:00",
 		},
-		headers=headers,
-	)
-	assert grade_update.status_code == 200, grade_update.text
-	assert grade_update.json()["graded_at"].startswith("2025-02-06T12:30:00")
-
-	# Attendance update with ISO date/time
-	attendance_update = client.put(
-		f"/attendance/{attendance_id}",
-		json={
-			"id": attendance_id,
-			"enrollment_id": enrollment_id,
+		{},
+		{"graded_at": "2025-02-06T12:30:00"},
+	),
+	(
+		"attendance",
+		"/attendance/{attendance}",
+		lambda ids: {
+			"id": ids["attendance"],
+			"enrollment_id": ids["enrollment"],
 			"session_date": "2025-02-03",
 			"present": True,
 			"arrival_time": "08:05:00",
 		},
-		headers=headers,
-	)
-	assert attendance_update.status_code == 200, attendance_update.text
-	attendance_payload = attendance_update.json()
-	assert attendance_payload["session_date"] == "2025-02-03"
-	assert attendance_payload["arrival_time"].startswith("08:05:00")
-
-	# Timeslot update with ISO times
-	timeslot_update = client.put(
-		f"/timeslots/{timeslot_id}",
-		json={
-			"id": timeslot_id,
+		{"session_date": "2025-02-03"},
+		{"arrival_time": "08:05:00"},
+	),
+	(
+		"timeslot",
+		"/timeslots/{timeslot}",
+		lambda ids: {
+			"id": ids["timeslot"],
 			"day_of_week": 0,
 			"start_time": "09:00",
 			"end_time": "11:00",
 			"campus": "Central",
 		},
-		headers=headers,
+		{},
+		{"start_time": "09:00", "end_time": "11:00"},
+	),
+]
+
+
+@pytest.mark.parametrize(
+	"path, build_payload, exact, prefixes",
+	[case[1:] for case in _ISO_UPDATE_CASES],
+	ids=[case[0] for case in _ISO_UPDATE_CASES],
+)
+def test_crud_updates_accept_iso_strings(admin_client: TestClient, iso_update_graph: dict[str, int], path, build_payload, exact, prefixes):
+	res = admin_client.put(path.format(**iso_update_graph), json=build_payload(iso_update_graph))
+	assert res.status_code == 200, res.text
+	body = res.json()
+	for field, expected in exact.items():
+		assert body[field] == expected, field
+	for field, expected in prefixes.items():
+		assert body[field].startswith(expected), field
+
+
+def _second_course_enrollment(admin_client: TestClient, bundle: dict) -> dict:
+	course = admin_client.post(
+		"/courses/",
+		json={
+			"subject_id": bundle["subject"]["id"],
+			"teacher_id": bundle["teacher"]["id"],
+			"program_semester_id": bundle["semester"]["id"],
+			"term": "2025-1",
+			"group": f"DUP-{uuid4().hex[:6]}",
+		},
+	)
+	assert course.status_code == 200, course.text
+	enrollment = admin_client.post(
+		"/enrollments/",
+		json={"student_id": bundle["student"]["id"], "course_id": course.json()["id"]},
+	)
+	assert enrollment.status_code == 200, enrollment.text
+	return enrollment.json()
+
+
+def test_enrollment_create_rejects_duplicate_pair(admin_client: TestClient, course_bundle: dict):
+	# course_bundle ya matricula al estudiante en su curso
+	res = admin_client.post(
+		"/enrollments/",
+		json={"student_id": course_bundle["student"]["id"], "course_id": course_bundle["course"]["id"]},
+	)
+	assert res.status_code == 400, res.text
+	assert res.json()["detail"] == "El estudiante ya está matriculado en este curso"
+
+
+def test_enrollment_update_rejects_duplicate_pair(admin_client: TestClient, course_bundle: dict):
+	other = _second_course_enrollment(admin_client, course_bundle)
+	res = admin_client.put(
+		f"/enrollments/{other['id']}",
+		json={"id": other["id"], "student_id": other["student_id"], "course_id": course_bundle["course"]["id"]},
+	)
+	assert res.status_code == 400, res.text
+	assert res.json()["detail"] == "El estudiante ya está matriculado en este curso"
+
+
+def test_enrollment_update_maps_unique_violation_to_400(admin_client: TestClient, course_bundle: dict, monkeypatch):
+	# Simula una carrera: la validación previa no ve el duplicado y la restricción única lo frena en el COMMIT
+	from src.routers import enrollments
+
+	original = enrollments._find_duplicate
+	calls = []
+
+	def _miss_first_check(*args, **kwargs):
+		calls.append(args)
+		return None if len(calls) == 1 else original(*args, **kwargs)
+
+	other = _second_course_enrollment(admin_client, course_bundle)
+	monkeypatch.setattr(enrollments, "_find_duplicate", _miss_first_check)
+	res = admin_client.put(
+		f"/enrollments/{other['id']}",
+		json={"id": other["id"], "student_id": other["student_id"], "course_id": course_bundle["course"]["id"]},
 	)
-	assert timeslot_update.status_code == 200, timeslot_update.text
-	timeslot_payload = timeslot_update.json()
-	assert timeslot_payload["start_time"].startswith("09:00")
-	assert timeslot_payload["end_time"].startswith("11:00")
+	assert res.status_code == 400, res.text
+	assert len(calls) == 2
@@ -1,25 +1,14 @@
+import pytest
+from fastapi import HTTPException
 from fastapi.testclient import TestClient
 
 
-def _upload_sample_file(client: TestClient, admin_token: str):
-    payload = {"scope": (None, "materials")}
-    files = {"file": ("guia.pdf", b"contenido-demo", "application/pdf")}
-    res = client.post(
-        "/files/upload",
-        data=payload,
-        files=files,
-        headers={"Authorization": f"Bearer {admin_token}"},
-    )
-    assert res.status_code == 201, res.text
-    return res.json()
-
-
-def test_upload_and_download_file(client: TestClient, admin_token: str):
-    body = _upload_sample_file(client, admin_token)
+def test_upload_and_download_file(admin_client: TestClient, uploaded_file: dict):
+    body = uploaded_file
     assert body["id"] > 0
     assert body["download_url"].endswith(f"/files/{body['id']}")
 
-    download = client.get(body["download_url"], headers={"Authorization": f"Bearer {admin_token}"})
+    download = admin_client.get(body["download_url"])
     assert download.status_code == 200, download.text
     assert download.content == b"contenido-demo"
     assert download.headers.get("content-type") == "application/pdf"
@@ -35,22 +24,59 @@ def test_upload_requires_authentication(client: TestClient):
     assert res.status_code == 401
 
 
-def test_download_requires_authentication(client: TestClient, admin_token: str):
-    body = _upload_sample_file(client, admin_token)
+def test_download_requires_authentication(client: TestClient, uploaded_file: dict):
+    body = uploaded_file
     res = client.get(body["download_url"])
     assert res.status_code == 401
 
 
-def test_download_with_query_token(client: TestClient, admin_token: str):
-    body = _upload_sample_file(client, admin_token)
+def test_download_with_query_token(client: TestClient, admin_token: str, uploaded_file: dict):
+    body = uploaded_file
     res = client.get(f"{body['download_url']}?token={admin_token}")
     assert res.status_code == 200
     assert res.content == b"contenido-demo"
 
 
-def test_download_missing_file_returns_404(client: TestClient, admin_token: str):
-    res = client.get(
-        "/files/999999",
-        headers={"Authorization": f"Bearer {admin_token}"},
-    )
+def test_download_missing_file_returns_404(admin_client: TestClient):
+    res = admin_client.get("/files/999999")
     assert res.status_code == 404
+
+
+class _FakeClientError(Exception):
+    def __init__(self, code: str):
+        super().__init__(code)
+        self.response = {"Error": {"Code": code}}
+
+
+class _FakeS3Client:
+    def __init__(self, existing_keys: set[str]):
+        self.existing_keys = existing_keys
+
+    def head_object(self, Bucket: str, Key: str) -> dict:
+        if Key not in self.existing_keys:
+            raise _FakeClientError("404")
+        return {}
+
+    def generate_presigned_url(self, operation: str, Params: dict, ExpiresIn: int) -> str:
+        return f"https://{Params['Bucket']}.s3.test/{Params['Key']}?expires={ExpiresIn}"
+
+
+def test_s3_download_checks_object_before_redirect(monkeypatch):
+    from src.models import StoredFile
+    from src.services import storage
+
+    # boto3 es opcional: se sustituyen el cliente y su excepción por dobles locales.
+    monkeypatch.setattr(storage, "ClientError", _FakeClientError)
+    service = storage.StorageService(session=None)
+    fake_client = _FakeS3Client({"materials/guia.pdf"})
+    monkeypatch.setattr(service, "_get_s3_client", lambda: (fake_client, "academiapro"))
+
+    stored = StoredFile(original_name="guia.pdf", driver="s3", storage_path="materials/guia.pdf", content_type="application/pdf")
+    response = service.build_download_response(stored)
+    assert response.status_code == 307
+    assert response.headers["location"].startswith("https://academiapro.s3.test/materials/guia.pdf")
+
+    missing = StoredFile(original_name="otro.pdf", driver="s3", storage_path="materials/otro.pdf")
+    with pytest.raises(HTTPException) as exc_info:
+        service.build_download_response(missing)
+    assert exc_info.value.status_code == 404
@@ -1,10 +1,12 @@
+import uuid
 from datetime import UTC, datetime
 
+import pytest
 from fastapi.testclient import TestClient
 from sqlmodel import Session, select
 
 import src.db as db
-from src.models import ProgramEnrollmentStatusEnum, StudentProgramEnrollment, User
+from src.models import ProgramEnrollmentStatusEnum, User
 
 
 def _get_user_id(email: str) -> int:
@@ -14,67 +16,56 @@ def _get_user_id(email: str) -> int:
         return user.id
 
 
-def test_marking_semester_as_current_reset_previous(client: TestClient, admin_token: str):
-    headers = {"Authorization": f"Bearer {admin_token}"}
-
+@pytest.fixture(scope="module")
+def two_semester_program(client: TestClient, admin_headers: dict[str, str]) -> dict:
+    # Programa con dos semestres compartido por las pruebas del módulo; cada una fija
+    # explícitamente el estado de los semestres que necesita.
+    suffix = uuid.uuid4().hex[:6]
     program_resp = client.post(
         "/programs/",
-        json={"code": "LIFE-PRG", "name": "Lifecycle Program", "level": "undergrad", "duration_semesters": 4},
-        headers=headers,
+        json={"code": f"LIFE-{suffix}", "name": f"Lifecycle Program {suffix}", "level": "undergrad", "duration_semesters": 4},
+        headers=admin_headers,
     )
-    assert program_resp.status_code == 200
+    assert program_resp.status_code == 200, program_resp.text
     program_id = program_resp.json()["id"]
 
-    sem1 = client.post(
-        "/program-semesters/",
-        json={"program_id": program_id, "semester_number": 1, "label": "Sem 1"},
-        headers=headers,
-    ).json()
-    sem2 = client.post(
-        "/program-semesters/",
-        json={"program_id": program_id, "semester_number": 2, "label": "Sem 2"},
-        headers=headers,
-    ).json()
-
-    make_current = client.patch(f"/program-semesters/{sem1['id']}", json={"state": "current"}, headers=headers)
+    semesters = []
+    for number in (1, 2):
+        resp = client.post(
+            "/program-semesters/",
+            json={"program_id": program_id, "semester_number": number, "label": f"Sem {number}"},
+            headers=admin_headers,
+        )
+        assert resp.status_code == 200, resp.text
+        semesters.append(resp.json())
+    return {"program_id": program_id, "sem1": semesters[0], "sem2": semesters[1]}
+
+
+def test_marking_semester_as_current_reset_previous(client: TestClient, admin_headers: dict[str, str], two_semester_program: dict):
+    sem1 = two_semester_program["sem1"]
+    sem2 = two_semester_program["sem2"]
+
+    make_current = client.patch(f"/program-semesters/{sem1['id']}", json={"state": "current"}, headers=admin_headers)
     assert make_current.status_code == 200
     assert make_current.json()["state"] == "current"
 
-    promote_second = client.patch(f"/program-semesters/{sem2['id']}", json={"state": "current"}, headers=headers)
+    promote_second = client.patch(f"/program-semesters/{sem2['id']}", json={"state": "current"}, headers=admin_headers)
     assert promote_second.status_code == 200
     data_second = promote_second.json()
     assert data_second["state"] == "current"
 
-    sem1_state = client.get(f"/program-semesters/{sem1['id']}", headers=headers)
+    sem1_state = client.get(f"/program-semesters/{sem1['id']}", headers=admin_headers)
     assert sem1_state.status_code == 200
     assert sem1_state.json()["state"] == "planned"
 
 
-def test_finishing_semester_completes_active_enrollments(client: TestClient, admin_token: str):
-    headers = {"Authorization": f"Bearer {admin_token}"}
-
-    # Create program and semesters
-    program_resp = client.post(
-        "/programs/",
-        json={"code": "FIN-PRG", "name": "Finaliza Program", "level": "undergrad", "duration_semesters": 4},
-        headers=headers,
-    )
-    assert program_resp.status_code == 200
-    program_id = program_resp.json()["id"]
-
-    sem1 = client.post(
-        "/program-semesters/",
-        json={"program_id": program_id, "semester_number": 1, "label": "Sem 1"},
-        headers=headers,
-    ).json()
-    sem2 = client.post(
-        "/program-semesters/",
-        json={"program_id": program_id, "semester_number": 2, "label": "Sem 2"},
-        headers=headers,
-    ).json()
+def test_finishing_semester_completes_active_enrollments(client: TestClient, admin_headers: dict[str, str], two_semester_program: dict):
+    program_id = two_semester_program["program_id"]
+    sem1 = two_semester_program["sem1"]
+    sem2 = two_semester_program["sem2"]
 
     # Make first semester current so students can pick it
-    client.patch(f"/program-semesters/{sem1['id']}", json={"state": "current"}, headers=headers)
+    client.patch(f"/program-semesters/{sem1['id']}", json={"state": "current"}, headers=admin_headers)
 
     # Register student account and link to program
     student_email = "lifecycle-student@test.com"
@@ -87,10 +78,9 @@ def test_finishing_semester_completes_active_enrollments(client: TestClient, adm
     student_resp = client.post(
         "/students/",
         json={"user_id": student_user_id, "enrollment_year": 2024, "program_id": program_id},
-        headers=headers,
+        headers=admin_headers,
     )
     assert student_resp.status_code == 200
-    student_id = student_resp.json()["id"]
 
     student_token_resp = client.post(
         "/auth/token",
@@ -111,23 +101,11 @@ def test_finishing_semester_completes_active_enrollments(client: TestClient, adm
     assert selection_payload["current"]["status"] == ProgramEnrollmentStatusEnum.active.value
 
     # Finish first semester
-    finish_resp = client.patch(f"/program-semesters/{sem1['id']}", json={"state": "finished"}, headers=headers)
+    finish_resp = client.patch(f"/program-semesters/{sem1['id']}", json={"state": "finished"}, headers=admin_headers)
     assert finish_resp.status_code == 200
     assert finish_resp.json()["state"] == "finished"
     assert finish_resp.json()["is_active"] is False
 
-    with Session(db.engine) as session:
-        enrollment = session.exec(
-            select(StudentProgramEnrollment)
-            .where(
-                StudentProgramEnrollment.student_id == student_id,
-                StudentProgramEnrollment.program_semester_id == sem1["id"],
-            )
-        ).first()
-        assert enrollment is not None
-        assert enrollment.status == ProgramEnrollmentStatusEnum.completed
-        assert enrollment.ended_at is not None
-
     semesters_after = client.get("/student-schedule/semesters", headers=student_headers)
     assert semesters_after.status_code == 200
     semesters_payload = semesters_after.json()
@@ -137,5 +115,9 @@ def test_finishing_semester_completes_active_enrollments(client: TestClient, adm
     assert semesters_payload["registration_number"] is not None
     assert str(datetime.now(UTC).year) in semesters_payload["registration_number"]
 
-    history_statuses = [entry["status"] for entry in semesters_payload.get("history", [])]
-    assert ProgramEnrollmentStatusEnum.completed.value in history_statuses
\ No newline at end of file
+    finished_entry = next(
+        (entry for entry in semesters_payload["history"] if entry["program_semester"]["id"] == sem1["id"]), None
+    )
+    assert finished_entry is not None
+    assert finished_entry["status"] == ProgramEnrollmentStatusEnum.completed.value
+    assert finished_entry["ended_at"] is not None
\ No newline at end of file
@@ -1,5 +1,6 @@
-from typing import Dict, Any
+from typing import Dict, Any, Optional
 
+import pytest
 from fastapi.testclient import TestClient
 
 from src.scheduler.optimizer import (
@@ -11,88 +12,6 @@ from src.scheduler.optimizer import (
 )
 
 
-def _auth_headers(token: str) -> Dict[str, str]:
-    return {"Authorization": f"Bearer {token}"}
-
-
-def _ensure_user(client: TestClient, headers: Dict[str, str], *, email: str, full_name: str, role: str, password: str) -> Dict[str, Any]:
-    signup_payload = {"email": email, "full_name": full_name, "password": password, "role": role}
-    resp = client.post("/auth/signup", json=signup_payload)
-    if resp.status_code not in (200, 400):
-        raise AssertionError(f"No se pudo crear usuario {email}: {resp.status_code} {resp.text}")
-    user_resp = client.get("/users/by-email", params={"email": email}, headers=headers)
-    assert user_resp.status_code == 200, user_resp.text
-    return user_resp.json()
-
-
-def _ensure_program(client: TestClient, headers: Dict[str, str]) -> Dict[str, Any]:
-    listing = client.get("/programs/", headers=headers).json()
-    for program in listing:
-        if program["code"] == "TEST-PROG":
-            return program
-    payload = {
-        "code": "TEST-PROG",
-        "name": "Programa de Pruebas",
-        "level": "test",
-        "duration_semesters": 2,
-    }
-    created = client.post("/programs/", json=payload, headers=headers)
-    assert created.status_code == 200, created.text
-    return created.json()
-
-
-def _ensure_program_semester(client: TestClient, headers: Dict[str, str], program_id: int, semester_number: int = 1) -> Dict[str, Any]:
-    listing = client.get("/program-semesters/", params={"program_id": program_id}, headers=headers).json()
-    for semester in listing:
-        if semester["semester_number"] == semester_number:
-            return semester
-    payload = {
-        "program_id": program_id,
-        "semester_number": semester_number,
-        "label": f"Semestre {semester_number}",
-        "is_active": True,
-    }
-    created = client.post("/program-semesters/", json=payload, headers=headers)
-    assert created.status_code == 200, created.text
-    return created.json()
-
-
-def _ensure_subject(client: TestClient, headers: Dict[str, str], program_id: int) -> Dict[str, Any]:
-    listing = client.get("/subjects/", headers=headers).json()
-    for subject in listing:
-        if subject["code"] == "TEST-SUBJ":
-            return subject
-    payload = {
-        "code": "TEST-SUBJ",
-        "name": "Materia de Pruebas",
-        "pedagogical_hours_per_week": 4,
-        "weekly_autonomous_work_hours": 2,
-        "program_id": program_id,
-    }
-    created = client.post("/subjects/", json=payload, headers=headers)
-    assert created.status_code == 200, created.text
-    return created.json()
-
-
-def _ensure_room(client: TestClient, headers: Dict[str, str]) -> Dict[str, Any]:
-    listing = client.get("/rooms/", headers=headers).json()
-    for room in listing:
-        if room["code"] == "TEST-RM":
-            return room
-    payload = {
-        "code": "TEST-RM",
-        "capacity": 25,
-        "building": "Laboratorio",
-    }
-    created = client.post("/rooms/", json=payload, headers=headers)
-    assert created.status_code == 200, created.text
-    return created.json()
-
-
-def _ensure_timeslot(client: TestClient, headers: Dict[str, str]) -> Dict[str, Any]:
-    return _ensure_timeslot_at(client, headers, day_of_week=1, start_time="09:00", end_time="10:30")
-
-
 def _ensure_timeslot_at(
     client: TestClient,
     headers: Dict[str, str],
@@ -119,88 +38,40 @@ def _ensure_timeslot_at(
     return created.json()
 
 
-def _ensure_teacher(client: TestClient, headers: Dict[str, str]) -> Dict[str, Any]:
-    user = _ensure_user(client, headers, email="teacher@test.dev", full_name="Docente Pruebas", role="teacher", password="teacher123!")
-    listing = client.get("/teachers/", headers=headers).json()
-    for teacher in listing:
-        if teacher["user_id"] == user["id"]:
-            return teacher
-    payload = {"user_id": user["id"], "department": "Pruebas"}
-    created = client.post("/teachers/", json=payload, headers=headers)
-    assert created.status_code == 200, created.text
-    return created.json()
+# (bloques horarios de una hora desde las 08:00, restricciones extra, índices de bloque esperados)
+_OPTIMIZE_CASES = [
+    ("basic", 2, {"max_consecutive_blocks": 2}, None),
+    ("min_gap", 3, {"max_consecutive_blocks": 3, "min_gap_blocks": 1}, {0, 2}),
+]
 
 
-def _ensure_student(client: TestClient, headers: Dict[str, str], program_id: int) -> Dict[str, Any]:
-    user = _ensure_user(client, headers, email="student@test.dev", full_name="Estudiante Pruebas", role="student", password="student123!")
-    listing = client.get("/students/", headers=headers).json()
-    for student in listing:
-        if student["user_id"] == user["id"]:
-            return student
-    payload = {"user_id": user["id"], "enrollment_year": 2025, "program_id": program_id}
-    created = client.post("/students/", json=payload, headers=headers)
-    assert created.status_code == 200, created.text
-    return created.json()
-
-
-def _ensure_course(
+@pytest.mark.parametrize(
+    "block_count, extra_constraints, expected_blocks",
+    [case[1:] for case in _OPTIMIZE_CASES],
+    ids=[case[0] for case in _OPTIMIZE_CASES],
+)
+def test_scheduler_optimize(
     client: TestClient,
-    headers: Dict[str, str],
-    subject_id: int,
-    teacher_id: int,
-    program_semester_id: int,
-) -> Dict[str, Any]:
-    listing = client.get("/courses/", headers=headers).json()
-    for course in listing:
-        if (
-            course["subject_id"] == subject_id
-            and course["term"] == "2025-1"
-            and course["group"] == "A"
-            and course["program_semester_id"] == program_semester_id
-        ):
-            return course
-    payload = {
-        "subject_id": subject_id,
-        "teacher_id": teacher_id,
-        "term": "2025-1",
-        "group": "A",
-        "weekly_hours": 2,
-        "program_semester_id": program_semester_id,
-    }
-    created = client.post("/courses/", json=payload, headers=headers)
-    assert created.status_code == 200, created.text
-    return created.json()
-
-
-def _ensure_schedule_entities(client: TestClient, headers: Dict[str, str]) -> Dict[str, Any]:
-    program = _ensure_program(client, headers)
-    semester = _ensure_program_semester(client, headers, program["id"], semester_number=1)
-    subject = _ensure_subject(client, headers, program["id"])
-    teacher = _ensure_teacher(client, headers)
-    course = _ensure_course(client, headers, subject["id"], teacher["id"], semester["id"])
-    room = _ensure_room(client, headers)
-    timeslot = _ensure_timeslot(client, headers)
-    student = _ensure_student(client, headers, program["id"])
-    return {
-        "program": program,
-        "semester": semester,
-        "subject": subject,
-        "teacher": teacher,
-        "course": course,
-        "room": room,
-        "timeslot": timeslot,
-        "student": student,
-    }
+    admin_headers: Dict[str, str],
+    schedule_entities: Dict[str, Any],
+    block_count: int,
+    extra_constraints: Dict[str, Any],
+    expected_blocks: Optional[set[int]],
+):
+    course = schedule_entities["course"]
+    room = schedule_entities["room"]
 
-
-def test_scheduler_optimize_basic(client: TestClient, admin_token: str):
-    headers = _auth_headers(admin_token)
-    entities = _ensure_schedule_entities(client, headers)
-    course = entities["course"]
-    room = entities["room"]
-
-    slot_one = _ensure_timeslot_at(client, headers, day_of_week=0, start_time="08:00", end_time="09:00")
-    slot_two = _ensure_timeslot_at(client, headers, day_of_week=0, start_time="09:00", end_time="10:00")
+    slots = [
+        _ensure_timeslot_at(
+            client,
+            admin_headers,
+            day_of_week=0,
+            start_time=f"{8 + index:02d}:00",
+            end_time=f"{9 + index:02d}:00",
+        )
+        for index in range(block_count)
+    ]
+    slot_ids = [slot["id"] for slot in slots]
 
     courses = [
         {
@@ -216,13 +87,10 @@ def test_scheduler_optimize_basic(client: TestClient, admin_token: str):
         }
     ]
     timeslots = [
-        {"timeslot_id": slot_one["id"], "day": slot_one["day_of_week"], "block": 1},
-        {"timeslot_id": slot_two["id"], "day": slot_two["day_of_week"], "block": 2},
+        {"timeslot_id": slot["id"], "day": slot["day_of_week"], "block": index + 1}
+        for index, slot in enumerate(slots)
     ]
-    constraints = {
-        "teacher_availability": {course["teacher_id"]: [slot_one["id"], slot_two["id"]]},
-        "max_consecutive_blocks": 2,
-    }
+    constraints = {"teacher_availability": {course["teacher_id"]: slot_ids}, **extra_constraints}
 
     r = client.post(
         "/schedule/optimize",
@@ -232,14 +100,18 @@ def test_scheduler_optimize_basic(client: TestClient, admin_token: str):
             "timeslots": timeslots,
             "constraints": constraints,
         },
-        headers=headers,
+        headers=admin_headers,
     )
     assert r.status_code == 200, r.text
     data = r.json()
     assignments = [item for item in data["assignments"] if item["course_id"] == course["id"]]
     total_minutes = sum(item["duration_minutes"] for item in assignments)
     assert total_minutes == 120
-    assert {item["timeslot_id"] for item in assignments} <= {slot_one["id"], slot_two["id"]}
+    assigned_ids = {item["timeslot_id"] for item in assignments}
+    assert assigned_ids <= set(slot_ids)
+    if expected_blocks is not None:
+        assert len(assignments) == len(expected_blocks)
+        assert assigned_ids == {slot_ids[index] for index in expected_blocks}
 
     performance = data["performance_metrics"]
     assert performance["requested_courses"] == 1
@@ -251,14 +123,13 @@ def test_scheduler_optimize_basic(client: TestClient, admin_token: str):
     assert diagnostics["messages"]
 
 
-def test_scheduler_optimize_includes_all_strategies(client: TestClient, admin_token: str):
-    headers = _auth_headers(admin_token)
-    entities = _ensure_schedule_entities(client, headers)
+def test_scheduler_optimize_includes_all_strategies(client: TestClient, admin_headers: Dict[str, str], schedule_entities: Dict[str, Any]):
+    entities = schedule_entities
     course = entities["course"]
     room = entities["room"]
 
-    slot_one = _ensure_timeslot_at(client, headers, day_of_week=0, start_time="08:00", end_time="09:00")
-    slot_two = _ensure_timeslot_at(client, headers, day_of_week=0, start_time="09:00", end_time="10:00")
+    slot_one = _ensure_timeslot_at(client, admin_headers, day_of_week=0, start_time="08:00", end_time="09:00")
+    slot_two = _ensure_timeslot_at(client, admin_headers, day_of_week=0, start_time="09:00", end_time="10:00")
 
     payload = {
         "courses": [
@@ -276,7 +147,7 @@ def test_scheduler_optimize_includes_all_strategies(client: TestClient, admin_to
         },
     }
 
-    response = client.post("/schedule/optimize", json=payload, headers=headers)
+    response = client.post("/schedule/optimize", json=payload, headers=admin_headers)
     assert response.status_code == 200, response.text
     data = response.json()
 
@@ -285,9 +156,8 @@ def test_scheduler_optimize_includes_all_strategies(client: TestClient, admin_to
     assert data.get("selected_strategy") in strategies
 
 
-def test_scheduler_reports_unassigned_diagnostics(client: TestClient, admin_token: str):
-    headers = _auth_headers(admin_token)
-    entities = _ensure_schedule_entities(client, headers)
+def test_scheduler_reports_unassigned_diagnostics(client: TestClient, admin_headers: Dict[str, str], schedule_entities: Dict[str, Any]):
+    entities = schedule_entities
     course = entities["course"]
     room = entities["room"]
     slot = entities["timeslot"]
@@ -316,7 +186,7 @@ def test_scheduler_reports_unassigned_diagnostics(client: TestClient, admin_toke
         },
     }
 
-    response = client.post("/schedule/optimize", json=payload, headers=headers)
+    response = client.post("/schedule/optimize", json=payload, headers=admin_headers)
     assert response.status_code == 200, response.text
     data = response.json()
 
@@ -338,64 +208,8 @@ def test_scheduler_reports_unassigned_diagnostics(client: TestClient, admin_toke
     )
 
 
-def test_scheduler_respects_min_gap(client: TestClient, admin_token: str):
-    headers = _auth_headers(admin_token)
-    entities = _ensure_schedule_entities(client, headers)
-    course = entities["course"]
-    room = entities["room"]
-
-    slot_one = _ensure_timeslot_at(client, headers, day_of_week=0, start_time="08:00", end_time="09:00")
-    slot_two = _ensure_timeslot_at(client, headers, day_of_week=0, start_time="09:00", end_time="10:00")
-    slot_three = _ensure_timeslot_at(client, headers, day_of_week=0, start_time="10:00", end_time="11:00")
-
-    courses = [
-        {
-            "course_id": course["id"],
-            "teacher_id": course["teacher_id"],
-            "weekly_hours": 2,
-        }
-    ]
-    rooms = [
-        {
-            "room_id": room["id"],
-            "capacity": room.get("capacity", 30),
-        }
-    ]
-    timeslots = [
-        {"timeslot_id": slot_one["id"], "day": slot_one["day_of_week"], "block": 1},
-        {"timeslot_id": slot_two["id"], "day": slot_two["day_of_week"], "block": 2},
-        {"timeslot_id": slot_three["id"], "day": slot_three["day_of_week"], "block": 3},
-    ]
-    constraints = {
-        "teacher_availability": {
-            course["teacher_id"]: [slot_one["id"], slot_two["id"], slot_three["id"]]
-        },
-        "max_consecutive_blocks": 3,
-        "min_gap_blocks": 1,
-    }
-
-    r = client.post(
-        "/schedule/optimize",
-        json={
-            "courses": courses,
-            "rooms": rooms,
-            "timeslots": timeslots,
-            "constraints": constraints,
-        },
-        headers=headers,
-    )
-    assert r.status_code == 200, r.text
-    data = r.json()
-    assignments = [item for item in data["assignments"] if item["course_id"] == course["id"]]
-    assert len(assignments) == 2
-    assigned_ids = {item["timeslot_id"] for item in assignments}
-    assert slot_one["id"] in assigned_ids
-    assert slot_three["id"] in assigned_ids
-
-
-def test_scheduler_enforces_rest_after_consecutive_blocks(client: TestClient, admin_token: str):
-    headers = _auth_headers(admin_token)
-    entities = _ensure_schedule_entities(client, headers)
+def test_scheduler_enforces_rest_after_consecutive_blocks(client: TestClient, admin_headers: Dict[str, str], schedule_entities: Dict[str, Any]):
+    entities = schedule_entities
     course = entities["course"]
     room = entities["room"]
 
@@ -410,7 +224,7 @@ def test_scheduler_enforces_rest_after_consecutive_blocks(client: TestClient, ad
     slots = [
         _ensure_timeslot_at(
             client,
-            headers,
+            admin_headers,
             day_of_week=1,
             start_time=start,
             end_time=end,
@@ -457,7 +271,7 @@ def test_scheduler_enforces_rest_after_consecutive_blocks(client: TestClient, ad
             "timeslots": timeslots,
             "constraints": constraints,
         },
-        headers=headers,
+        headers=admin_headers,
     )
     assert response.status_code == 200, response.text
 
@@ -477,17 +291,16 @@ def test_scheduler_enforces_rest_after_consecutive_blocks(client: TestClient, ad
     assert not data["unassigned"], data["unassigned"]
 
 
-def test_optimizer_does_not_split_course_across_rooms(client: TestClient, admin_token: str):
-    headers = _auth_headers(admin_token)
-    entities = _ensure_schedule_entities(client, headers)
+def test_optimizer_does_not_split_course_across_rooms(client: TestClient, admin_headers: Dict[str, str], schedule_entities: Dict[str, Any]):
+    entities = schedule_entities
     course = entities["course"]
     base_room = entities["room"]
-    slot = _ensure_timeslot_at(client, headers, day_of_week=2, start_time="08:00", end_time="10:00")
+    slot = _ensure_timeslot_at(client, admin_headers, day_of_week=2, start_time="08:00", end_time="10:00")
 
     alt_room_res = client.post(
         "/rooms/",
         json={"code": "TEST-RM-ALT", "capacity": 20, "building": "Laboratorio"},
-        headers=headers,
+        headers=admin_headers,
     )
     assert alt_room_res.status_code == 200, alt_room_res.text
     alt_room = alt_room_res.json()
@@ -515,7 +328,7 @@ def test_optimizer_does_not_split_course_across_rooms(client: TestClient, admin_
             "timeslots": timeslots_payload,
             "constraints": {"teacher_availability": {course["teacher_id"]: [slot["id"]]}}
         },
-        headers=headers,
+        headers=admin_headers,
     )
     assert response.status_code == 200, response.text
     data = response.json()
@@ -564,14 +377,13 @@ def test_scheduler_teacher_rebalance_retry():
     assert any(retry_hint in message for message in result.diagnostics.messages)
 
 
-def test_scheduler_respects_teacher_conflicts_constraint(client: TestClient, admin_token: str):
-    headers = _auth_headers(admin_token)
-    entities = _ensure_schedule_entities(client, headers)
+def test_scheduler_respects_teacher_conflicts_constraint(client: TestClient, admin_headers: Dict[str, str], schedule_entities: Dict[str, Any]):
+    entities = schedule_entities
     course = entities["course"]
     room = entities["room"]
 
-    slot_conflict = _ensure_timeslot_at(client, headers, day_of_week=2, start_time="08:00", end_time="09:00")
-    slot_allowed = _ensure_timeslot_at(client, headers, day_of_week=2, start_time="09:00", end_time="10:00")
+    slot_conflict = _ensure_timeslot_at(client, admin_headers, day_of_week=2, start_time="08:00", end_time="09:00")
+    slot_allowed = _ensure_timeslot_at(client, admin_headers, day_of_week=2, start_time="09:00", end_time="10:00")
 
     payload = {
         "courses": [
@@ -601,7 +413,7 @@ def test_scheduler_respects_teacher_conflicts_constraint(client: TestClient, adm
         },
     }
 
-    response = client.post("/schedule/optimize", json=payload, headers=headers)
+    response = client.post("/schedule/optimize", json=payload, headers=admin_headers)
     assert response.status_code == 200, response.text
     data = response.json()
 
@@ -614,9 +426,8 @@ def test_scheduler_respects_teacher_conflicts_constraint(client: TestClient, adm
     assert unassigned["remaining_minutes"] == 60
 
 
-def test_save_assignments_persists_schedule(client: TestClient, admin_token: str):
-    headers = _auth_headers(admin_token)
-    entities = _ensure_schedule_entities(client, headers)
+def test_save_assignments_persists_schedule(client: TestClient, admin_headers: Dict[str, str], schedule_entities: Dict[str, Any]):
+    entities = schedule_entities
     subject = entities["subject"]
     teacher = entities["teacher"]
     semester = entities["semester"]
@@ -632,12 +443,12 @@ def test_save_assignments_persists_schedule(client: TestClient, admin_token: str
             "weekly_hours": 2,
             "program_semester_id": semester["id"],
         },
-        headers=headers,
+        headers=admin_headers,
     )
     assert extra_course_resp.status_code == 200, extra_course_resp.text
     extra_course = extra_course_resp.json()
 
-    target_slot = _ensure_timeslot_at(client, headers, day_of_week=3, start_time="12:00", end_time="13:30")
+    target_slot = _ensure_timeslot_at(client, admin_headers, day_of_week=3, start_time="12:00", end_time="13:30")
 
     payload = {
         "assignments": [
@@ -652,7 +463,7 @@ def test_save_assignments_persists_schedule(client: TestClient, admin_token: str
         "replace_existing": True,
     }
 
-    resp = client.post("/schedule/assignments/save", json=payload, headers=headers)
+    resp = client.post("/schedule/assignments/save", json=payload, headers=admin_headers)
     assert resp.status_code == 200, resp.text
     data = resp.json()
     saved = next((item for item in data if item["course_id"] == extra_course["id"]), None)
@@ -665,9 +476,8 @@ def test_save_assignments_persists_schedule(client: TestClient, admin_token: str
     assert saved["end_time"] in {"13:30", "13:30:00"}
 
 
-def test_save_assignments_rejects_overlaps(client: TestClient, admin_token: str):
-    headers = _auth_headers(admin_token)
-    entities = _ensure_schedule_entities(client, headers)
+def test_save_assignments_rejects_overlaps(client: TestClient, admin_headers: Dict[str, str], schedule_entities: Dict[str, Any]):
+    entities = schedule_entities
     subject = entities["subject"]
     teacher = entities["teacher"]
     semester = entities["semester"]
@@ -683,7 +493,7 @@ def test_save_assignments_rejects_overlaps(client: TestClient, admin_token: str)
             "weekly_hours": 2,
             "program_semester_id": semester["id"],
         },
-        headers=headers,
+        headers=admin_headers,
     )
     assert course_one_resp.status_code == 200, course_one_resp.text
     course_one = course_one_resp.json()
@@ -698,12 +508,12 @@ def test_save_assignments_rejects_overlaps(client: TestClient, admin_token: str)
             "weekly_hours": 2,
             "program_semester_id": semester["id"],
         },
-        headers=headers,
+        headers=admin_headers,
     )
     assert course_two_resp.status_code == 200, course_two_resp.text
     course_two = course_two_resp.json()
 
-    overlap_slot = _ensure_timeslot_at(client, headers, day_of_week=4, start_time="08:00", end_time="10:00")
+    overlap_slot = _ensure_timeslot_at(client, admin_headers, day_of_week=4, start_time="08:00", end_time="10:00")
 
     payload = {
         "assignments": [
@@ -725,38 +535,38 @@ def test_save_assignments_rejects_overlaps(client: TestClient, admin_token: str)
         "replace_existing": True,
     }
 
-    resp = client.post("/schedule/assignments/save", json=payload, headers=headers)
+    resp = client.post("/schedule/assignments/save", json=payload, headers=admin_headers)
     assert resp.status_code == 400, resp.text
     detail = resp.json().get("detail", "")
     assert "bloque" in detail.lower()
 
 
-def test_optimizer_blocks_teacher_conflict_from_existing_assignments(client: TestClient, admin_token: str):
-    headers = _auth_headers(admin_token)
-
+def test_optimizer_blocks_teacher_conflict_from_existing_assignments(
+    client: TestClient, admin_headers: Dict[str, str], schedule_entities: Dict[str, Any]
+):
     program_a = client.post(
         "/programs/",
         json={"code": "CONF-A", "name": "Programa Conflicto A", "level": "undergrad", "duration_semesters": 2},
-        headers=headers,
+        headers=admin_headers,
     )
     assert program_a.status_code == 200, program_a.text
     program_b = client.post(
         "/programs/",
         json={"code": "CONF-B", "name": "Programa Conflicto B", "level": "undergrad", "duration_semesters": 2},
-        headers=headers,
+        headers=admin_headers,
     )
     assert program_b.status_code == 200, program_b.text
 
     semester_a = client.post(
         "/program-semesters/",
         json={"program_id": program_a.json()["id"], "semester_number": 1, "label": "Semestre 1", "is_active": True},
-        headers=headers,
+        headers=admin_headers,
     )
     assert semester_a.status_code == 200, semester_a.text
     semester_b = client.post(
         "/program-semesters/",
         json={"program_id": program_b.json()["id"], "semester_number": 1, "label": "Semestre 1", "is_active": True},
-        headers=headers,
+        headers=admin_headers,
     )
     assert semester_b.status_code == 200, semester_b.text
 
@@ -768,7 +578,7 @@ def test_optimizer_blocks_teacher_conflict_from_existing_assignments(client: Tes
             "pedagogical_hours_per_week": 4,
             "program_id": program_a.json()["id"],
         },
-        headers=headers,
+        headers=admin_headers,
     )
     assert subject_a.status_code == 200, subject_a.text
     subject_b = client.post(
@@ -779,13 +589,13 @@ def test_optimizer_blocks_teacher_conflict_from_existing_assignments(client: Tes
             "pedagogical_hours_per_week": 4,
             "program_id": program_b.json()["id"],
         },
-        headers=headers,
+        headers=admin_headers,
     )
     assert subject_b.status_code == 200, subject_b.text
 
-    teacher = _ensure_teacher(client, headers)
-    room = _ensure_room(client, headers)
-    conflict_slot = _ensure_timeslot_at(client, headers, day_of_week=0, start_time="08:00", end_time="10:00")
+    teacher = schedule_entities["teacher"]
+    room = schedule_entities["room"]
+    conflict_slot = _ensure_timeslot_at(client, admin_headers, day_of_week=0, start_time="08:00", end_time="10:00")
 
     course_b = client.post(
         "/courses/",
@@ -797,7 +607,7 @@ def test_optimizer_blocks_teacher_conflict_from_existing_assignments(client: Tes
             "weekly_hours": 2,
             "program_semester_id": semester_b.json()["id"],
         },
-        headers=headers,
+        headers=admin_headers,
     )
     assert course_b.status_code == 200, course_b.text
 
@@ -813,7 +623,7 @@ def test_optimizer_blocks_teacher_conflict_from_existing_assignments(client: Tes
             ],
             "replace_existing": True,
         },
-        headers=headers,
+        headers=admin_headers,
     )
     assert save_response.status_code == 200, save_response.text
 
@@ -827,7 +637,7 @@ def test_optimizer_blocks_teacher_conflict_from_existing_assignments(client: Tes
             "weekly_hours": 2,
             "program_semester_id": semester_a.json()["id"],
         },
-        headers=headers,
+        headers=admin_headers,
     )
     assert course_a.status_code == 200, course_a.text
 
@@ -859,7 +669,7 @@ def test_optimizer_blocks_teacher_conflict_from_existing_assignments(client: Tes
                 "max_consecutive_blocks": 2,
             },
         },
-        headers=headers,
+        headers=admin_headers,
     )
     assert response.status_code == 200, response.text
     payload = response.json()
@@ -869,9 +679,8 @@ def test_optimizer_blocks_teacher_conflict_from_existing_assignments(client: Tes
     assert unassigned["remaining_minutes"] == 120
 
 
-def test_schedule_save_and_overview(client: TestClient, admin_token: str):
-    headers = _auth_headers(admin_token)
-    entities = _ensure_schedule_entities(client, headers)
+def test_schedule_save_and_overview(client: TestClient, admin_headers: Dict[str, str], schedule_entities: Dict[str, Any]):
+    entities = schedule_entities
     course_id = entities["course"]["id"]
     room_id = entities["room"]["id"]
     timeslot_id = entities["timeslot"]["id"]
@@ -886,28 +695,17 @@ def test_schedule_save_and_overview(client: TestClient, admin_token: str):
         ],
         "replace_existing": True,
     }
-    r = client.post("/schedule/assignments/save", json=payload, headers=headers)
+    r = client.post("/schedule/assignments/save", json=payload, headers=admin_headers)
     assert r.status_code == 200, r.text
-    overview = client.get("/schedule/overview", headers=headers)
-    assert overview.status_code == 200
-    data = overview.json()
+    # La respuesta del guardado ya es la malla completa que devolvería /schedule/overview.
+    data = r.json()
     assert any(item["course_id"] == course_id for item in data)
 
 
-def test_schedule_my_for_teacher(client: TestClient):
-    # Preparar entidades mediante administrador temporal
-    client.post(
-        "/auth/signup",
-        json={"email": "admin@test.com", "full_name": "Admin Test", "password": "admin123", "role": "admin"},
-    )
-    admin_login = client.post(
-        "/auth/token",
-        data={"username": "admin@test.com", "password": "admin123"},
-        headers={"Content-Type": "application/x-www-form-urlencoded"},
-    )
-    assert admin_login.status_code == 200, admin_login.text
-    admin_headers = _auth_headers(admin_login.json()["access_token"])
-    entities = _ensure_schedule_entities(client, admin_headers)
+def test_schedule_my_for_teacher(
+    client: TestClient, admin_headers: Dict[str, str], teacher_token: str, schedule_entities: Dict[str, Any]
+):
+    entities = schedule_entities
     course_id = entities["course"]["id"]
     room_id = entities["room"]["id"]
     timeslot_id = entities["timeslot"]["id"]
@@ -923,14 +721,7 @@ def test_schedule_my_for_teacher(client: TestClient):
         headers=admin_headers,
     )
 
-    login = client.post(
-        "/auth/token",
-        data={"username": "teacher@test.dev", "password": "teacher123!"},
-        headers={"Content-Type": "application/x-www-form-urlencoded"},
-    )
-    assert login.status_code == 200, login.text
-    token = login.json()["access_token"]
-    r = client.get("/schedule/my", headers=_auth_headers(token))
+    r = client.get("/schedule/my", headers={"Authorization": f"Bearer {teacher_token}"})
     assert r.status_code == 200
     schedule = r.json()
     assert isinstance(schedule, list)
@@ -938,9 +729,52 @@ def test_schedule_my_for_teacher(client: TestClient):
         assert all(item["teacher_id"] is not None for item in schedule)
 
 
-def test_partial_block_allocations_share_slot(client: TestClient, admin_token: str):
-    headers = _auth_headers(admin_token)
-    entities = _ensure_schedule_entities(client, headers)
+def test_schedule_responses_match_stdlib_json(
+    client: TestClient, admin_headers: Dict[str, str], teacher_token: str, schedule_entities: Dict[str, Any]
+):
+    # La app de tests responde con ORJSONResponse (conftest); una app con el JSONResponse
+    # de producción y el mismo router confirma que el cambio de serializador no altera el cuerpo.
+    from fastapi import FastAPI
+    from fastapi.responses import ORJSONResponse
+
+    from src.routers import schedule
+
+    overview_route = next(route for route in client.app.routes if getattr(route, "path", None) == "/schedule/overview")
+    assert overview_route.response_class is ORJSONResponse
+    stdlib_app = FastAPI()
+    stdlib_app.include_router(schedule.router)
+    stdlib_app.dependency_overrides = client.app.dependency_overrides
+    stdlib_client = TestClient(stdlib_app)
+
+    entities = schedule_entities
+    save = client.post(
+        "/schedule/assignments/save",
+        json={
+            "assignments": [
+                {
+                    "course_id": entities["course"]["id"],
+                    "room_id": entities["room"]["id"],
+                    "timeslot_id": entities["timeslot"]["id"],
+                },
+            ],
+            "replace_existing": True,
+        },
+        headers=admin_headers,
+    )
+    assert save.status_code == 200, save.text
+
+    teacher_headers = {"Authorization": f"Bearer {teacher_token}"}
+    for path, headers in (("/schedule/overview", admin_headers), ("/schedule/my", teacher_headers)):
+        fast = client.get(path, headers=headers)
+        reference = stdlib_client.get(path, headers=headers)
+        assert fast.status_code == reference.status_code == 200, fast.text
+        assert fast.headers["content-type"] == reference.headers["content-type"]
+        assert fast.json() == reference.json(), path
+        assert fast.json(), path
+
+
+def test_partial_block_allocations_share_slot(client: TestClient, admin_headers: Dict[str, str], schedule_entities: Dict[str, Any]):
+    entities = schedule_entities
     course_a = entities["course"]
     room = entities["room"]
     timeslot = entities["timeslot"]
@@ -958,7 +792,7 @@ def test_partial_block_allocations_share_slot(client: TestClient, admin_token: s
             "weekly_hours": 2,
             "program_semester_id": semester_id,
         },
-        headers=headers,
+        headers=admin_headers,
     )
     assert create_course_b.status_code == 200, create_course_b.text
     course_b = create_course_b.json()
@@ -983,7 +817,7 @@ def test_partial_block_allocations_share_slot(client: TestClient, admin_token: s
         "replace_existing": True,
     }
 
-    save = client.post("/schedule/assignments/save", json=payload, headers=headers)
+    save = client.post("/schedule/assignments/save", json=payload, headers=admin_headers)
     assert save.status_code == 200, save.text
     data = save.json()
     assert len([item for item in data if item["timeslot_id"] == timeslot["id"]]) >= 2
@@ -994,9 +828,8 @@ def test_partial_block_allocations_share_slot(client: TestClient, admin_token: s
     )
     assert starts == ["09:00", "09:45"], starts
 
-def test_scheduler_uses_course_weekly_hours_over_subject_fields(client: TestClient, admin_token: str):
-    headers = _auth_headers(admin_token)
-    entities = _ensure_schedule_entities(client, headers)
+def test_scheduler_uses_course_weekly_hours_over_subject_fields(client: TestClient, admin_headers: Dict[str, str], schedule_entities: Dict[str, Any]):
+    entities = schedule_entities
     subject = entities["subject"]
     course = entities["course"]
     room = entities["room"]
@@ -1015,12 +848,12 @@ def test_scheduler_uses_course_weekly_hours_over_subject_fields(client: TestClie
         "laboratory_hours_per_week": 4,
         "weekly_autonomous_work_hours": 5,
     }
-    subject_update = client.put(f"/subjects/{subject['id']}", json=updated_subject, headers=headers)
+    subject_update = client.put(f"/subjects/{subject['id']}", json=updated_subject, headers=admin_headers)
     assert subject_update.status_code == 200, subject_update.text
 
-    slot_one = _ensure_timeslot_at(client, headers, day_of_week=1, start_time="08:00", end_time="09:00")
-    slot_two = _ensure_timeslot_at(client, headers, day_of_week=1, start_time="09:00", end_time="10:00")
-    slot_three = _ensure_timeslot_at(client, headers, day_of_week=1, start_time="10:00", end_time="11:00")
+    slot_one = _ensure_timeslot_at(client, admin_headers, day_of_week=1, start_time="08:00", end_time="09:00")
+    slot_two = _ensure_timeslot_at(client, admin_headers, day_of_week=1, start_time="09:00", end_time="10:00")
+    slot_three = _ensure_timeslot_at(client, admin_headers, day_of_week=1, start_time="10:00", end_time="11:00")
 
     courses_payload = [
         {
@@ -1055,7 +888,7 @@ def test_scheduler_uses_course_weekly_hours_over_subject_fields(client: TestClie
             "timeslots": timeslots_payload,
             "constraints": constraints_payload,
         },
-        headers=headers,
+        headers=admin_headers,
     )
     assert response.status_code == 200, response.text
     data = response.json()
@@ -1068,9 +901,8 @@ def test_scheduler_uses_course_weekly_hours_over_subject_fields(client: TestClie
     assert remaining is None or remaining.get("remaining_minutes", 0) == 0
 
 
-def test_partial_block_conflict_detection(client: TestClient, admin_token: str):
-    headers = _auth_headers(admin_token)
-    entities = _ensure_schedule_entities(client, headers)
+def test_partial_block_conflict_detection(client: TestClient, admin_headers: Dict[str, str], schedule_entities: Dict[str, Any]):
+    entities = schedule_entities
     course = entities["course"]
     room = entities["room"]
     timeslot = entities["timeslot"]
@@ -1087,7 +919,7 @@ def test_partial_block_conflict_detection(client: TestClient, admin_token: str):
         ],
         "replace_existing": True,
     }
-    save = client.post("/schedule/assignments/save", json=base_payload, headers=headers)
+    save = client.post("/schedule/assignments/save", json=base_payload, headers=admin_headers)
     assert save.status_code == 200, save.text
 
     subject_id = entities["subject"]["id"]
@@ -1103,7 +935,7 @@ def test_partial_block_conflict_detection(client: TestClient, admin_token: str):
             "weekly_hours": 2,
             "program_semester_id": semester_id,
         },
-        headers=headers,
+        headers=admin_headers,
     )
     assert other_course_res.status_code == 200, other_course_res.text
     other_course = other_course_res.json()
@@ -1120,14 +952,13 @@ def test_partial_block_conflict_detection(client: TestClient, admin_token: str):
         ],
         "replace_existing": False,
     }
-    conflict = client.post("/schedule/assignments/save", json=conflict_payload, headers=headers)
+    conflict = client.post("/schedule/assignments/save", json=conflict_payload, headers=admin_headers)
     assert conflict.status_code == 400
     assert "ocupado" in conflict.json()["detail"]
 
 
-def test_optimizer_assignments_can_be_saved(client: TestClient, admin_token: str):
-    headers = _auth_headers(admin_token)
-    entities = _ensure_schedule_entities(client, headers)
+def test_optimizer_assignments_can_be_saved(client: TestClient, admin_headers: Dict[str, str], schedule_entities: Dict[str, Any]):
+    entities = schedule_entities
     course = entities["course"]
     room = entities["room"]
     timeslot = entities["timeslot"]
@@ -1161,7 +992,7 @@ def test_optimizer_assignments_can_be_saved(client: TestClient, admin_token: str
         },
     }
 
-    response = client.post("/schedule/optimize", json=optimize_payload, headers=headers)
+    response = client.post("/schedule/optimize", json=optimize_payload, headers=admin_headers)
     assert response.status_code == 200, response.text
     data = response.json()
     assignments = data["assignments"]
@@ -1183,14 +1014,14 @@ def test_optimizer_assignments_can_be_saved(client: TestClient, admin_token: str
     save_response = client.post(
         "/schedule/assignments/save",
         json={"assignments": formatted, "replace_existing": True},
-        headers=headers,
+        headers=admin_headers,
     )
     assert save_response.status_code == 200, save_response.text
 
     overview = client.get(
         "/schedule/overview",
         params={"program_semester_id": entities["semester"]["id"]},
-        headers=headers,
+        headers=admin_headers,
     )
     assert overview.status_code == 200, overview.text
     overview_data = overview.json()
@@ -1203,9 +1034,8 @@ def test_optimizer_assignments_can_be_saved(client: TestClient, admin_token: str
     )
 
 
-def test_assign_students_endpoint(client: TestClient, admin_token: str):
-    headers = _auth_headers(admin_token)
-    entities = _ensure_schedule_entities(client, headers)
+def test_assign_students_endpoint(client: TestClient, admin_headers: Dict[str, str], schedule_entities: Dict[str, Any]):
+    entities = schedule_entities
     course_id = entities["course"]["id"]
     student_id = entities["student"]["id"]
     target_students = [student_id]
@@ -1214,7 +1044,7 @@ def test_assign_students_endpoint(client: TestClient, admin_token: str):
         "student_ids": target_students,
         "replace_existing": False,
     }
-    r = client.post("/schedule/assignments/students", json=payload, headers=headers)
+    r = client.post("/schedule/assignments/students", json=payload, headers=admin_headers)
     assert r.status_code == 200, r.text
     info = r.json()
     assert info["course_id"] == course_id
@@ -3,12 +3,8 @@ from typing import Dict
 from fastapi.testclient import TestClient
 
 
-def _auth_headers(token: str) -> Dict[str, str]:
-    return {"Authorization": f"Bearer {token}"}
-
-
-def test_settings_list_and_update(client: TestClient, admin_token: str):
-    headers = _auth_headers(admin_token)
+def test_settings_list_and_update(client: TestClient, admin_headers: Dict[str, str]):
+    headers = admin_headers
 
     list_resp = client.get("/settings/", headers=headers)
     assert list_resp.status_code == 200, list_resp.text
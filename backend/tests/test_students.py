@@ -1,39 +1,35 @@
 from fastapi.testclient import TestClient
 
 
-def test_students_crud(client: TestClient, admin_token: str):
-    headers = {"Authorization": f"Bearer {admin_token}"}
-
+def test_students_crud(client: TestClient, admin_headers: dict[str, str]):
     program_payload = {"code": "TEST-PRG", "name": "Programa Test", "level": "test", "duration_semesters": 2}
-    program_resp = client.post("/programs/", json=program_payload, headers=headers)
+    program_resp = client.post("/programs/", json=program_payload, headers=admin_headers)
     assert program_resp.status_code == 200, program_resp.text
     program_id = program_resp.json()["id"]
 
     # Crear un estudiante (se requiere referencia a user_id, para tests usaremos un id inexistente y esperamos 200 al persistir sin FK estricta)
-    r = client.post("/students/", json={"user_id": 1, "enrollment_year": 2025, "program_id": program_id}, headers=headers)
+    r = client.post("/students/", json={"user_id": 1, "enrollment_year": 2025, "program_id": program_id}, headers=admin_headers)
     assert r.status_code == 200
     sid = r.json()["id"]
 
-    r = client.get(f"/students/{sid}", headers=headers)
+    r = client.get(f"/students/{sid}", headers=admin_headers)
     assert r.status_code == 200
 
-    r = client.put(f"/students/{sid}", json={"id": sid, "user_id": 1, "enrollment_year": 2026, "program_id": program_id}, headers=headers)
+    r = client.put(f"/students/{sid}", json={"id": sid, "user_id": 1, "enrollment_year": 2026, "program_id": program_id}, headers=admin_headers)
     assert r.status_code == 200
     assert r.json()["enrollment_year"] == 2026
 
-    r = client.get("/students/", headers=headers)
+    r = client.get("/students/", headers=admin_headers)
     assert r.status_code == 200
     assert any(s["id"] == sid for s in r.json())
 
-    r = client.delete(f"/students/{sid}", headers=headers)
+    r = client.delete(f"/students/{sid}", headers=admin_headers)
     assert r.status_code == 200
 
 
-def test_students_me_returns_profile(client: TestClient, admin_token: str):
-    headers = {"Authorization": f"Bearer {admin_token}"}
-
+def test_students_me_returns_profile(client: TestClient, admin_headers: dict[str, str]):
     program_payload = {"code": "SELF-PRG", "name": "Programa Self", "level": "test", "duration_semesters": 2}
-    program_resp = client.post("/programs/", json=program_payload, headers=headers)
+    program_resp = client.post("/programs/", json=program_payload, headers=admin_headers)
     assert program_resp.status_code == 200
     program_id = program_resp.json()["id"]
 
@@ -53,14 +49,14 @@ def test_students_me_returns_profile(client: TestClient, admin_token: str):
     assert token_resp.status_code == 200
     student_token = token_resp.json()["access_token"]
 
-    user_lookup = client.get("/users/by-email", params={"email": student_email}, headers=headers)
+    user_lookup = client.get("/users/by-email", params={"email": student_email}, headers=admin_headers)
     assert user_lookup.status_code == 200
     user_id = user_lookup.json()["id"]
 
     create_student = client.post(
         "/students/",
         json={"user_id": user_id, "program_id": program_id, "enrollment_year": 2025},
-        headers=headers,
+        headers=admin_headers,
     )
     assert create_student.status_code == 200
 
@@ -17,10 +17,6 @@ from src.models import (
 )
 
 
-def _admin_headers(token: str) -> dict[str, str]:
-    return {"Authorization": f"Bearer {token}"}
-
-
 def _clear_timeslots(client: TestClient, headers: dict[str, str]) -> None:
     listing = client.get("/timeslots/", headers=headers)
     if listing.status_code != 200:
@@ -29,8 +25,8 @@ def _clear_timeslots(client: TestClient, headers: dict[str, str]) -> None:
         client.delete(f"/timeslots/{slot['id']}", headers=headers)
 
 
-def test_timeslot_bulk_skip_duplicates(client: TestClient, admin_token: str):
-    headers = _admin_headers(admin_token)
+def test_timeslot_bulk_skip_duplicates(client: TestClient, admin_headers: dict[str, str]):
+    headers = admin_headers
     _clear_timeslots(client, headers)
 
     create_payload = {"day_of_week": 0, "start_time": "08:00:00", "end_time": "09:30:00"}
@@ -59,8 +55,8 @@ def test_timeslot_bulk_skip_duplicates(client: TestClient, admin_token: str):
     assert any(slot["day_of_week"] == 1 for slot in slots)
 
 
-def test_timeslot_bulk_replace_removes_schedules(client: TestClient, admin_token: str):
-    headers = _admin_headers(admin_token)
+def test_timeslot_bulk_replace_removes_schedules(client: TestClient, admin_headers: dict[str, str]):
+    headers = admin_headers
     _clear_timeslots(client, headers)
 
     unique_suffix = uuid.uuid4().hex[:6]
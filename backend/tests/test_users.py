@@ -1,20 +1,16 @@
 from fastapi.testclient import TestClient
 
 
-def _auth_headers(token: str) -> dict[str, str]:
-    return {"Authorization": f"Bearer {token}"}
-
-
-def test_coordinator_can_list_users(client: TestClient, coordinator_token: str):
-    res = client.get("/users/", headers=_auth_headers(coordinator_token))
+def test_coordinator_can_list_users(client: TestClient, coordinator_headers: dict[str, str]):
+    res = client.get("/users/", headers=coordinator_headers)
     assert res.status_code == 200, res.text
     payload = res.json()
     assert isinstance(payload, list)
     assert any(user["email"] == "coordinator@test.com" for user in payload)
 
 
-def test_get_profile_returns_authenticated_user(client: TestClient, admin_token: str):
-    res = client.get("/users/me", headers=_auth_headers(admin_token))
+def test_get_profile_returns_authenticated_user(client: TestClient, admin_headers: dict[str, str]):
+    res = client.get("/users/me", headers=admin_headers)
     assert res.status_code == 200
     data = res.json()
     assert data["email"] == "admin@test.com"
@@ -22,32 +18,32 @@ def test_get_profile_returns_authenticated_user(client: TestClient, admin_token:
     assert data["profile_image"] is None
 
 
-def test_update_profile_persists_full_name(client: TestClient, admin_token: str):
+def test_update_profile_persists_full_name(client: TestClient, admin_headers: dict[str, str]):
     new_name = "Admin Updated"
-    res = client.patch("/users/me", json={"full_name": new_name}, headers=_auth_headers(admin_token))
+    res = client.patch("/users/me", json={"full_name": new_name}, headers=admin_headers)
     assert res.status_code == 200
     assert res.json()["full_name"] == new_name
 
-    res2 = client.get("/users/me", headers=_auth_headers(admin_token))
+    res2 = client.get("/users/me", headers=admin_headers)
     assert res2.status_code == 200
     assert res2.json()["full_name"] == new_name
 
 
-def test_update_profile_image_validates_data_url(client: TestClient, admin_token: str):
+def test_update_profile_image_validates_data_url(client: TestClient, admin_headers: dict[str, str]):
     valid_payload = {"image_data": "data:image/png;base64,AAA"}
-    res = client.put("/users/me/avatar", json=valid_payload, headers=_auth_headers(admin_token))
+    res = client.put("/users/me/avatar", json=valid_payload, headers=admin_headers)
     assert res.status_code == 200
     assert res.json()["profile_image"] == valid_payload["image_data"]
 
-    bad = client.put("/users/me/avatar", json={"image_data": "not-a-data-url"}, headers=_auth_headers(admin_token))
+    bad = client.put("/users/me/avatar", json={"image_data": "not-a-data-url"}, headers=admin_headers)
     assert bad.status_code == 400
 
-    cleared = client.put("/users/me/avatar", json={"image_data": None}, headers=_auth_headers(admin_token))
+    cleared = client.put("/users/me/avatar", json={"image_data": None}, headers=admin_headers)
     assert cleared.status_code == 200
     assert cleared.json()["profile_image"] is None
 
 
-def test_admin_can_create_user_with_temporary_password(client: TestClient, admin_token: str):
+def test_admin_can_create_user_with_temporary_password(client: TestClient, admin_headers: dict[str, str]):
     payload = {
         "email": "nuevo.profesor@academy.test",
         "full_name": "Profesor Demo",
@@ -55,7 +51,7 @@ def test_admin_can_create_user_with_temporary_password(client: TestClient, admin
         "password": "TempPass123!",
         "require_password_change": True,
     }
-    res = client.post("/users/", json=payload, headers=_auth_headers(admin_token))
+    res = client.post("/users/", json=payload, headers=admin_headers)
     assert res.status_code == 201, res.text
     data = res.json()
     assert data["email"] == payload["email"].lower()
@@ -64,7 +60,7 @@ def test_admin_can_create_user_with_temporary_password(client: TestClient, admin
     assert data["must_change_password"] is True
 
 
-def test_coordinator_cannot_create_users(client: TestClient, coordinator_token: str):
+def test_coordinator_cannot_create_users(client: TestClient, coordinator_headers: dict[str, str]):
     res = client.post(
         "/users/",
         json={
@@ -73,6 +69,6 @@ def test_coordinator_cannot_create_users(client: TestClient, coordinator_token:
             "role": "student",
             "password": "Temporal123",
         },
-        headers=_auth_headers(coordinator_token),
+        headers=coordinator_headers,
     )
     assert res.status_code == 403
@@ -17,6 +17,7 @@ export type StudentProgramEnrollmentSummary = {
   enrolled_at: string
   status: 'active' | 'completed' | 'withdrawn'
   program_semester: ProgramSemesterSummary
+  ended_at?: string | null
 }
 
 export type StudentSemesterSelectionResponse = {